@@ -0,0 +1,124 @@
+"""
+Run the benchmark suite, and optionally compare it to a baseline.
+
+Run with:
+
+    PYTHONPATH=src python -m benchmarks [--output FILE] [--baseline FILE]
+
+Results are written as JSON, with the best time for each benchmark in
+seconds. To check for regressions, save the results from the main branch and
+pass them as the baseline when running on another branch (on the same
+machine). The exit status is 1 if any benchmark is slower than its baseline
+by more than the threshold.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from collections.abc import Callable, Mapping, Sequence
+
+from benchmarks import suite
+
+# The default ratio of a result to its baseline that counts as a regression.
+_THRESHOLD = 1.25
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "-k",
+        dest="keyword",
+        default="",
+        help="only run benchmarks with this in their name",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="the number of times to time each benchmark (default: 3)",
+    )
+    parser.add_argument("--output", help="write the results to this file")
+    parser.add_argument(
+        "--baseline", help="compare the results to those in this file"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=_THRESHOLD,
+        help=(
+            "the ratio to the baseline that counts as a regression "
+            f"(default: {_THRESHOLD})"
+        ),
+    )
+    args = parser.parse_args(argv)
+
+    results: dict[str, float] = {}
+    thresholds: dict[str, float] = {}
+    for benchmark in suite.benchmarks():
+        if args.keyword not in benchmark.name:
+            continue
+        results[benchmark.name] = _time(benchmark.function, args.repeat)
+        thresholds[benchmark.name] = benchmark.threshold or args.threshold
+        print(f"{benchmark.name}: {results[benchmark.name] * 1e6:.1f} us")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(_report(results), file, indent=2, sort_keys=True)
+            file.write("\n")
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+        return _compare(results, baseline, thresholds)
+
+    return 0
+
+
+def _time(function: Callable[[], object], repeat: int) -> float:
+    """Get the best time for one call of a function, in seconds."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def _report(results: Mapping[str, float]) -> dict[str, object]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": dict(results),
+    }
+
+
+def _compare(
+    results: Mapping[str, float],
+    baseline: Mapping[str, float],
+    thresholds: Mapping[str, float],
+) -> int:
+    """Print how the results compare to the baseline.
+
+    Returns:
+        The exit status: 1 if there are any regressions, otherwise 0.
+    """
+    regressions = []
+    print()
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name}: not in baseline")
+            continue
+        ratio = result / baseline[name]
+        regressed = ratio > thresholds[name]
+        if regressed:
+            regressions.append(name)
+        print(f"{name}: {ratio:.2f}x baseline{' (REGRESSION)' * regressed}")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s)", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,472 @@
+"""
+The benchmarks run by `python -m benchmarks`.
+
+Each benchmark is a function that does a fixed amount of work, such as
+quantizing every moment in a day, so that results can be compared between
+runs. Benchmarks that depend on the timezone are run for several zones, on
+an ordinary day and on each day in 2024 when the zone's offset from UTC
+changes.
+"""
+
+import dataclasses
+import datetime
+import functools
+import itertools
+import zoneinfo
+from collections.abc import Callable, Iterator
+from typing import TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+from timezone_tools import (
+    Clock,
+    ClockPool,
+    ClockSnapshot,
+    TimezoneConverter,
+    closest_upcoming_match,
+    get_contiguous_periods,
+    get_payment_schedule,
+    group_by_local_date,
+    is_last_day_of_month,
+    iter_dates,
+    latest_date_for_day,
+    merge_intervals,
+)
+
+_ZONES = (
+    "Europe/Paris",
+    "America/Sao_Paulo",
+    "America/New_York",
+    "Australia/Lord_Howe",  # changes by 30 minutes
+    "Asia/Kolkata",  # no DST
+)
+_ORDINARY_DAY = datetime.date(2024, 7, 9)
+_RESOLUTIONS = (
+    datetime.timedelta(seconds=1),
+    datetime.timedelta(minutes=1),
+    datetime.timedelta(minutes=15),
+    datetime.timedelta(hours=1),
+    datetime.timedelta(days=1),
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class Benchmark:
+    name: str
+    function: Callable[[], object]
+
+    # How much slower than the baseline this can be before it is reported as
+    # a regression, if not the default.
+    threshold: float | None = None
+
+
+def benchmarks() -> Iterator[Benchmark]:
+    yield from _converter_benchmarks()
+    yield from _array_benchmarks()
+    yield from _instance_benchmarks()
+    yield from _dates_benchmarks()
+    yield from _intervals_benchmarks()
+    yield from _bulk_benchmarks()
+    yield from _clock_benchmarks()
+    yield from _pool_benchmarks()
+
+
+def _days(converter: TimezoneConverter) -> Iterator[datetime.date]:
+    """Get an ordinary day, and the days with transitions, in 2024."""
+    yield _ORDINARY_DAY
+    transitions = converter.transitions_between(
+        converter.datetime(2024, 1, 1), converter.datetime(2025, 1, 1)
+    )
+    for transition in transitions:
+        yield transition.when.date()
+
+
+def _moments(
+    converter: TimezoneConverter, day: datetime.date
+) -> list[datetime.datetime]:
+    """Get UTC moments every 7 minutes through a day in the timezone."""
+    start = converter.midnight(day).astimezone(datetime.timezone.utc)
+    end = converter.next_midnight(day)
+    moments = []
+    moment = start
+    while moment < end:
+        moments.append(moment)
+        moment += datetime.timedelta(minutes=7)
+    return moments
+
+
+def _moment_array(
+    converter: TimezoneConverter, day: datetime.date
+) -> "npt.NDArray[np.datetime64]":
+    """Get UTC moments every 7 seconds through a day in the timezone."""
+    start = int(converter.midnight(day).timestamp())
+    end = int(converter.next_midnight(day).timestamp())
+    return (
+        np.arange(start, end, 7)
+        .astype("datetime64[s]")
+        .astype("datetime64[ns]")
+    )
+
+
+def _converter_benchmarks() -> Iterator[Benchmark]:
+    for zone in _ZONES:
+        converter = TimezoneConverter(zone)
+        for day in _days(converter):
+            moments = _moments(converter, day)
+            moment_array = _moment_array(converter, day)
+            for resolution in _RESOLUTIONS:
+                yield Benchmark(
+                    f"quantize[{zone},{day},{resolution}]",
+                    functools.partial(
+                        _quantize_all, converter, moments, resolution
+                    ),
+                )
+                yield Benchmark(
+                    f"quantize_many[{zone},{day},{resolution}]",
+                    functools.partial(
+                        converter.quantize_many,
+                        moment_array,
+                        resolution,
+                        converter.ROUND_DOWN,
+                    ),
+                )
+            yield Benchmark(
+                f"localize[{zone},{day}]",
+                functools.partial(_localize_all, converter, moments),
+            )
+            yield Benchmark(
+                f"midnight[{zone},{day}]",
+                functools.partial(_midnight_all, converter, moments),
+            )
+        month_moments = [
+            converter.datetime(2024, month, 15, 12) for month in range(1, 13)
+        ]
+        yield Benchmark(
+            f"end_of_month[{zone}]",
+            functools.partial(_end_of_month_all, converter, month_moments),
+        )
+
+
+def _quantize_all(
+    converter: TimezoneConverter,
+    moments: list[datetime.datetime],
+    resolution: datetime.timedelta,
+) -> None:
+    for moment in moments:
+        converter.quantize(moment, resolution, converter.ROUND_DOWN)
+
+
+def _localize_all(
+    converter: TimezoneConverter, moments: list[datetime.datetime]
+) -> None:
+    for moment in moments:
+        converter.localize(moment)
+
+
+def _midnight_all(
+    converter: TimezoneConverter, moments: list[datetime.datetime]
+) -> None:
+    for moment in moments:
+        converter.midnight(moment)
+
+
+def _end_of_month_all(
+    converter: TimezoneConverter, moments: list[datetime.datetime]
+) -> None:
+    for moment in moments:
+        converter.end_of_month(moment)
+
+
+def _array_benchmarks() -> Iterator[Benchmark]:
+    # Moments every 7 minutes through 2024.
+    moments = np.arange(
+        np.datetime64("2024-01-01T00:00", "ns"),
+        np.datetime64("2025-01-01T00:00", "ns"),
+        np.timedelta64(7, "m"),
+    )
+    for zone in _ZONES:
+        converter = TimezoneConverter(zone)
+        yield Benchmark(
+            f"localize_many[{zone},year]",
+            functools.partial(converter.localize_many, moments),
+        )
+        yield Benchmark(
+            f"date_many[{zone},year]",
+            functools.partial(converter.date_many, moments),
+        )
+
+    # Transition tables are kept, so only the first call reads them.
+    converters = [
+        TimezoneConverter(timezone)
+        for timezone in sorted(zoneinfo.available_timezones())
+    ]
+    yield Benchmark(
+        "day_boundaries[all zones,50 years]",
+        functools.partial(_day_boundaries_each, converters),
+    )
+
+
+def _day_boundaries_each(converters: list[TimezoneConverter]) -> None:
+    for converter in converters:
+        converter.day_boundaries(
+            datetime.date(2000, 1, 1), datetime.date(2050, 1, 1)
+        )
+
+
+def _instance_benchmarks() -> Iterator[Benchmark]:
+    for cls in (TimezoneConverter, Clock):
+        name = cls.__name__
+        instance, other = cls("Europe/Paris"), cls("Europe/Paris")
+        yield Benchmark(
+            f"construct[{name}]",
+            functools.partial(
+                _call_repeatedly, functools.partial(cls, "Europe/Paris")
+            ),
+        )
+        yield Benchmark(
+            f"for_zone[{name}]",
+            functools.partial(
+                _call_repeatedly,
+                functools.partial(cls.for_zone, "Europe/Paris"),
+            ),
+        )
+        yield Benchmark(
+            f"hash[{name}]",
+            functools.partial(
+                _call_repeatedly, functools.partial(hash, instance)
+            ),
+        )
+        yield Benchmark(
+            f"equal[{name}]",
+            functools.partial(
+                _call_repeatedly, functools.partial(instance.__eq__, other)
+            ),
+        )
+
+
+def _dates_benchmarks() -> Iterator[Benchmark]:
+    start = datetime.date(2024, 1, 1)
+    year = list(iter_dates(start, datetime.date(2025, 1, 1)))
+
+    for days in (31, 366):
+        period = (start, start + datetime.timedelta(days=days - 1))
+        yield Benchmark(
+            f"latest_date_for_day[{days} days]",
+            functools.partial(_latest_date_for_every_day, period),
+        )
+
+    yield Benchmark(
+        "closest_upcoming_match[year]",
+        functools.partial(_closest_upcoming_match_every_day, year),
+    )
+    yield Benchmark(
+        "iter_dates[10 years]",
+        functools.partial(
+            _consume, iter_dates, start, datetime.date(2034, 1, 1)
+        ),
+    )
+
+    yield Benchmark(
+        "get_payment_schedule[10 years]",
+        functools.partial(
+            _payment_schedule_every_day, start, datetime.date(2034, 1, 1)
+        ),
+    )
+    yield Benchmark(
+        "is_last_day_of_month[year]",
+        functools.partial(_is_last_day_of_month_every_day, year),
+    )
+
+    # Ten years of dates, with every seventh and every 30th date missing.
+    dates = [
+        start + datetime.timedelta(days=day)
+        for day in range(3653)
+        if day % 7 and day % 30
+    ]
+    yield Benchmark(
+        "get_contiguous_periods[10 years]",
+        functools.partial(get_contiguous_periods, dates),
+    )
+    yield Benchmark(
+        "get_contiguous_periods[10 years, reversed]",
+        functools.partial(get_contiguous_periods, dates[::-1]),
+    )
+
+
+def _latest_date_for_every_day(
+    period: tuple[datetime.date, datetime.date],
+) -> None:
+    for day_of_month in range(1, 32):
+        latest_date_for_day(period, day_of_month)
+
+
+def _closest_upcoming_match_every_day(dates: list[datetime.date]) -> None:
+    for date, day_of_month in zip(
+        dates, itertools.cycle(range(1, 32)), strict=False
+    ):
+        closest_upcoming_match(day_of_month, date)
+
+
+def _payment_schedule_every_day(
+    after_date: datetime.date, until_date: datetime.date
+) -> None:
+    for day_of_month in range(1, 32):
+        get_payment_schedule(day_of_month, after_date, until_date)
+
+
+def _is_last_day_of_month_every_day(dates: list[datetime.date]) -> None:
+    for date in dates:
+        is_last_day_of_month(date)
+
+
+def _consume(
+    function: Callable[[datetime.date, datetime.date], Iterator[object]],
+    start: datetime.date,
+    stop: datetime.date,
+) -> None:
+    for _ in function(start, stop):
+        pass
+
+
+def _intervals_benchmarks() -> Iterator[Benchmark]:
+    # Ten thousand overlapping intervals of up to two hours, out of order.
+    converter = TimezoneConverter("Europe/Paris")
+    start = converter.datetime(2024, 1, 1)
+    intervals = [
+        (
+            start + datetime.timedelta(minutes=(index * 7919) % 525600),
+            start
+            + datetime.timedelta(
+                minutes=(index * 7919) % 525600 + index % 120 + 1
+            ),
+        )
+        for index in range(10_000)
+    ]
+    yield Benchmark(
+        "merge_intervals[10000]",
+        functools.partial(merge_intervals, intervals),
+    )
+    for at in (converter.DAYS, converter.MONTHS):
+        yield Benchmark(
+            f"split_intervals[10000,{at}]",
+            functools.partial(converter.split_intervals, intervals, at),
+        )
+
+
+def _bulk_benchmarks() -> Iterator[Benchmark]:
+    # Moments every 7 minutes through 2024, spread between the zones. These
+    # are grouped in this process, which shows the work done by each worker
+    # when there is a pool.
+    start = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    records = [
+        (
+            _ZONES[index % len(_ZONES)],
+            start + datetime.timedelta(minutes=7 * index),
+        )
+        for index in range(75_000)
+    ]
+    yield Benchmark(
+        "group_by_local_date[datetimes]",
+        functools.partial(_group_all, records),
+    )
+    nanoseconds = [
+        (zone, int(moment.timestamp()) * 1_000_000_000)
+        for zone, moment in records
+    ]
+    yield Benchmark(
+        "group_by_local_date[nanoseconds]",
+        functools.partial(_group_all, nanoseconds),
+    )
+
+
+_Moment = TypeVar("_Moment", datetime.datetime, int)
+
+
+def _group_all(records: list[tuple[str, _Moment]]) -> None:
+    for _ in group_by_local_date(records):
+        pass
+
+
+def _clock_benchmarks() -> Iterator[Benchmark]:
+    for zone in _ZONES:
+        yield Benchmark(
+            f"now[{zone}]",
+            functools.partial(_call_repeatedly, Clock(zone).now),
+        )
+        for cache_today in (False, True):
+            clock = Clock(zone, cache_today=cache_today)
+            yield Benchmark(
+                f"today[{zone},{'cached' if cache_today else 'uncached'}]",
+                functools.partial(_call_repeatedly, clock.today),
+            )
+        yield Benchmark(
+            f"request[{zone}]", functools.partial(_request, Clock(zone))
+        )
+        yield Benchmark(
+            f"request[{zone},snapshot]",
+            functools.partial(_request_with_snapshot, Clock(zone)),
+        )
+        yield Benchmark(
+            f"is_in_the_past[{zone},1000]",
+            functools.partial(_is_in_the_past_each, Clock(zone)),
+        )
+        yield Benchmark(
+            f"is_in_the_past_many[{zone},1000]",
+            functools.partial(
+                Clock(zone).is_in_the_past_many, _PAST_CANDIDATES
+            ),
+        )
+
+
+def _pool_benchmarks() -> Iterator[Benchmark]:
+    timezones = sorted(zoneinfo.available_timezones())[:400]
+    clocks = [Clock(timezone) for timezone in timezones]
+    yield Benchmark(
+        f"today[{len(timezones)} zones,clocks]",
+        functools.partial(
+            _call_repeatedly, functools.partial(_today_each, clocks)
+        ),
+    )
+    yield Benchmark(
+        f"today[{len(timezones)} zones,pool]",
+        functools.partial(_call_repeatedly, ClockPool(timezones).today),
+    )
+
+
+def _today_each(clocks: list[Clock]) -> dict[str | None, datetime.date]:
+    return {clock.tzinfo.key: clock.today() for clock in clocks}
+
+
+def _request(clock: Clock | ClockSnapshot) -> None:
+    """Ask a clock the kind of questions a request handler might."""
+    for _ in range(10):
+        clock.now()
+        clock.today()
+        clock.months_in_the_future(1)
+        clock.is_in_the_past(_ORDINARY_DAY)
+
+
+def _request_with_snapshot(clock: Clock) -> None:
+    _request(clock.snapshot())
+
+
+# A mix of moments and dates, a few hours apart.
+_PAST_CANDIDATES = tuple(
+    moment.date() if index % 2 else moment
+    for index, moment in enumerate(
+        datetime.datetime(2024, 7, 9, tzinfo=datetime.timezone.utc)
+        + datetime.timedelta(hours=5 * index)
+        for index in range(1000)
+    )
+)
+
+
+def _is_in_the_past_each(clock: Clock) -> None:
+    for candidate in _PAST_CANDIDATES:
+        clock.is_in_the_past(candidate)
+
+
+def _call_repeatedly(function: Callable[[], object]) -> None:
+    for _ in range(100):
+        function()
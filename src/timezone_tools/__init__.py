@@ -2,24 +2,56 @@
 Tools for working with timezone-aware datetimes.
 """
 
-from ._clock import Clock
+from ._bulk import group_by_local_date
+from ._clock import Clock, ClockPool, ClockSnapshot
 from ._converter import TimezoneConverter
+from ._date_set import DateSet
 from ._dates import (
     DateNotFound,
+    DateRange,
     closest_upcoming_match,
+    closest_upcoming_matches,
     get_contiguous_periods,
+    get_contiguous_periods_many,
+    get_payment_schedule,
     is_last_day_of_month,
+    is_last_day_of_month_many,
+    iter_contiguous_periods,
     iter_dates,
+    iter_payment_schedule,
     latest_date_for_day,
+    latest_dates_for_days,
+    periods_from_arrays,
 )
+from ._intervals import find_gaps, merge_intervals
+from ._midnight import MidnightNotifier, Subscription
+from ._transitions import Transition
 
 __all__ = (
     "Clock",
+    "ClockPool",
+    "ClockSnapshot",
     "DateNotFound",
+    "DateRange",
+    "DateSet",
+    "MidnightNotifier",
+    "Subscription",
     "TimezoneConverter",
+    "Transition",
     "closest_upcoming_match",
+    "closest_upcoming_matches",
+    "find_gaps",
     "get_contiguous_periods",
+    "get_contiguous_periods_many",
+    "get_payment_schedule",
+    "group_by_local_date",
     "is_last_day_of_month",
+    "is_last_day_of_month_many",
+    "iter_contiguous_periods",
     "iter_dates",
+    "iter_payment_schedule",
     "latest_date_for_day",
+    "latest_dates_for_days",
+    "merge_intervals",
+    "periods_from_arrays",
 )
@@ -0,0 +1,121 @@
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+# Note [Arrays of moments in time]
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Functions that work on many moments in time at once accept NumPy arrays of
+# either `datetime64` values or integer nanoseconds since the Unix epoch, both
+# in UTC. Internally, everything is done in integer nanoseconds, and results
+# are returned in the same form as the input. NaT (not-a-time) values are
+# passed through unchanged.
+#
+# NumPy is an optional dependency, so it is only imported when these functions
+# are called.
+
+NANOSECONDS_PER_SECOND = 1_000_000_000
+NANOSECONDS_PER_DAY = 86400 * NANOSECONDS_PER_SECOND
+
+Moments = TypeVar(
+    "Moments", "npt.NDArray[np.datetime64]", "npt.NDArray[np.int64]"
+)
+
+
+def to_nanoseconds(
+    moments: "npt.NDArray[np.datetime64] | npt.NDArray[np.int64]",
+) -> tuple["npt.NDArray[np.int64]", "npt.NDArray[np.bool_]"]:
+    """Get the nanoseconds since the epoch for an array of moments in time.
+
+    Returns:
+        The nanoseconds since the epoch, and a mask of the NaT values (which
+        are set to zero).
+
+    Raises:
+        TypeError: The array does not contain datetime64 or integer values.
+    """
+    import numpy as np
+
+    array = np.asarray(moments)
+    if np.issubdtype(array.dtype, np.datetime64):
+        not_a_time = np.isnat(array)
+        nanoseconds = array.astype("datetime64[ns]").view(np.int64).copy()
+    elif np.issubdtype(array.dtype, np.integer):
+        not_a_time = np.zeros(array.shape, dtype=np.bool_)
+        nanoseconds = array.astype(np.int64)
+    else:
+        raise TypeError(
+            f"expected an array of datetime64 or integers, not {array.dtype}"
+        )
+
+    nanoseconds[not_a_time] = 0
+    return nanoseconds, not_a_time
+
+
+def from_nanoseconds(
+    nanoseconds: "npt.NDArray[np.int64]",
+    not_a_time: "npt.NDArray[np.bool_]",
+    like: Moments,
+) -> Moments:
+    """Convert nanoseconds since the epoch back to the form of the input."""
+    import numpy as np
+
+    if np.issubdtype(np.asarray(like).dtype, np.datetime64):
+        result = nanoseconds.view("datetime64[ns]")
+        result[not_a_time] = np.datetime64("NaT")
+        return result
+    else:
+        return nanoseconds  # type: ignore[return-value]
+
+
+# Note [Arrays of dates]
+# ~~~~~~~~~~~~~~~~~~~~~~
+# Functions that work on many dates at once accept NumPy arrays of either
+# `datetime64` values (which are converted to days) or integer ordinals, as
+# returned by `date.toordinal`. Internally, everything is done in integer
+# ordinals, and results are returned in the same form as the input.
+
+# The ordinal of 1970-01-01, which is day zero for `datetime64[D]`.
+EPOCH_ORDINAL = 719163
+
+Dates = TypeVar("Dates", "npt.NDArray[np.datetime64]", "npt.NDArray[np.int64]")
+
+
+def to_ordinals(
+    dates: "npt.NDArray[np.datetime64] | npt.NDArray[np.int64]",
+) -> tuple["npt.NDArray[np.int64]", "npt.NDArray[np.bool_]"]:
+    """Get the ordinals of an array of dates.
+
+    Returns:
+        The ordinals, and a mask of the NaT values (which are set to zero).
+
+    Raises:
+        TypeError: The array does not contain datetime64 or integer values.
+    """
+    import numpy as np
+
+    array = np.asarray(dates)
+    if np.issubdtype(array.dtype, np.datetime64):
+        not_a_date = np.isnat(array)
+        ordinals = array.astype("datetime64[D]").view(np.int64) + EPOCH_ORDINAL
+    elif np.issubdtype(array.dtype, np.integer):
+        not_a_date = np.zeros(array.shape, dtype=np.bool_)
+        ordinals = array.astype(np.int64)
+    else:
+        raise TypeError(
+            f"expected an array of datetime64 or integers, not {array.dtype}"
+        )
+
+    ordinals[not_a_date] = 0
+    return ordinals, not_a_date
+
+
+def from_ordinals(ordinals: "npt.NDArray[np.int64]", like: Dates) -> Dates:
+    """Convert ordinals back to the form of the input."""
+    import numpy as np
+
+    if np.issubdtype(np.asarray(like).dtype, np.datetime64):
+        return (ordinals - EPOCH_ORDINAL).view("datetime64[D]")
+    else:
+        return ordinals  # type: ignore[return-value]
@@ -0,0 +1,172 @@
+import array
+import collections
+import concurrent.futures
+import datetime
+import os
+from collections.abc import Callable, Iterable, Iterator
+from typing import TypeVar
+
+from . import _arrays, _converter, _transitions
+
+# Note [Grouping in bulk]
+# ~~~~~~~~~~~~~~~~~~~~~~~
+# `group_by_local_date` sorts records of `(zone, moment)` into zones in this
+# process, and sends chunks of each zone's moments to an executor (usually a
+# `ProcessPoolExecutor`) to find their local dates. Moments are sent as an
+# array of whole seconds since the Unix epoch, which is far cheaper to pickle
+# than datetimes. (Offsets from UTC are whole seconds, so the fraction of a
+# second never changes the date.) Each worker finds the dates from the
+# timezone's transition table, which is built once per zone in each worker
+# process and then reused for every chunk, and sends back the positions in
+# the chunk of the moments on each date. This process then groups the
+# original values by those positions.
+#
+# Converting datetimes to seconds happens in this process, so it limits how
+# much a pool can help. Moments given as integer nanoseconds since the epoch
+# (see Note [Arrays of moments in time]) avoid that cost.
+
+Moment = TypeVar("Moment", datetime.datetime, int)
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_SECOND = datetime.timedelta(seconds=1)
+_SECONDS_PER_DAY = 86400
+
+
+def group_by_local_date(
+    records: Iterable[tuple[str, Moment]],
+    executor: concurrent.futures.Executor | None = None,
+    *,
+    chunk_size: int = 50_000,
+) -> Iterator[tuple[str, datetime.date, list[Moment]]]:
+    """Group moments in time in many timezones by their local dates, in bulk.
+
+    Each record is the name of a timezone and a moment in time, either as a
+    timezone-aware datetime or as integer nanoseconds since the Unix epoch.
+    The local date of each moment is the same as `TimezoneConverter.date`
+    gives for it.
+
+    The moments for each timezone are grouped in chunks of `chunk_size`,
+    which are sent to `executor` if it is given (for example, a
+    `ProcessPoolExecutor`), or otherwise grouped in this process. Results are
+    yielded as each chunk is finished, so only a limited number of chunks are
+    held in memory at once. See Note [Grouping in bulk].
+
+    Yields:
+        The timezone, a date, and the moments on that date in that timezone,
+        in the order they were given. The moments for the same timezone and
+        date may be split between more than one result (at most one for each
+        chunk).
+
+    Raises:
+        TimezoneConverter.NaiveDatetime: A datetime is naive.
+        ValueError: The chunk size is not positive.
+        zoneinfo.ZoneInfoNotFoundError: A timezone is not known. This is
+            raised by the executor when the chunk's results are collected.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, not {chunk_size}")
+
+    submit: Callable[
+        ..., concurrent.futures.Future[dict[int, array.array[int]]]
+    ]
+    submit = executor.submit if executor else _submit_here
+
+    # Bound the number of chunks waiting for results, so that the records are
+    # read no faster than they can be grouped.
+    max_pending = 2 * (os.cpu_count() or 1)
+    pending: collections.deque[
+        tuple[
+            str,
+            list[Moment],
+            concurrent.futures.Future[dict[int, array.array[int]]],
+        ]
+    ] = collections.deque()
+
+    # The moments for each timezone which have not yet been sent, and their
+    # POSIX timestamps.
+    chunks: dict[str, tuple[list[Moment], array.array[int]]] = {}
+
+    def send(zone: str) -> Iterator[tuple[str, datetime.date, list[Moment]]]:
+        moments, timestamps = chunks.pop(zone)
+        pending.append((zone, moments, submit(_group_chunk, zone, timestamps)))
+        while len(pending) > max_pending:
+            yield from _collect(*pending.popleft())
+
+    for zone, moment in records:
+        if zone not in chunks:
+            chunks[zone] = ([], array.array("q"))
+        moments, timestamps = chunks[zone]
+        moments.append(moment)
+        timestamps.append(_timestamp(moment))
+        if len(moments) >= chunk_size:
+            yield from send(zone)
+
+    for zone in list(chunks):
+        yield from send(zone)
+    while pending:
+        yield from _collect(*pending.popleft())
+
+
+def _timestamp(moment: datetime.datetime | int) -> int:
+    """Get the whole seconds since the Unix epoch of a moment in time."""
+    if isinstance(moment, int):
+        return moment // _arrays.NANOSECONDS_PER_SECOND
+    if not moment.tzinfo:
+        raise _converter.TimezoneConverter.NaiveDatetime
+    return (moment - _EPOCH) // _SECOND
+
+
+def _group_chunk(
+    zone: str, timestamps: "array.array[int]"
+) -> dict[int, "array.array[int]"]:
+    """Find the positions of the moments on each local date in a timezone.
+
+    This runs in a worker process, so it only gets and returns compact values
+    which are cheap to pickle. See Note [Grouping in bulk].
+
+    Returns:
+        The positions of the timestamps for each local date, keyed by the
+        number of days between the Unix epoch and the date.
+    """
+    # This is shared by every chunk for the timezone in this process.
+    # See Note [Shared instances].
+    converter = _converter.TimezoneConverter.for_zone(zone)
+    utcoffset = _transitions.get_transition_table(converter.tzinfo).utcoffset
+
+    groups: dict[int, array.array[int]] = {}
+    for position, timestamp in enumerate(timestamps):
+        day = (timestamp + utcoffset(timestamp)) // _SECONDS_PER_DAY
+        if day not in groups:
+            groups[day] = array.array("q")
+        groups[day].append(position)
+    return groups
+
+
+def _submit_here(
+    function: Callable[
+        [str, "array.array[int]"], dict[int, "array.array[int]"]
+    ],
+    zone: str,
+    timestamps: "array.array[int]",
+) -> concurrent.futures.Future[dict[int, "array.array[int]"]]:
+    """Run a function in this process, in place of an executor."""
+    future: concurrent.futures.Future[dict[int, array.array[int]]]
+    future = concurrent.futures.Future()
+    try:
+        future.set_result(function(zone, timestamps))
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
+
+
+def _collect(
+    zone: str,
+    moments: list[Moment],
+    future: concurrent.futures.Future[dict[int, "array.array[int]"]],
+) -> Iterator[tuple[str, datetime.date, list[Moment]]]:
+    for day, positions in future.result().items():
+        yield (
+            zone,
+            datetime.date.fromordinal(day + _arrays.EPOCH_ORDINAL),
+            [moments[position] for position in positions],
+        )
@@ -1,26 +1,36 @@
+import abc
 import dataclasses
 import datetime
+import functools
+import math
+import time
 import zoneinfo
+from collections.abc import Callable, Iterable, Sequence
+from typing import TYPE_CHECKING, overload
 
 from dateutil import relativedelta
+from typing_extensions import Self
 
+from . import _arrays, _shared, _today_cache
 
-@dataclasses.dataclass(frozen=True, init=False)
-class Clock:
-    """Get the current date/time in a specific timezone."""
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
 
-    tzinfo: zoneinfo.ZoneInfo
 
-    def __init__(self, timezone: str) -> None:
-        object.__setattr__(self, "tzinfo", zoneinfo.ZoneInfo(timezone))
+class _RelativeDates(abc.ABC):
+    """Dates and times relative to the current date/time.
 
-    # Current time/date
+    Subclasses say what the current date/time is.
+    """
 
-    def now(self) -> datetime.datetime:
-        return datetime.datetime.now(tz=self.tzinfo)
+    __slots__ = ()
 
-    def today(self) -> datetime.date:
-        return self.now().date()
+    @abc.abstractmethod
+    def now(self) -> datetime.datetime: ...
+
+    @abc.abstractmethod
+    def today(self) -> datetime.date: ...
 
     # Relative times/dates
 
@@ -71,3 +81,319 @@ class Clock:
             return self.now() < candidate
         else:
             return self.today() < candidate
+
+    @overload
+    def is_in_the_past_many(
+        self, candidates: Sequence[datetime.datetime | datetime.date]
+    ) -> tuple[bool, ...]: ...
+
+    @overload
+    def is_in_the_past_many(
+        self,
+        candidates: "npt.NDArray[np.datetime64] | npt.NDArray[np.int64]",
+    ) -> "npt.NDArray[np.bool_]": ...
+
+    def is_in_the_past_many(
+        self,
+        candidates: "Sequence[datetime.datetime | datetime.date] | "
+        "npt.NDArray[np.datetime64] | npt.NDArray[np.int64]",
+    ) -> "tuple[bool, ...] | npt.NDArray[np.bool_]":
+        """Check whether each of many dates/times is in the past.
+
+        Each result is the same as `is_in_the_past`, but the current date/time
+        is only read once.
+
+        The candidates may be a sequence of dates and datetimes, in any mix,
+        and the results are a tuple. Alternatively, they may be a NumPy array,
+        and the results are a boolean array: `datetime64[D]` values are dates,
+        while other `datetime64` values and integer nanoseconds since the Unix
+        epoch are moments in time (see Note [Arrays of moments in time]). NaT
+        values are never in the past or the future. Arrays require NumPy
+        (install `timezone_tools[numpy]`).
+
+        Raises:
+            TypeError: The array does not contain datetime64 or integer
+                values.
+        """
+        return _compare_many(self.now(), candidates, past=True)
+
+    @overload
+    def is_in_the_future_many(
+        self, candidates: Sequence[datetime.datetime | datetime.date]
+    ) -> tuple[bool, ...]: ...
+
+    @overload
+    def is_in_the_future_many(
+        self,
+        candidates: "npt.NDArray[np.datetime64] | npt.NDArray[np.int64]",
+    ) -> "npt.NDArray[np.bool_]": ...
+
+    def is_in_the_future_many(
+        self,
+        candidates: "Sequence[datetime.datetime | datetime.date] | "
+        "npt.NDArray[np.datetime64] | npt.NDArray[np.int64]",
+    ) -> "tuple[bool, ...] | npt.NDArray[np.bool_]":
+        """Check whether each of many dates/times is in the future.
+
+        Each result is the same as `is_in_the_future`, but the current
+        date/time is only read once.
+
+        The candidates may be a sequence of dates and datetimes, in any mix,
+        and the results are a tuple. Alternatively, they may be a NumPy array,
+        and the results are a boolean array: `datetime64[D]` values are dates,
+        while other `datetime64` values and integer nanoseconds since the Unix
+        epoch are moments in time (see Note [Arrays of moments in time]). NaT
+        values are never in the past or the future. Arrays require NumPy
+        (install `timezone_tools[numpy]`).
+
+        Raises:
+            TypeError: The array does not contain datetime64 or integer
+                values.
+        """
+        return _compare_many(self.now(), candidates, past=False)
+
+
+def _compare_many(
+    now: datetime.datetime,
+    candidates: "Sequence[datetime.datetime | datetime.date] | "
+    "npt.NDArray[np.datetime64] | npt.NDArray[np.int64]",
+    *,
+    past: bool,
+) -> "tuple[bool, ...] | npt.NDArray[np.bool_]":
+    """Check whether each candidate is before (or after) a moment.
+
+    Datetimes are compared with the moment, and dates with its date.
+    """
+    today = now.date()
+    if isinstance(candidates, Sequence):
+        if past:
+            return tuple(
+                candidate < now
+                if isinstance(candidate, datetime.datetime)
+                else candidate < today
+                for candidate in candidates
+            )
+        return tuple(
+            now < candidate
+            if isinstance(candidate, datetime.datetime)
+            else today < candidate
+            for candidate in candidates
+        )
+
+    import numpy as np
+
+    array = np.asarray(candidates)
+    if array.dtype == np.dtype("datetime64[D]"):
+        # compare dates with today
+        values = array.view(np.int64)
+        not_a_date = np.isnat(array)
+        current = today.toordinal() - _arrays.EPOCH_ORDINAL
+    else:
+        # See Note [Arrays of moments in time]
+        values, not_a_date = _arrays.to_nanoseconds(candidates)
+        current = _nanoseconds(now)
+
+    results: npt.NDArray[np.bool_]
+    results = values < current if past else current < values
+    results &= ~not_a_date
+    return results
+
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _nanoseconds(moment: datetime.datetime) -> int:
+    """Get the nanoseconds since the Unix epoch of a moment in time."""
+    return (moment - _EPOCH) // datetime.timedelta(microseconds=1) * 1000
+
+
+@dataclasses.dataclass(frozen=True, init=False, slots=True)
+class Clock(_RelativeDates):
+    """Get the current date/time in a specific timezone."""
+
+    tzinfo: zoneinfo.ZoneInfo
+
+    # See Note [Caching today's date]
+    cache_today: bool
+    _today: _today_cache.TodayCache | None = dataclasses.field(
+        repr=False, compare=False
+    )
+
+    # See Note [Shared instances]
+    _hash: int = dataclasses.field(repr=False, compare=False)
+
+    def __init__(self, timezone: str, *, cache_today: bool = False) -> None:
+        """Create a clock for a timezone.
+
+        If `cache_today` is true, `today` (and the methods that use it) keep
+        today's date until the next local midnight, rather than converting
+        the current time each time. See Note [Caching today's date].
+        """
+        tzinfo = zoneinfo.ZoneInfo(timezone)
+        object.__setattr__(self, "tzinfo", tzinfo)
+        object.__setattr__(self, "cache_today", cache_today)
+        object.__setattr__(
+            self,
+            "_today",
+            _today_cache.get_today_cache(tzinfo) if cache_today else None,
+        )
+        object.__setattr__(self, "_hash", hash(tzinfo))
+
+    @classmethod
+    def for_zone(cls, timezone: str) -> Self:
+        """Get the shared clock for a timezone.
+
+        This returns the same instance every time it is called with the same
+        timezone, which is much cheaper than creating a new clock.
+        See Note [Shared instances].
+        """
+        return _shared.get(cls, timezone)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> tuple[Callable[[str], Self], tuple[str]]:
+        # Instances are created from a timezone name, so always have a key.
+        assert self.tzinfo.key is not None
+        if self.cache_today:
+            return (
+                functools.partial(type(self), cache_today=True),
+                (self.tzinfo.key,),
+            )
+        return type(self), (self.tzinfo.key,)
+
+    # Current time/date
+
+    def now(self) -> datetime.datetime:
+        return datetime.datetime.now(tz=self.tzinfo)
+
+    def today(self) -> datetime.date:
+        if self._today is not None:
+            # See Note [Caching today's date]
+            return self._today.today()
+        return self.now().date()
+
+    def snapshot(self) -> "ClockSnapshot":
+        """Get the current date/time once, to answer many questions about it.
+
+        The snapshot has the same methods as the clock, which all use the
+        date/time when the snapshot was taken. This means the answers agree
+        with each other (even if they are asked for around midnight), and the
+        system clock is only read once.
+        """
+        return ClockSnapshot(self.now())
+
+
+class ClockSnapshot(_RelativeDates):
+    """The date/time in a timezone at a single moment.
+
+    Use `Clock.snapshot` to get the current date/time, for example once for
+    each request. Results from `months_in_the_past` and `months_in_the_future`
+    are kept, because they are comparatively slow to calculate.
+    """
+
+    __slots__ = ("_months", "_now", "_today")
+
+    def __init__(self, now: datetime.datetime) -> None:
+        self._now = now
+        self._today = now.date()
+        self._months: dict[int, datetime.date] = {}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._now!r})"
+
+    def now(self) -> datetime.datetime:
+        return self._now
+
+    def today(self) -> datetime.date:
+        return self._today
+
+    def months_in_the_past(self, months: int) -> datetime.date:
+        """Get the date some number of months ago.
+
+        If the target month does not have enough days, the closest day will be
+        returned (e.g. 3 months before July 31st is April 30th, not April
+        31st).
+        """
+        return self._months_from_today(-months)
+
+    def months_in_the_future(self, months: int) -> datetime.date:
+        """Get the date some number of months in the future.
+
+        If the target month does not have enough days, the closest day will be
+        returned (e.g. 4 months after July 31st is November 30th, not November
+        31st).
+        """
+        return self._months_from_today(months)
+
+    def _months_from_today(self, months: int) -> datetime.date:
+        try:
+            return self._months[months]
+        except KeyError:
+            date = self._today + relativedelta.relativedelta(months=months)
+            return self._months.setdefault(months, date)
+
+
+class ClockPool:
+    """Get the current date/time in many timezones at once.
+
+    Each method reads the system clock once, and gives the results for every
+    timezone in the pool at that moment, keyed by the name of the timezone.
+    """
+
+    __slots__ = ("_caches", "_state", "_tzinfos")
+
+    def __init__(self, timezones: Iterable[str]) -> None:
+        """Create a pool of clocks for some timezones.
+
+        Raises:
+            zoneinfo.ZoneInfoNotFoundError: A timezone does not exist.
+        """
+        self._tzinfos = {
+            timezone: zoneinfo.ZoneInfo(timezone) for timezone in timezones
+        }
+        self._caches = tuple(
+            (timezone, _today_cache.get_today_cache(tzinfo))
+            for timezone, tzinfo in self._tzinfos.items()
+        )
+        self._state: tuple[float, float, dict[str, datetime.date]] | None = (
+            None
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.timezones!r})"
+
+    @property
+    def timezones(self) -> tuple[str, ...]:
+        """The names of the timezones in the pool, in the order given."""
+        return tuple(self._tzinfos)
+
+    def now(self) -> dict[str, datetime.datetime]:
+        """Get the current date/time in every timezone."""
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        return {
+            timezone: now.astimezone(tzinfo)
+            for timezone, tzinfo in self._tzinfos.items()
+        }
+
+    def today(self) -> dict[str, datetime.date]:
+        """Get the current date in every timezone.
+
+        The dates are kept until the next local midnight (or change in UTC
+        offset) in any of the timezones, so most calls only need to read the
+        system clock and copy them. See Note [Caching today's date].
+        """
+        now = time.time()
+        state = self._state
+        if state is not None:
+            valid_from, valid_until, dates = state
+            if valid_from <= now < valid_until:
+                return dict(dates)
+
+        valid_from, valid_until, dates = -math.inf, math.inf, {}
+        for timezone, cache in self._caches:
+            zone_from, zone_until, dates[timezone] = cache.at(now)
+            valid_from = max(valid_from, zone_from)
+            valid_until = min(valid_until, zone_until)
+        self._state = (valid_from, valid_until, dates)
+        return dict(dates)
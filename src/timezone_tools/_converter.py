@@ -1,20 +1,80 @@
 import dataclasses
 import datetime as datetime_
 import zoneinfo
-from typing import Literal
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, ClassVar, Literal
 
 from dateutil import relativedelta
-from typing_extensions import assert_never
-
-
-@dataclasses.dataclass(frozen=True, init=False)
+from typing_extensions import Self, assert_never
+
+from . import _arrays, _day_cache, _intervals, _shared, _transitions
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+# Note [Quantizing]
+# ~~~~~~~~~~~~~~~~~
+# `quantize` rounds to the candidates `midnight + k * resolution` (for whole
+# k), where `midnight` is the start of the local day and the addition is in
+# wall-clock time. The round-up candidate is the first one after midnight
+# (k >= 1) that is not before the datetime, and the round-down candidate is
+# the one before it.
+#
+# When the datetime is in this timezone, candidates compare with it by wall
+# time, so the number of steps is the wall time since midnight divided by the
+# resolution, rounded up.
+#
+# Otherwise, candidates compare with it as moments in time. A candidate at a
+# wall time `w` with an offset `o` from UTC is the moment `w - o`, so while the
+# offset is the same the candidate is not before the datetime once `w` is at
+# least the datetime's elapsed time since midnight plus the change in offset
+# since midnight. Offsets change at wall times through the day (resolved with
+# fold=0, as `datetime` does for the candidates), which split it into a few
+# segments with a fixed offset. The first candidate in each segment which is
+# not before the datetime can be worked out directly, and the round-up
+# candidate is the earliest of those. This takes a fixed amount of work, and
+# gives the same answer as trying each candidate in turn, even where that
+# order is not monotonic: the wall times skipped by a DST change are the same
+# moments as the ones an hour later.
+#
+# `quantize_many` starts every value from its wall time since midnight, which
+# is right for the values whose offset is the same as at midnight, and which
+# have no change in offset before their round-up candidate. Only the rest
+# (values on the few days with a change) go through the segments, together.
+
+
+@dataclasses.dataclass(frozen=True, init=False, slots=True)
 class TimezoneConverter:
     """Manage dates and datetimes in a specific timezone."""
 
     tzinfo: zoneinfo.ZoneInfo
 
+    # See Note [Shared instances]
+    _hash: int = dataclasses.field(repr=False, compare=False)
+
     def __init__(self, timezone: str) -> None:
-        object.__setattr__(self, "tzinfo", zoneinfo.ZoneInfo(timezone))
+        tzinfo = zoneinfo.ZoneInfo(timezone)
+        object.__setattr__(self, "tzinfo", tzinfo)
+        object.__setattr__(self, "_hash", hash(tzinfo))
+
+    @classmethod
+    def for_zone(cls, timezone: str) -> Self:
+        """Get the shared converter for a timezone.
+
+        This returns the same instance every time it is called with the same
+        timezone, which is much cheaper than creating a new converter.
+        See Note [Shared instances].
+        """
+        return _shared.get(cls, timezone)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> tuple[type[Self], tuple[str]]:
+        # Instances are created from a timezone name, so always have a key.
+        assert self.tzinfo.key is not None
+        return type(self), (self.tzinfo.key,)
 
     # Constructors
 
@@ -107,10 +167,93 @@ class TimezoneConverter:
         """
         return self.localize(datetime).date()
 
+    def localize_many(self, values: _arrays.Moments) -> _arrays.Moments:
+        """Localize an array of moments in time to this timezone.
+
+        The values must be a NumPy array of UTC `datetime64` values or integer
+        nanoseconds since the Unix epoch. The results are the local times in
+        this timezone, in the same form, without timezone information: each
+        is the same as `localize(value).replace(tzinfo=None)`, but this is much
+        faster for large arrays.
+
+        This requires NumPy (install `timezone_tools[numpy]`).
+
+        Raises:
+            TypeError: The array does not contain datetime64 or integer
+                values.
+        """
+        # See Note [Arrays of moments in time]
+        moments, not_a_time = _arrays.to_nanoseconds(values)
+        table = _transitions.get_transition_table(self.tzinfo)
+        return _arrays.from_nanoseconds(
+            table.to_local(moments), not_a_time, like=values
+        )
+
+    def date_many(
+        self, values: _arrays.Moments
+    ) -> "npt.NDArray[np.datetime64]":
+        """Get the dates in this timezone for an array of moments in time.
+
+        The values must be a NumPy array of UTC `datetime64` values or integer
+        nanoseconds since the Unix epoch. The results are `datetime64[D]`
+        values: each is the same as `date(value)`, but this is much faster for
+        large arrays.
+
+        This requires NumPy (install `timezone_tools[numpy]`).
+
+        Raises:
+            TypeError: The array does not contain datetime64 or integer
+                values.
+        """
+        import numpy as np
+
+        # See Note [Arrays of moments in time]
+        moments, not_a_time = _arrays.to_nanoseconds(values)
+        table = _transitions.get_transition_table(self.tzinfo)
+        local_days = table.to_local(moments) // _arrays.NANOSECONDS_PER_DAY
+        dates = local_days.view("datetime64[D]")
+        dates[not_a_time] = np.datetime64("NaT")
+        return dates
+
+    # Transitions
+
+    def transitions_between(
+        self, start: datetime_.datetime, end: datetime_.datetime
+    ) -> tuple[_transitions.Transition, ...]:
+        """Find the changes in offset from UTC in this timezone in a period.
+
+        Transitions at the start of the period are included; transitions at
+        the end are not. The period must have the datetimes in order: the
+        start must not be after the end.
+
+        Raises:
+            NaiveDatetime: A datetime is naive, so we do not know which
+                timezone to localize from. Use `make_aware` to make a naive
+                datetime timezone-aware.
+            ValueError: The period is not valid.
+        """
+        if not start.tzinfo or not end.tzinfo:
+            raise self.NaiveDatetime
+        if end < start:
+            # the period ends before it starts
+            raise ValueError
+
+        table = _transitions.get_transition_table(self.tzinfo)
+        return tuple(
+            _transitions.Transition(
+                when=datetime_.datetime.fromtimestamp(time, self.tzinfo),
+                offset_before=datetime_.timedelta(seconds=before),
+                offset_after=datetime_.timedelta(seconds=after),
+            )
+            for time, before, after in table.between(
+                _ceil_timestamp(start), _ceil_timestamp(end)
+            )
+        )
+
     # Quantize
 
-    ROUND_DOWN: Literal["ROUND_DOWN"] = "ROUND_DOWN"
-    ROUND_UP: Literal["ROUND_UP"] = "ROUND_UP"
+    ROUND_DOWN: ClassVar[Literal["ROUND_DOWN"]] = "ROUND_DOWN"
+    ROUND_UP: ClassVar[Literal["ROUND_UP"]] = "ROUND_UP"
 
     class ResolutionTooLarge(Exception):
         pass
@@ -136,28 +279,153 @@ class TimezoneConverter:
         if resolution > datetime_.timedelta(days=1):
             raise self.ResolutionTooLarge
 
-        # start with round-down and round-up candidates at the start of the day
-        # in this timezone
-        lower_candidate = self.combine(
-            self.date(datetime), datetime_.time(00, 00, 00)
+        # See Note [Quantizing]
+        midnight = self.midnight(datetime)
+        if datetime.tzinfo is self.tzinfo:
+            # wall-time arithmetic
+            steps = max(1, _ceil_div(datetime - midnight, resolution))
+        else:
+            steps = self._first_step(midnight, datetime, resolution)
+
+        if rounding == self.ROUND_DOWN:
+            return midnight + (steps - 1) * resolution
+        elif rounding == self.ROUND_UP:
+            return midnight + steps * resolution
+        else:  # pragma: no cover
+            assert_never(rounding)
+
+    def _first_step(
+        self,
+        midnight: datetime_.datetime,
+        moment: datetime_.datetime,
+        resolution: datetime_.timedelta,
+    ) -> int:
+        """Find the first step of the resolution after midnight which is not
+        before a moment in another timezone.
+
+        See Note [Quantizing].
+        """
+        elapsed = moment - midnight
+        midnight_offset = _whole_seconds(midnight.utcoffset())
+        wall_midnight = _ceil_timestamp(midnight) + midnight_offset
+        table = _transitions.get_transition_table(self.tzinfo)
+
+        steps = max(1, _ceil_div(elapsed, resolution))
+        for wall_time, offset in table.wall_between(
+            wall_midnight + 1,
+            wall_midnight + (elapsed.days + 3) * _SECONDS_PER_DAY,
+        ):
+            start = datetime_.timedelta(seconds=wall_time - wall_midnight)
+            if steps * resolution < start:
+                # the step is before this change, so the offset is right
+                break
+            change = datetime_.timedelta(seconds=offset - midnight_offset)
+            steps = max(
+                1,
+                _ceil_div(start, resolution),
+                _ceil_div(elapsed + change, resolution),
+            )
+        return steps
+
+    def quantize_many(
+        self,
+        values: _arrays.Moments,
+        resolution: datetime_.timedelta,
+        rounding: Literal["ROUND_UP", "ROUND_DOWN"],
+    ) -> _arrays.Moments:
+        """'Round' an array of moments in time to some resolution.
+
+        Each value is rounded exactly as `quantize` would round it, but this is
+        much faster for large arrays. The values must be a NumPy array of UTC
+        `datetime64` values or integer nanoseconds since the Unix epoch; the
+        results are returned in the same form.
+
+        This requires NumPy (install `timezone_tools[numpy]`).
+
+        Raises:
+            ResolutionTooLarge: The resolution is too large.
+            TypeError: The array does not contain datetime64 or integer
+                values.
+        """
+        import numpy as np
+
+        if resolution > datetime_.timedelta(days=1):
+            raise self.ResolutionTooLarge
+
+        # See Note [Arrays of moments in time]
+        moments, not_a_time = _arrays.to_nanoseconds(values)
+        step = resolution // datetime_.timedelta(microseconds=1) * 1000
+        table = _transitions.get_transition_table(self.tzinfo)
+
+        # See Note [Quantizing]
+        local_moments = table.to_local(moments)
+        local_midnights = (
+            local_moments // _arrays.NANOSECONDS_PER_DAY
+        ) * _arrays.NANOSECONDS_PER_DAY
+        midnights = table.to_utc(local_midnights)
+        midnight_offsets = local_midnights - midnights
+
+        # Start from the wall time since midnight. This is right unless the
+        # offset is not the same as at midnight, or changes before the
+        # round-up candidate.
+        steps = np.maximum(1, -((local_midnights - local_moments) // step))
+
+        wall_times, offsets = table.wall_changes(
+            int(moments.max(initial=0)) // _arrays.NANOSECONDS_PER_SECOND
+            + 4 * _SECONDS_PER_DAY
         )
-        upper_candidate = lower_candidate + resolution
-
-        # walk forwards in steps of `resolution` until the datetime is inside
-        # the bounds
-        while upper_candidate < datetime:
-            lower_candidate, upper_candidate = (
-                upper_candidate,
-                upper_candidate + resolution,
+        # with a sentinel after the last change, so there is always a next one
+        wall_times = np.append(
+            wall_times * _arrays.NANOSECONDS_PER_SECOND, np.iinfo(np.int64).max
+        )
+        offsets = np.append(offsets * _arrays.NANOSECONDS_PER_SECOND, 0)
+
+        changes = np.searchsorted(wall_times, local_midnights, side="right")
+        (indexes,) = np.nonzero(
+            (local_moments - moments != midnight_offsets)
+            | (wall_times[changes] <= local_midnights + steps * step)
+        )
+
+        # Correct the rest segment by segment, as `_first_step` does.
+        elapsed = (moments - midnights)[indexes]
+        local_midnights_ = local_midnights[indexes]
+        midnight_offsets_ = midnight_offsets[indexes]
+        changes = changes[indexes]
+        corrected = np.maximum(1, -(-elapsed // step))
+        while indexes.size:
+            next_change = wall_times[changes]
+            done = local_midnights_ + corrected * step < next_change
+            steps[indexes[done]] = corrected[done]
+
+            pending = ~done
+            indexes = indexes[pending]
+            elapsed = elapsed[pending]
+            local_midnights_ = local_midnights_[pending]
+            midnight_offsets_ = midnight_offsets_[pending]
+            changes = changes[pending]
+            change = offsets[changes] - midnight_offsets_
+            corrected = np.maximum(
+                np.maximum(
+                    1, -((local_midnights_ - next_change[pending]) // step)
+                ),
+                -(-(elapsed + change) // step),
             )
+            changes += 1
+
+        def candidates(
+            steps: "npt.NDArray[np.int64]",
+        ) -> "npt.NDArray[np.int64]":
+            return table.to_utc(local_midnights + steps * step)
 
         if rounding == self.ROUND_DOWN:
-            return lower_candidate
+            result = candidates(steps - 1)
         elif rounding == self.ROUND_UP:
-            return upper_candidate
+            result = candidates(steps)
         else:  # pragma: no cover
             assert_never(rounding)
 
+        return _arrays.from_nanoseconds(result, not_a_time, like=values)
+
     # Relative dates and times
 
     def day_before(
@@ -209,7 +477,7 @@ class TimezoneConverter:
         else:
             date = when
 
-        return self.combine(date, datetime_.time(00, 00))
+        return self._cached_combine(date, datetime_.time(00, 00))
 
     def midday(
         self, when: datetime_.datetime | datetime_.date
@@ -226,7 +494,7 @@ class TimezoneConverter:
         else:
             date = when
 
-        return self.combine(date, datetime_.time(12, 00))
+        return self._cached_combine(date, datetime_.time(12, 00))
 
     def next_midnight(
         self, when: datetime_.datetime | datetime_.date
@@ -240,6 +508,97 @@ class TimezoneConverter:
         """
         return self.midnight(self.day_after(when))
 
+    def iter_local_days(
+        self, start: datetime_.date, stop: datetime_.date
+    ) -> Iterator[
+        tuple[datetime_.date, datetime_.datetime, datetime_.datetime]
+    ]:
+        """Iterate through the days in a period in this timezone.
+
+        The period must have the dates in order: the start date must be before
+        the stop date.
+
+        Yields:
+            For each date in the period (including the start date and
+            excluding the stop date), the date, the moment of midnight at the
+            start of the day, and the moment of midnight at the end of the day.
+            Days are not always 24 hours long: the end of each day is the start
+            of the next.
+
+        Raises:
+            ValueError: The period is not valid.
+        """
+        if isinstance(start, datetime_.datetime) or isinstance(
+            stop, datetime_.datetime
+        ):
+            # See Note [datetimes are dates]
+            raise TypeError(
+                "period must be a pair of dates, "
+                f"not {(type(start), type(stop))!r}"
+            )
+
+        if stop <= start:
+            # the period ends before it starts
+            raise ValueError
+
+        # Each day is only seen once, so this does not use the day boundary
+        # cache; filling it with these days would push out more useful ones.
+        date = start
+        day_start = self.combine(date, datetime_.time(00, 00))
+        while date < stop:
+            next_date = date + datetime_.timedelta(days=1)
+            day_end = self.combine(next_date, datetime_.time(00, 00))
+            yield date, day_start, day_end
+            date, day_start = next_date, day_end
+
+    def day_boundaries(
+        self, start_date: datetime_.date, stop_date: datetime_.date
+    ) -> tuple["npt.NDArray[np.int64]", "npt.NDArray[np.int64]"]:
+        """Find when each day in a period starts in this timezone, in bulk.
+
+        The period must have the dates in order: the start date must be before
+        the stop date.
+
+        This requires NumPy (install `timezone_tools[numpy]`).
+
+        Returns:
+            Two arrays with an entry for each date in the period (including the
+            start date and excluding the stop date): the POSIX timestamp of
+            midnight at the start of the day, and the length of the day in
+            seconds. These match the boundaries from `iter_local_days`.
+
+        Raises:
+            ValueError: The period is not valid.
+        """
+        import numpy as np
+
+        if isinstance(start_date, datetime_.datetime) or isinstance(
+            stop_date, datetime_.datetime
+        ):
+            # See Note [datetimes are dates]
+            raise TypeError(
+                "period must be a pair of dates, "
+                f"not {(type(start_date), type(stop_date))!r}"
+            )
+
+        if stop_date <= start_date:
+            # the period ends before it starts
+            raise ValueError
+
+        # Find midnight at the start of each day, and at the end of the last,
+        # from the local timestamps of midnight.
+        local_midnights = (
+            np.arange(
+                _epoch_day(start_date),
+                _epoch_day(stop_date) + 1,
+                dtype=np.int64,
+            )
+            * _SECONDS_PER_DAY
+        )
+        table = _transitions.get_transition_table(self.tzinfo)
+        midnights = local_midnights - table.wall_utcoffsets(local_midnights)
+        return midnights[:-1], np.diff(midnights)
+
     def start_of_month(
         self, datetime: datetime_.datetime
     ) -> datetime_.datetime:
@@ -264,8 +623,9 @@ class TimezoneConverter:
                 timezone to localize from. Use `make_aware` to make a naive
                 datetime timezone-aware.
         """
-        return self.start_of_month(datetime) + relativedelta.relativedelta(
-            months=1
+        return self.midnight(
+            self.first_day_of_month(datetime)
+            + relativedelta.relativedelta(months=1)
         )
 
     def first_day_of_month(
@@ -303,3 +663,116 @@ class TimezoneConverter:
                 datetime timezone-aware.
         """
         return self.localize(datetime).time() == datetime_.time(00, 00)
+
+    # Intervals
+
+    DAYS: ClassVar[Literal["DAYS"]] = "DAYS"
+    MONTHS: ClassVar[Literal["MONTHS"]] = "MONTHS"
+
+    def split_intervals(
+        self,
+        intervals: Iterable[_intervals.Interval],
+        at: Literal["DAYS", "MONTHS"],
+    ) -> tuple[_intervals.Interval, ...]:
+        """Merge intervals of time, and split them at local day or month ends.
+
+        The intervals are merged as by `merge_intervals`, then each merged
+        interval is split at every local midnight (for `DAYS`) or every start
+        of a local month (for `MONTHS`) in this timezone that it contains.
+        See Note [Intervals of time].
+
+        Returns:
+            The split intervals, localized to this timezone, in order. Each is
+            within a single local day or month.
+
+        Raises:
+            ValueError: An interval is not valid: it ends before it starts, or
+                a datetime in it is naive.
+        """
+        next_boundary: Callable[[datetime_.datetime], datetime_.datetime]
+        if at == self.DAYS:
+            next_boundary = self.next_midnight
+        elif at == self.MONTHS:
+            next_boundary = self.end_of_month
+        else:  # pragma: no cover
+            assert_never(at)
+
+        # Local datetimes are compared as moments in UTC, because they share
+        # a tzinfo. See Note [Intervals of time].
+        instant = _intervals.instant
+        split = []
+        for start, end in _intervals.merge_intervals(intervals):
+            start, end = self.localize(start), self.localize(end)
+            start_instant, end_instant = instant(start), instant(end)
+            boundary = next_boundary(start)
+            while (boundary_instant := instant(boundary)) < end_instant:
+                # Around a backward transition at midnight, the next boundary
+                # of a local time can be earlier than it; skip past those.
+                if boundary_instant > start_instant:
+                    split.append((start, boundary))
+                    start, start_instant = boundary, boundary_instant
+                boundary = next_boundary(boundary)
+            split.append((start, end))
+        return tuple(split)
+
+    # Day boundary cache
+
+    def day_cache_info(self) -> _day_cache.CacheInfo:
+        """Get statistics for the cache used by `midnight` and `midday`.
+
+        The cache is shared by all converters for this timezone.
+        See Note [Day boundary cache].
+        """
+        return _day_cache.info(self.tzinfo)
+
+    def set_day_cache_size(self, maxsize: int) -> None:
+        """Set the number of results kept by `midnight` and `midday`.
+
+        The cache is shared by all converters for this timezone, so this
+        affects them all. This clears the cache, and a size of zero turns off
+        caching.
+
+        Raises:
+            ValueError: The size is negative.
+        """
+        _day_cache.resize(self.tzinfo, maxsize)
+
+    def clear_day_cache(self) -> None:
+        """Clear the cache used by `midnight` and `midday`.
+
+        The cache is shared by all converters for this timezone, so this
+        affects them all. The statistics are reset too.
+        """
+        _day_cache.clear(self.tzinfo)
+
+    def _cached_combine(
+        self, date: datetime_.date, time: datetime_.time
+    ) -> datetime_.datetime:
+        return _day_cache.get_day_cache(self.tzinfo)(self.tzinfo, date, time)
+
+
+def _ceil_div(
+    dividend: datetime_.timedelta, divisor: datetime_.timedelta
+) -> int:
+    return -(-dividend // divisor)
+
+
+_EPOCH = datetime_.datetime(1970, 1, 1, tzinfo=datetime_.timezone.utc)
+
+
+def _ceil_timestamp(datetime: datetime_.datetime) -> int:
+    """Get the POSIX timestamp of a datetime, rounded up to a whole second."""
+    return _ceil_div(datetime - _EPOCH, datetime_.timedelta(seconds=1))
+
+
+def _whole_seconds(delta: datetime_.timedelta | None) -> int:
+    assert delta is not None
+    return delta // datetime_.timedelta(seconds=1)
+
+
+_SECONDS_PER_DAY = 86400
+
+
+def _epoch_day(date: datetime_.date) -> int:
+    """Get the number of days between the Unix epoch and a date."""
+    return date.toordinal() - _EPOCH.toordinal()
@@ -0,0 +1,224 @@
+import array
+import bisect
+import datetime
+import heapq
+from collections.abc import Iterable, Iterator
+
+# Note [Date sets]
+# ~~~~~~~~~~~~~~~~
+# A `DateSet` stores its dates as periods: sorted, disjoint, non-adjacent
+# inclusive-inclusive intervals of date ordinals, kept in two compact arrays
+# of starts and ends. Set operations work on the periods in a single pass,
+# without ever expanding them into individual dates, so their cost depends on
+# the number of periods rather than the number of dates.
+#
+# The arrays are never changed after a set is created, so sets are immutable
+# and hashable.
+
+_Intervals = Iterable[tuple[int, int]]
+
+
+class DateSet:
+    """An immutable set of dates, stored as contiguous periods.
+
+    See Note [Date sets].
+    """
+
+    __slots__ = ("_ends", "_starts")
+
+    def __init__(
+        self, periods: Iterable[tuple[datetime.date, datetime.date]] = ()
+    ) -> None:
+        """Create a set of the dates in some periods.
+
+        The periods are pairs of dates (inclusive-inclusive), as returned by
+        `get_contiguous_periods`. They may be in any order, and may overlap.
+
+        Raises:
+            ValueError: A period is not valid.
+        """
+        intervals = []
+        for start, end in periods:
+            if isinstance(start, datetime.datetime) or isinstance(
+                end, datetime.datetime
+            ):
+                # See Note [datetimes are dates]
+                raise TypeError(
+                    "periods must be pairs of dates, "
+                    f"not {(type(start), type(end))!r}"
+                )
+            if end < start:
+                # the period ends before it starts
+                raise ValueError
+            intervals.append((start.toordinal(), end.toordinal()))
+
+        self._starts, self._ends = _merge(sorted(intervals))
+
+    @classmethod
+    def from_dates(cls, dates: Iterable[datetime.date]) -> "DateSet":
+        """Create a set of some dates."""
+        return cls((date, date) for date in dates)
+
+    @classmethod
+    def _from_intervals(cls, intervals: _Intervals) -> "DateSet":
+        # The intervals must be sorted by their start.
+        date_set = cls.__new__(cls)
+        date_set._starts, date_set._ends = _merge(intervals)
+        return date_set
+
+    @property
+    def periods(self) -> tuple[tuple[datetime.date, datetime.date], ...]:
+        """The contiguous periods of dates in the set, in order.
+
+        These are pairs of dates (inclusive-inclusive), in the same form as
+        `get_contiguous_periods` returns.
+        """
+        return tuple(
+            (datetime.date.fromordinal(start), datetime.date.fromordinal(end))
+            for start, end in self._intervals()
+        )
+
+    def _intervals(self) -> Iterator[tuple[int, int]]:
+        return zip(self._starts, self._ends, strict=True)
+
+    # Container protocol
+
+    def __len__(self) -> int:
+        """Count the dates in the set."""
+        return sum(self._ends) - sum(self._starts) + len(self._starts)
+
+    def __bool__(self) -> bool:
+        return bool(self._starts)
+
+    def __contains__(self, value: object) -> bool:
+        """Check whether a date is in the set.
+
+        Raises:
+            TypeError: The value is a datetime (see Note [datetimes are
+                dates]).
+        """
+        if isinstance(value, datetime.datetime):
+            # See Note [datetimes are dates]
+            raise TypeError(f"value must be a date, not {type(value)!r}")
+        if not isinstance(value, datetime.date):
+            return False
+
+        # Find the last period starting on or before the date.
+        ordinal = value.toordinal()
+        index = bisect.bisect_right(self._starts, ordinal) - 1
+        return index >= 0 and ordinal <= self._ends[index]
+
+    def __iter__(self) -> Iterator[datetime.date]:
+        for start, end in self._intervals():
+            for ordinal in range(start, end + 1):
+                yield datetime.date.fromordinal(ordinal)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self.periods)!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DateSet):
+            return NotImplemented
+        return self._starts == other._starts and self._ends == other._ends
+
+    def __hash__(self) -> int:
+        return hash((self._starts.tobytes(), self._ends.tobytes()))
+
+    # Set operations
+
+    def union(self, other: "DateSet") -> "DateSet":
+        """Get the dates in either set."""
+        return self._from_intervals(
+            heapq.merge(self._intervals(), other._intervals())
+        )
+
+    def intersection(self, other: "DateSet") -> "DateSet":
+        """Get the dates in both sets."""
+        return self._from_intervals(_intersect(self, other))
+
+    def difference(self, other: "DateSet") -> "DateSet":
+        """Get the dates in this set but not the other."""
+        return self._from_intervals(_subtract(self, other))
+
+    def complement(
+        self, window: tuple[datetime.date, datetime.date]
+    ) -> "DateSet":
+        """Get the dates in a period that are not in this set.
+
+        The period is a pair of dates (inclusive-inclusive).
+
+        Raises:
+            ValueError: The period is not valid.
+        """
+        return DateSet((window,)).difference(self)
+
+    def __or__(self, other: object) -> "DateSet":
+        if not isinstance(other, DateSet):
+            return NotImplemented
+        return self.union(other)
+
+    def __and__(self, other: object) -> "DateSet":
+        if not isinstance(other, DateSet):
+            return NotImplemented
+        return self.intersection(other)
+
+    def __sub__(self, other: object) -> "DateSet":
+        if not isinstance(other, DateSet):
+            return NotImplemented
+        return self.difference(other)
+
+
+def _merge(
+    intervals: _Intervals,
+) -> tuple["array.array[int]", "array.array[int]"]:
+    """Merge overlapping and adjacent intervals, which are sorted by start."""
+    starts: array.array[int] = array.array("l")
+    ends: array.array[int] = array.array("l")
+    for start, end in intervals:
+        if ends and start <= ends[-1] + 1:
+            # this overlaps (or is adjacent to) the last interval
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+def _intersect(first: DateSet, second: DateSet) -> Iterator[tuple[int, int]]:
+    # Step through both sets of intervals in order, moving on from whichever
+    # interval ends first.
+    first_intervals = list(first._intervals())
+    second_intervals = list(second._intervals())
+    i = j = 0
+    while i < len(first_intervals) and j < len(second_intervals):
+        first_start, first_end = first_intervals[i]
+        second_start, second_end = second_intervals[j]
+        start, end = max(first_start, second_start), min(first_end, second_end)
+        if start <= end:
+            yield start, end
+        if first_end < second_end:
+            i += 1
+        else:
+            j += 1
+
+
+def _subtract(first: DateSet, second: DateSet) -> Iterator[tuple[int, int]]:
+    # For each interval of the first set, cut out the intervals of the second
+    # set that overlap it. The intervals of the second set are stepped
+    # through in order, so each is only looked at a small number of times.
+    second_intervals = list(second._intervals())
+    j = 0
+    for start, end in first._intervals():
+        # skip intervals which end before this one starts
+        while j < len(second_intervals) and second_intervals[j][1] < start:
+            j += 1
+
+        k = j
+        while k < len(second_intervals) and second_intervals[k][0] <= end:
+            cut_start, cut_end = second_intervals[k]
+            if start < cut_start:
+                yield start, cut_start - 1
+            start = cut_end + 1
+            k += 1
+        if start <= end:
+            yield start, end
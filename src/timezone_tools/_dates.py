@@ -1,7 +1,15 @@
+import calendar
 import datetime
-from collections.abc import Collection, Iterator
+import itertools
+import sys
+from collections.abc import Collection, Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any, overload
 
-from dateutil import relativedelta
+from . import _arrays
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
 
 # Note [datetimes are dates]
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -20,7 +28,37 @@ def is_last_day_of_month(date: datetime.date) -> bool:
             f"not {type(date)!r}"
         )
 
-    return date.month != (date + datetime.timedelta(days=1)).month
+    return date.day == _days_in_month(date.year, date.month)
+
+
+def is_last_day_of_month_many(
+    dates: "npt.NDArray[np.datetime64] | npt.NDArray[np.int64]",
+) -> "npt.NDArray[np.bool_]":
+    """Check whether each date in a NumPy array is the last day of the month.
+
+    The dates must be `datetime64` values or integer ordinals (see
+    `datetime.date.toordinal`). This gives the same results as
+    `is_last_day_of_month`, and is `False` for NaT.
+
+    This requires NumPy (install `timezone_tools[numpy]`).
+
+    Returns:
+        A boolean array with the same shape as the input.
+
+    Raises:
+        TypeError: The array does not contain datetime64 or integer values.
+    """
+    import numpy as np
+
+    # See Note [Arrays of dates]
+    ordinals, not_a_date = _arrays.to_ordinals(dates)
+    days = (ordinals - _arrays.EPOCH_ORDINAL).view("datetime64[D]")
+
+    # A date is the last day of its month when the next day is in another.
+    months = days.astype("datetime64[M]")
+    next_months = (days + np.timedelta64(1, "D")).astype("datetime64[M]")
+    is_last: npt.NDArray[np.bool_] = (months != next_months) & ~not_a_date
+    return is_last
 
 
 class DateNotFound(Exception):
@@ -56,18 +94,94 @@ def latest_date_for_day(
     if not (1 <= day_of_month <= 31):
         raise DateNotFound
 
-    # starting at the end of the period, walk backwards until we reach a date
-    # with the desired calendar day
-    candidate = period_end
-    while candidate >= period_start:
-        if candidate.day == day_of_month:
-            return candidate
-
-        candidate -= datetime.timedelta(days=1)
-    else:
-        # we tried every date in the period and didn't find one with the
-        # desired calendar day.
+    latest_date = _latest_date_for_day(period_start, period_end, day_of_month)
+    if latest_date is None:
+        # there is no date in the period with the desired calendar day.
         raise DateNotFound
+    return latest_date
+
+
+def latest_dates_for_days(
+    queries: Iterable[tuple[tuple[datetime.date, datetime.date], int]],
+) -> tuple[datetime.date | None, ...]:
+    """Find the latest date with a calendar day in each of many periods.
+
+    Each query is a period and a calendar day, as passed to
+    `latest_date_for_day`.
+
+    Returns:
+        The latest date for each query, in order, or `None` where there is no
+        date in the period with the calendar day.
+
+    Raises:
+        ValueError: A period is not valid.
+    """
+    latest_dates = []
+    for (period_start, period_end), day_of_month in queries:
+        if isinstance(period_start, datetime.datetime) or isinstance(
+            period_end, datetime.datetime
+        ):
+            # See Note [datetimes are dates]
+            raise TypeError(
+                "periods must be pairs of dates, "
+                f"not {(type(period_start), type(period_end))!r}"
+            )
+        if period_end < period_start:
+            # the period ends before it starts
+            raise ValueError
+
+        if 1 <= day_of_month <= 31:
+            latest_dates.append(
+                _latest_date_for_day(period_start, period_end, day_of_month)
+            )
+        else:
+            latest_dates.append(None)
+    return tuple(latest_dates)
+
+
+def _latest_date_for_day(
+    period_start: datetime.date, period_end: datetime.date, day_of_month: int
+) -> datetime.date | None:
+    # The latest date with the calendar day is in the month the period ends,
+    # unless the period ends before that day. Otherwise it is in the latest
+    # earlier month that is long enough, which is at most two months before
+    # (because months with fewer than 31 days are never adjacent).
+    year, month = period_end.year, period_end.month
+    if period_end.day < day_of_month:
+        year, month = _previous_month(year, month)
+        while _days_in_month(year, month) < day_of_month:
+            year, month = _previous_month(year, month)
+
+    if year < datetime.MINYEAR:
+        return None
+    candidate = datetime.date(year, month, day_of_month)
+    if candidate < period_start:
+        return None
+    return candidate
+
+
+# The number of days in each month (indexed from 1) in a common year.
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _days_in_month(year: int, month: int) -> int:
+    # This is much faster than `calendar.monthrange`, which also finds the
+    # day of the week that the month starts on.
+    if month == 2 and calendar.isleap(year):
+        return 29
+    return _DAYS_IN_MONTH[month]
+
+
+def _previous_month(year: int, month: int) -> tuple[int, int]:
+    if month == 1:
+        return year - 1, 12
+    return year, month - 1
+
+
+def _next_month(year: int, month: int) -> tuple[int, int]:
+    if month == 12:
+        return year + 1, 1
+    return year, month + 1
 
 
 def closest_upcoming_match(
@@ -84,6 +198,11 @@ def closest_upcoming_match(
         the 31st after April 5th will return April 30th, since that is the
         closest to that date within the next month.
 
+        The only exception is when `after_date` is at the end of a month which
+        is too short, and the preferred calendar day is later (e.g. the 31st
+        after April 30th); then the match in the following month is returned
+        (May 31st), even though that is slightly more than a month later.
+
     Raises:
         ValueError: The preferred calendar day is impossible
     """
@@ -94,26 +213,205 @@ def closest_upcoming_match(
     if not (1 <= preferred_day_of_month <= 31):
         raise ValueError
 
-    # walk through the month following `after_date` until a matching date
-    candidate = after_date + datetime.timedelta(days=1)
-    last_day_in_range = after_date + relativedelta.relativedelta(months=1)
-    while candidate <= last_day_in_range:
-        if candidate.day == preferred_day_of_month:
-            # matching date
-            return candidate
+    return _closest_upcoming_match(preferred_day_of_month, after_date)
+
+
+@overload
+def closest_upcoming_matches(
+    preferred_days: Sequence[int], after_dates: Sequence[datetime.date]
+) -> tuple[datetime.date, ...]: ...
+
+
+@overload
+def closest_upcoming_matches(
+    preferred_days: "npt.NDArray[np.integer[Any]] | int",
+    after_dates: "npt.NDArray[np.datetime64]",
+) -> "npt.NDArray[np.datetime64]": ...
+
+
+def closest_upcoming_matches(
+    preferred_days: "Sequence[int] | npt.NDArray[np.integer[Any]] | int",
+    after_dates: "Sequence[datetime.date] | npt.NDArray[np.datetime64]",
+) -> "tuple[datetime.date, ...] | npt.NDArray[np.datetime64]":
+    """Get the next date with a preferred calendar day for many dates.
 
-        if preferred_day_of_month > candidate.day and is_last_day_of_month(
-            candidate
+    Each result is the same as `closest_upcoming_match` for the preferred day
+    and date at the same position.
+
+    The preferred days and dates may be parallel sequences, in which case the
+    results are a tuple of dates. Alternatively, the dates may be a NumPy
+    `datetime64` array, and the preferred days an integer array or a single
+    integer; then the results are a `datetime64[D]` array, and NaT dates give
+    NaT results. This requires NumPy (install `timezone_tools[numpy]`).
+
+    Raises:
+        ValueError: A preferred calendar day is impossible, or the sequences
+            have different lengths.
+    """
+    if isinstance(after_dates, Sequence):
+        if isinstance(preferred_days, int) or not isinstance(
+            preferred_days, Sequence
         ):
-            # end of month before reaching the preferred day; this means the
-            # month is too short, so we should return this date.
-            return candidate
+            raise TypeError("preferred_days must be a sequence of days")
+        if len(preferred_days) != len(after_dates):
+            raise ValueError
+        if any(isinstance(date, datetime.datetime) for date in after_dates):
+            # See Note [datetimes are dates]
+            raise TypeError("after_dates must be dates")
+        if not all(1 <= day <= 31 for day in preferred_days):
+            raise ValueError
+
+        return tuple(
+            _closest_upcoming_match(day, date)
+            for day, date in zip(preferred_days, after_dates, strict=True)
+        )
 
-        candidate += datetime.timedelta(days=1)
-    else:  # pragma: no cover
-        # This means we have found neither the end of the month, nor a matching
-        # date. This should be impossible.
-        raise RuntimeError
+    return _closest_upcoming_matches_array(preferred_days, after_dates)
+
+
+def _closest_upcoming_match(
+    preferred_day_of_month: int, after_date: datetime.date
+) -> datetime.date:
+    # The match is in the same month if the preferred day (or the end of the
+    # month, if that is sooner) is still to come. Otherwise it is in the next
+    # month, which always has a date within a month of `after_date`.
+    year, month = after_date.year, after_date.month
+    day = min(preferred_day_of_month, _days_in_month(year, month))
+    if day > after_date.day:
+        return datetime.date(year, month, day)
+
+    year, month = _next_month(year, month)
+    day = min(preferred_day_of_month, _days_in_month(year, month))
+    return datetime.date(year, month, day)
+
+
+def _closest_upcoming_matches_array(
+    preferred_days: "Sequence[int] | npt.NDArray[np.integer[Any]] | int",
+    after_dates: "npt.NDArray[np.datetime64]",
+) -> "npt.NDArray[np.datetime64]":
+    import numpy as np
+
+    dates = np.asarray(after_dates)
+    if dates.dtype.kind != "M":
+        raise TypeError(
+            f"after_dates must contain datetime64 values, not {dates.dtype}"
+        )
+    days = np.asarray(preferred_days)
+    if days.dtype.kind not in "iu":
+        raise TypeError(
+            f"preferred_days must contain integers, not {days.dtype}"
+        )
+    if not ((1 <= days) & (days <= 31)).all():
+        raise ValueError
+
+    # This follows `_closest_upcoming_match`, using the first day of each
+    # month and offsets in days from it.
+    dates = dates.astype("datetime64[D]")
+    this_month = dates.astype("datetime64[M]").astype("datetime64[D]")
+    next_month = (dates.astype("datetime64[M]") + 1).astype("datetime64[D]")
+    following_month = (dates.astype("datetime64[M]") + 2).astype(
+        "datetime64[D]"
+    )
+    this_month_days = (next_month - this_month).astype(np.int64)
+    next_month_days = (following_month - next_month).astype(np.int64)
+    day = (dates - this_month).astype(np.int64) + 1
+
+    day_this_month = np.minimum(days, this_month_days)
+    day_next_month = np.minimum(days, next_month_days)
+    matches: npt.NDArray[np.datetime64] = np.where(
+        day_this_month > day,
+        this_month + (day_this_month - 1),
+        next_month + (day_next_month - 1),
+    )
+    return matches
+
+
+# Note [Payment schedules]
+# ~~~~~~~~~~~~~~~~~~~~~~~~
+# A payment schedule is the chain of dates found by calling
+# `closest_upcoming_match` with each result in turn. After the first match,
+# there is exactly one date in each month: the preferred calendar day, or the
+# last day of the month if the month is too short. The day in each month only
+# depends on the preferred day and whether the year is a leap year, so it is
+# looked up in tables calculated once for each preferred day, which are shared
+# by every schedule.
+
+# The number of days in each month (indexed from 1) in a leap year.
+_DAYS_IN_LEAP_MONTH = (*_DAYS_IN_MONTH[:2], 29, *_DAYS_IN_MONTH[3:])
+
+# The scheduled day in each month (indexed from 1) for each preferred calendar
+# day, in common and leap years. See Note [Payment schedules].
+_SCHEDULED_DAYS = tuple(
+    (
+        tuple(min(day, days) for days in _DAYS_IN_MONTH),
+        tuple(min(day, days) for days in _DAYS_IN_LEAP_MONTH),
+    )
+    for day in range(32)
+)
+
+
+def iter_payment_schedule(
+    preferred_day_of_month: int, after_date: datetime.date
+) -> Iterator[datetime.date]:
+    """Lazily get successive matches for a preferred calendar day.
+
+    This gives the same dates as calling `closest_upcoming_match` repeatedly,
+    starting with `after_date` and then passing in each result, but without
+    searching for each match from scratch. See Note [Payment schedules].
+
+    Yields:
+        One date in each month, starting with the closest upcoming match
+        after `after_date`, until the end of the latest representable year.
+
+    Raises:
+        ValueError: The preferred calendar day is impossible
+    """
+    if isinstance(after_date, datetime.datetime):
+        # See Note [datetimes are dates]
+        raise TypeError(f"after_date must be a date, not {type(after_date)!r}")
+
+    if not (1 <= preferred_day_of_month <= 31):
+        raise ValueError
+
+    first_match = _closest_upcoming_match(preferred_day_of_month, after_date)
+    yield first_match
+
+    common_days, leap_days = _SCHEDULED_DAYS[preferred_day_of_month]
+    year, first_month = first_match.year, first_match.month + 1
+    while year <= datetime.MAXYEAR:
+        days = leap_days if calendar.isleap(year) else common_days
+        for month in range(first_month, 13):
+            yield datetime.date(year, month, days[month])
+        year, first_month = year + 1, 1
+
+
+def get_payment_schedule(
+    preferred_day_of_month: int,
+    after_date: datetime.date,
+    until_date: datetime.date,
+) -> tuple[datetime.date, ...]:
+    """Get the matches for a preferred calendar day up to a date.
+
+    These are the dates from `iter_payment_schedule` which are on or before
+    `until_date`.
+
+    Raises:
+        ValueError: The preferred calendar day is impossible, or `until_date`
+            is before `after_date`.
+    """
+    if isinstance(until_date, datetime.datetime):
+        # See Note [datetimes are dates]
+        raise TypeError(f"until_date must be a date, not {type(until_date)!r}")
+    if until_date < after_date:
+        # the period ends before it starts
+        raise ValueError
+
+    return tuple(
+        itertools.takewhile(
+            lambda date: date <= until_date,
+            iter_payment_schedule(preferred_day_of_month, after_date),
+        )
+    )
 
 
 def iter_dates(
@@ -124,6 +422,8 @@ def iter_dates(
     The period must have the dates in order: the start date must be before the
     stop date.
 
+    To get the dates as a sequence, use `DateRange` instead.
+
     Yields:
         Each date in the period, including the start date and excluding the
         stop date.
@@ -131,22 +431,147 @@ def iter_dates(
     Raises:
         ValueError: The period is not valid.
     """
-    if isinstance(start, datetime.datetime) or isinstance(
-        stop, datetime.datetime
-    ):
-        # See Note [datetimes are dates]
-        raise TypeError(
-            "period must be a pair of dates, not {(type(start), type(stop))!r}"
-        )
+    yield from DateRange(start, stop)
 
-    if stop <= start:
-        # the period ends before it starts
-        raise ValueError
 
-    date = start
-    while date < stop:
-        yield date
-        date += datetime.timedelta(days=1)
+_MAX_ORDINAL = datetime.date.max.toordinal()
+
+
+class DateRange(Sequence[datetime.date]):
+    """A lazy sequence of evenly spaced dates, like `range` for dates.
+
+    The dates are kept as a range of ordinals, so the length, membership
+    tests, indexing and slicing take constant time and the dates are only
+    created when they are needed.
+
+    The start date is included and the stop date is excluded. Like
+    `iter_dates`, the dates must be in the direction of the step: the start
+    date must be before the stop date (or after it, if the step is
+    negative). Slices and reversed ranges may be empty.
+    """
+
+    __slots__ = ("_ordinals",)
+
+    def __init__(
+        self, start: datetime.date, stop: datetime.date, step: int = 1
+    ) -> None:
+        """Create a range of dates.
+
+        Raises:
+            ValueError: The period is not valid, or the step is zero.
+        """
+        if isinstance(start, datetime.datetime) or isinstance(
+            stop, datetime.datetime
+        ):
+            # See Note [datetimes are dates]
+            raise TypeError(
+                "period must be a pair of dates, "
+                f"not {(type(start), type(stop))!r}"
+            )
+
+        if step == 0 or (stop <= start if step > 0 else start <= stop):
+            # the period ends before it starts
+            raise ValueError
+
+        self._ordinals = range(start.toordinal(), stop.toordinal(), step)
+
+    @classmethod
+    def _from_ordinals(cls, ordinals: range) -> "DateRange":
+        if not ordinals:
+            # A slice may start outside the dates that exist. Empty ranges
+            # are all equal, so keep it within them.
+            start = min(max(ordinals.start, 1), _MAX_ORDINAL)
+            ordinals = range(start, start, ordinals.step)
+        date_range = cls.__new__(cls)
+        date_range._ordinals = ordinals
+        return date_range
+
+    @property
+    def start(self) -> datetime.date:
+        return datetime.date.fromordinal(self._ordinals.start)
+
+    @property
+    def stop(self) -> datetime.date | None:
+        """The date after the last one, in the direction of the step.
+
+        This is None if there is no such date, for a slice that runs to
+        `datetime.date.min` or `datetime.date.max`.
+        """
+        if not 1 <= self._ordinals.stop <= _MAX_ORDINAL:
+            return None
+        return datetime.date.fromordinal(self._ordinals.stop)
+
+    @property
+    def step(self) -> int:
+        return self._ordinals.step
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self.start!r}, {self.stop!r}, "
+            f"step={self.step})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    @overload
+    def __getitem__(self, index: int) -> datetime.date: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "DateRange": ...
+
+    def __getitem__(self, index: int | slice) -> "datetime.date | DateRange":
+        if isinstance(index, slice):
+            return self._from_ordinals(self._ordinals[index])
+        return datetime.date.fromordinal(self._ordinals[index])
+
+    def __iter__(self) -> Iterator[datetime.date]:
+        return map(datetime.date.fromordinal, self._ordinals)
+
+    def __reversed__(self) -> Iterator[datetime.date]:
+        return map(datetime.date.fromordinal, reversed(self._ordinals))
+
+    def __contains__(self, value: object) -> bool:
+        """Check whether a date is in the range.
+
+        Raises:
+            TypeError: The value is a datetime (see Note [datetimes are
+                dates]).
+        """
+        if isinstance(value, datetime.datetime):
+            # See Note [datetimes are dates]
+            raise TypeError(f"value must be a date, not {type(value)!r}")
+        if not isinstance(value, datetime.date):
+            return False
+        return value.toordinal() in self._ordinals
+
+    def index(
+        self, value: object, start: int = 0, stop: int = sys.maxsize
+    ) -> int:
+        """Find the position of a date in the range.
+
+        Raises:
+            ValueError: The date is not in the range (or in the part of it
+                between `start` and `stop`).
+        """
+        if value not in self:
+            raise ValueError(f"{value!r} is not in range")
+        assert isinstance(value, datetime.date)
+        position = self._ordinals.index(value.toordinal())
+        if position not in range(len(self))[start:stop]:
+            raise ValueError(f"{value!r} is not in range")
+        return position
+
+    def count(self, value: object) -> int:
+        return int(value in self)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DateRange):
+            return NotImplemented
+        return self._ordinals == other._ordinals
+
+    def __hash__(self) -> int:
+        return hash(self._ordinals)
 
 
 def get_contiguous_periods(
@@ -183,3 +608,123 @@ def get_contiguous_periods(
             sequences.append([date])
 
     return tuple((sequence[0], sequence[-1]) for sequence in sequences)
+
+
+def get_contiguous_periods_many(
+    dates: _arrays.Dates,
+) -> tuple[_arrays.Dates, _arrays.Dates]:
+    """Find contiguous periods in a NumPy array of dates.
+
+    This finds the same periods as `get_contiguous_periods`, but is much faster
+    for large arrays. The dates must be `datetime64` values or integer
+    ordinals (see `datetime.date.toordinal`), in any order. Repeated dates are
+    only counted once.
+    Use `periods_from_arrays` to get the periods in the same form as
+    `get_contiguous_periods`.
+
+    This requires NumPy (install `timezone_tools[numpy]`).
+
+    Returns:
+        Arrays of the first and last dates (inclusive-inclusive) of each
+        period, in order, in the same form as the input.
+
+    Raises:
+        TypeError: The array does not contain datetime64 or integer values.
+        ValueError: The array contains NaT.
+    """
+    import numpy as np
+
+    # See Note [Arrays of dates]
+    ordinals, not_a_date = _arrays.to_ordinals(dates)
+    if not_a_date.any():
+        raise ValueError("dates must not contain NaT")
+
+    # Sort the dates; a period ends wherever the next date is more than a
+    # day later. (This is much faster than `np.unique`, and repeated dates
+    # do not matter.)
+    ordinals = np.sort(ordinals, axis=None)
+    breaks = np.flatnonzero(np.diff(ordinals) > 1)
+    if ordinals.size:
+        starts = ordinals[np.concatenate(([0], breaks + 1))]
+        ends = ordinals[np.concatenate((breaks, [ordinals.size - 1]))]
+    else:
+        starts = ends = ordinals
+    return (
+        _arrays.from_ordinals(starts, like=dates),
+        _arrays.from_ordinals(ends, like=dates),
+    )
+
+
+def periods_from_arrays(
+    starts: "npt.NDArray[np.datetime64] | npt.NDArray[np.int64]",
+    ends: "npt.NDArray[np.datetime64] | npt.NDArray[np.int64]",
+) -> tuple[tuple[datetime.date, datetime.date], ...]:
+    """Convert arrays of the starts and ends of periods to pairs of dates.
+
+    This converts the results of `get_contiguous_periods_many` to the form
+    returned by `get_contiguous_periods`.
+
+    Raises:
+        TypeError: An array does not contain datetime64 or integer values.
+        ValueError: The arrays have different lengths, or contain NaT.
+    """
+    # See Note [Arrays of dates]
+    start_ordinals, start_not_a_date = _arrays.to_ordinals(starts)
+    end_ordinals, end_not_a_date = _arrays.to_ordinals(ends)
+    if start_not_a_date.any() or end_not_a_date.any():
+        raise ValueError("periods must not contain NaT")
+
+    return tuple(
+        (datetime.date.fromordinal(start), datetime.date.fromordinal(end))
+        for start, end in zip(
+            start_ordinals.tolist(), end_ordinals.tolist(), strict=True
+        )
+    )
+
+
+def iter_contiguous_periods(
+    dates: Iterable[datetime.date], *, check_sorted: bool = True
+) -> Iterator[tuple[datetime.date, datetime.date]]:
+    """Find contiguous periods in dates that are already in order.
+
+    This gives the same periods as `get_contiguous_periods`, but in a single
+    pass with constant memory, so it is suitable for very large inputs (such
+    as rows from a database cursor). Repeated dates are allowed.
+
+    Yields:
+        Pairs of dates that describe the boundaries (inclusive-inclusive) of
+        contiguous periods of dates, in order.
+
+    Raises:
+        ValueError: The dates are not in order. This is only checked if
+            `check_sorted` is true; otherwise, out-of-order dates give
+            meaningless periods.
+    """
+    iterator = iter(dates)
+    start = next(iterator, None)
+    if start is None:
+        # there are no dates, so there are no periods
+        return
+    if isinstance(start, datetime.datetime):
+        # See Note [datetimes are dates]
+        raise TypeError("iter_contiguous_periods() arguments must be dates")
+
+    # Compare ordinals rather than subtracting dates, which is faster.
+    end = start
+    end_ordinal = end.toordinal()
+    for date in iterator:
+        if isinstance(date, datetime.datetime):
+            # See Note [datetimes are dates]
+            raise TypeError(
+                "iter_contiguous_periods() arguments must be dates"
+            )
+
+        ordinal = date.toordinal()
+        if ordinal > end_ordinal + 1:
+            # date is disjoint from the current period: start a new one
+            yield start, end
+            start = date
+        elif check_sorted and ordinal < end_ordinal:
+            raise ValueError(f"dates are not in order: {date} after {end}")
+        end, end_ordinal = date, ordinal
+    yield start, end
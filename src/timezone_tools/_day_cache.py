@@ -0,0 +1,96 @@
+import dataclasses
+import datetime
+import functools
+import threading
+import zoneinfo
+from typing import TYPE_CHECKING
+
+# Note [Day boundary cache]
+# ~~~~~~~~~~~~~~~~~~~~~~~~~
+# Finding the moment a day starts (or reaches midday) in a timezone means
+# building a local datetime and normalizing it with `astimezone`. Callers tend
+# to ask about the same few dates over and over, so we keep the most recently
+# used results in a bounded cache.
+#
+# There is one cache per timezone, shared by every converter for that
+# timezone, so equal converters share their results. Each is a
+# `functools.lru_cache`, which is implemented in C and is thread-safe. A hit
+# must be cheaper than the `astimezone` call it saves, which takes about a
+# microsecond: a cache guarded by our own lock took longer than that. An
+# `lru_cache` cannot be resized, so changing the size replaces the cache,
+# which clears it.
+
+DEFAULT_MAXSIZE = 1024
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheInfo:
+    """Statistics for a cache of day boundaries."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+if TYPE_CHECKING:
+    DayCache = functools._lru_cache_wrapper[datetime.datetime]
+
+
+def _combine(
+    tzinfo: zoneinfo.ZoneInfo, date: datetime.date, time: datetime.time
+) -> datetime.datetime:
+    return datetime.datetime.combine(date, time, tzinfo=tzinfo).astimezone(
+        tzinfo
+    )
+
+
+def _new_day_cache(maxsize: int) -> "DayCache":
+    return functools.lru_cache(maxsize=maxsize)(_combine)
+
+
+_caches: "dict[zoneinfo.ZoneInfo, DayCache]" = {}
+_caches_lock = threading.Lock()
+
+
+def get_day_cache(tzinfo: zoneinfo.ZoneInfo) -> "DayCache":
+    """Get the shared day boundary cache for a timezone.
+
+    The cache is called with the timezone, a date and a local time, and
+    returns the moment that time occurs on that date in the timezone.
+    See Note [Day boundary cache].
+    """
+    # `functools.cache` could create two caches for a timezone if two threads
+    # asked for it at once, so the caches would not be shared.
+    try:
+        return _caches[tzinfo]
+    except KeyError:
+        with _caches_lock:
+            return _caches.setdefault(tzinfo, _new_day_cache(DEFAULT_MAXSIZE))
+
+
+def info(tzinfo: zoneinfo.ZoneInfo) -> CacheInfo:
+    """Get statistics for the day boundary cache for a timezone."""
+    hits, misses, maxsize, currsize = get_day_cache(tzinfo).cache_info()
+    assert maxsize is not None
+    return CacheInfo(
+        hits=hits, misses=misses, maxsize=maxsize, currsize=currsize
+    )
+
+
+def resize(tzinfo: zoneinfo.ZoneInfo, maxsize: int) -> None:
+    """Replace the day boundary cache for a timezone with one of a new size.
+
+    Raises:
+        ValueError: The size is negative.
+    """
+    if maxsize < 0:
+        raise ValueError
+
+    with _caches_lock:
+        _caches[tzinfo] = _new_day_cache(maxsize)
+
+
+def clear(tzinfo: zoneinfo.ZoneInfo) -> None:
+    """Remove all entries from a timezone's cache and reset the statistics."""
+    get_day_cache(tzinfo).cache_clear()
@@ -0,0 +1,109 @@
+import datetime
+import itertools
+from collections.abc import Iterable
+
+# Note [Intervals of time]
+# ~~~~~~~~~~~~~~~~~~~~~~~~
+# An interval is a pair of timezone-aware datetimes, `(start, end)`, which
+# covers the moments from the start up to but not including the end. Empty
+# intervals (where the start is the end) cover no moments at all.
+#
+# Intervals are merged by sorting them by their start once, then sweeping
+# through them in order: each interval either overlaps (or touches) the
+# merged interval before it, and extends it, or starts a new one. This takes
+# O(n log n) time for n intervals, however much they overlap.
+#
+# Intervals do not need to be in the same timezone. Every comparison is made
+# between moments in UTC (see `instant`): Python compares two datetimes with
+# the same `tzinfo` by their wall times, ignoring `fold`, which gives the
+# wrong order around a backward DST transition. The datetimes in the results
+# are the same objects as in the input.
+
+Interval = tuple[datetime.datetime, datetime.datetime]
+
+
+def instant(moment: datetime.datetime) -> datetime.datetime:
+    """Get an aware datetime as the same moment in UTC, for comparisons.
+
+    See Note [Intervals of time].
+    """
+    if moment.tzinfo is datetime.timezone.utc:
+        return moment
+    return moment.astimezone(datetime.timezone.utc)
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> tuple[Interval, ...]:
+    """Merge overlapping and touching intervals of time.
+
+    See Note [Intervals of time]. The intervals may be in any order. Empty
+    intervals are ignored.
+
+    Returns:
+        The merged intervals, which do not overlap or touch, in order.
+
+    Raises:
+        ValueError: An interval is not valid: it ends before it starts, or a
+            datetime in it is naive.
+    """
+    # Each interval with the moments it starts and ends, in UTC.
+    checked = []
+    for start, end in intervals:
+        if not start.tzinfo or not end.tzinfo:
+            raise ValueError(
+                f"intervals must be timezone-aware, not {(start, end)!r}"
+            )
+        start_instant, end_instant = instant(start), instant(end)
+        if end_instant < start_instant:
+            # the interval ends before it starts
+            raise ValueError(f"interval ends before it starts: {(start, end)}")
+        if start_instant < end_instant:
+            checked.append((start_instant, end_instant, start, end))
+
+    # Sort on the start alone; ties do not matter, because the sweep keeps
+    # the latest end.
+    checked.sort(key=lambda interval: interval[0])
+
+    merged = []
+    iterator = iter(checked)
+    first = next(iterator, None)
+    if first is None:
+        # there are no intervals to merge
+        return ()
+
+    _, merged_end_instant, merged_start, merged_end = first
+    for start_instant, end_instant, start, end in iterator:
+        if start_instant <= merged_end_instant:
+            # interval overlaps (or touches) the merged interval: extend it
+            if end_instant > merged_end_instant:
+                merged_end_instant, merged_end = end_instant, end
+        else:
+            # interval is disjoint from the merged interval: start a new one
+            merged.append((merged_start, merged_end))
+            merged_end_instant, merged_start, merged_end = (
+                end_instant,
+                start,
+                end,
+            )
+    merged.append((merged_start, merged_end))
+    return tuple(merged)
+
+
+def find_gaps(intervals: Iterable[Interval]) -> tuple[Interval, ...]:
+    """Find the gaps between intervals of time.
+
+    See Note [Intervals of time]. The intervals may be in any order.
+
+    Returns:
+        The intervals between the end of each merged interval and the start
+        of the next, in order. These are the moments between the start of the
+        earliest interval and the end of the latest that no interval covers.
+
+    Raises:
+        ValueError: An interval is not valid: it ends before it starts, or a
+            datetime in it is naive.
+    """
+    merged = merge_intervals(intervals)
+    return tuple(
+        (end, next_start)
+        for (_, end), (next_start, _) in itertools.pairwise(merged)
+    )
@@ -0,0 +1,228 @@
+import asyncio
+import dataclasses
+import datetime
+import heapq
+import inspect
+import itertools
+import time
+from collections.abc import Callable, Iterator
+
+from . import _clock, _converter
+
+# Note [Midnight rollovers]
+# ~~~~~~~~~~~~~~~~~~~~~~~~~
+# A `MidnightNotifier` keeps the subscriptions for each timezone, and a
+# min-heap with the next local midnight (as a POSIX timestamp) of each
+# timezone that has subscriptions. When the earliest midnight has passed, it
+# is popped, the timezone's subscriptions are called, and the timezone's
+# following midnight is pushed. Each midnight is O(log n) in the number of
+# timezones, however many subscriptions each one has, and nothing needs to
+# be done between midnights.
+#
+# Midnights come from `TimezoneConverter.next_midnight` for the local date,
+# rather than adding 24 hours, so they are right on days when the offset
+# from UTC changes. When midnight is skipped by a DST change, the day starts
+# at the moment of the change (for example, 01:00); when it happens twice,
+# the day starts at the first one.
+#
+# Removing a timezone's last subscription does not search the heap. Its entry
+# is left in place, and is ignored when it is popped because the timezone's
+# state is no longer the one it was pushed for.
+#
+# The current time comes from `time.time()` (so `time_machine` moves it), and
+# it is checked again after sleeping, so waking early only means sleeping
+# again. If the notifier is not run for a while, each midnight that was
+# missed is still notified, in order, so no day is skipped.
+
+_ONE_DAY = datetime.timedelta(days=1)
+
+
+@dataclasses.dataclass(frozen=True, eq=False, slots=True)
+class Subscription:
+    """A function to call at the start of each day in a timezone.
+
+    Use `MidnightNotifier.subscribe` to create one.
+    """
+
+    timezone: str
+    callback: Callable[[str, datetime.date], object]
+
+
+@dataclasses.dataclass(eq=False, slots=True)
+class _Zone:
+    timezone: str
+    converter: _converter.TimezoneConverter
+
+    # The current date, and the POSIX timestamp of the midnight at its end.
+    today: datetime.date
+    next_midnight: float
+
+    # The subscriptions, in the order they were made.
+    subscriptions: dict[Subscription, None]
+
+
+class MidnightNotifier:
+    """Call functions at the start of each day in their timezones.
+
+    Subscribe functions with `subscribe`, then call `run` (or `run_async`
+    in an `asyncio` event loop) to call them at each local midnight. To use
+    your own loop instead, call `run_pending` regularly.
+
+    Notifiers are not thread-safe: subscribe and unsubscribe in the thread
+    (or event loop) running the notifier, for example from the functions it
+    calls. See Note [Midnight rollovers].
+    """
+
+    __slots__ = ("_counter", "_heap", "_wakeup", "_zones")
+
+    def __init__(self) -> None:
+        self._zones: dict[str, _Zone] = {}
+        self._heap: list[tuple[float, int, _Zone]] = []
+        # Breaks ties in the heap, so zones are never compared.
+        self._counter = itertools.count()
+        self._wakeup: asyncio.Event | None = None
+
+    def subscribe(
+        self, timezone: str, callback: Callable[[str, datetime.date], object]
+    ) -> Subscription:
+        """Call a function at the start of each day in a timezone.
+
+        The function is called with the name of the timezone and the date
+        that has just started. Functions for the same timezone are called in
+        the order they were subscribed. With `run_async`, the function may
+        return an awaitable (for example, if it is a coroutine function),
+        which is awaited before the next function is called.
+
+        Raises:
+            zoneinfo.ZoneInfoNotFoundError: The timezone does not exist.
+        """
+        subscription = Subscription(timezone, callback)
+        zone = self._zones.get(timezone)
+        if zone is None:
+            converter = _converter.TimezoneConverter.for_zone(timezone)
+            today = _clock.Clock.for_zone(timezone).today()
+            zone = self._zones[timezone] = _Zone(
+                timezone=timezone,
+                converter=converter,
+                today=today,
+                next_midnight=converter.next_midnight(today).timestamp(),
+                subscriptions={},
+            )
+            self._push(zone)
+        zone.subscriptions[subscription] = None
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Stop calling a subscribed function.
+
+        Raises:
+            ValueError: The subscription is not active.
+        """
+        zone = self._zones.get(subscription.timezone)
+        if zone is None or subscription not in zone.subscriptions:
+            raise ValueError(f"{subscription!r} is not active")
+        del zone.subscriptions[subscription]
+        if not zone.subscriptions:
+            # Its heap entry is ignored from now on.
+            del self._zones[subscription.timezone]
+
+    def next_midnight(self) -> datetime.datetime | None:
+        """Get the next moment a day starts in any subscribed timezone.
+
+        Returns:
+            The moment, in its timezone, or None if there are no
+            subscriptions.
+        """
+        zone = self._peek()
+        if zone is None:
+            return None
+        return zone.converter.next_midnight(zone.today)
+
+    def run_pending(self) -> float | None:
+        """Call the subscribed functions for every midnight that has passed.
+
+        If a function raises an exception, it is raised from here, and the
+        functions after it for the same midnight are not called.
+
+        Returns:
+            The number of seconds until the next midnight, or None if there
+            are no subscriptions.
+        """
+        for subscription, date in self._rollovers():
+            subscription.callback(subscription.timezone, date)
+        return self._delay()
+
+    def run(self) -> None:
+        """Call the subscribed functions at each midnight.
+
+        This returns once there are no subscriptions left, and raises any
+        exception from a function (see `run_pending`).
+        """
+        while (delay := self.run_pending()) is not None:
+            time.sleep(delay)
+
+    async def run_async(self) -> None:
+        """Call the subscribed functions at each midnight in an event loop.
+
+        This returns once there are no subscriptions left, and raises any
+        exception from a function (see `run_pending`). Subscribing to a new
+        timezone while this runs wakes it up, in case that timezone's midnight
+        is the next one.
+        """
+        wakeup = self._wakeup = asyncio.Event()
+        try:
+            while True:
+                for subscription, date in self._rollovers():
+                    result = subscription.callback(subscription.timezone, date)
+                    if inspect.isawaitable(result):
+                        await result
+
+                wakeup.clear()
+                delay = self._delay()
+                if delay is None:
+                    return
+                try:
+                    await asyncio.wait_for(wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._wakeup = None
+
+    def _push(self, zone: _Zone) -> None:
+        heapq.heappush(
+            self._heap, (zone.next_midnight, next(self._counter), zone)
+        )
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _peek(self) -> _Zone | None:
+        """Get the zone with the next midnight, dropping any removed zones."""
+        while self._heap:
+            _, _, zone = self._heap[0]
+            if self._zones.get(zone.timezone) is zone:
+                return zone
+            heapq.heappop(self._heap)
+        return None
+
+    def _delay(self) -> float | None:
+        zone = self._peek()
+        if zone is None:
+            return None
+        return max(zone.next_midnight - time.time(), 0.0)
+
+    def _rollovers(self) -> Iterator[tuple[Subscription, datetime.date]]:
+        """Move each zone whose midnight has passed on to the next day.
+
+        Yields:
+            Each subscription to call, and the date that has started.
+        """
+        while (zone := self._peek()) and zone.next_midnight <= time.time():
+            heapq.heappop(self._heap)
+            date = zone.today = zone.today + _ONE_DAY
+            zone.next_midnight = zone.converter.next_midnight(date).timestamp()
+            self._push(zone)
+
+            for subscription in list(zone.subscriptions):
+                # It may have been removed by an earlier function.
+                if subscription in zone.subscriptions:
+                    yield subscription, date
@@ -0,0 +1,43 @@
+from typing import Protocol, TypeVar
+
+# Note [Shared instances]
+# ~~~~~~~~~~~~~~~~~~~~~~~
+# Converters and clocks are immutable and only depend on their timezone, so a
+# single instance per timezone can be shared by everything that needs one.
+# `for_zone` returns that shared instance, which avoids running `__init__` and
+# looking up the `ZoneInfo` cache each time one is needed (for example, in a
+# request handler).
+#
+# Instances are often used as dictionary keys, so their hash is calculated
+# once when they are created. They use `__slots__` to keep them small.
+#
+# Instances are stored per class (so subclasses get their own instances) and
+# are never removed. Two threads asking for a new timezone at the same time
+# may both create an instance, but only one is ever stored and returned.
+
+
+class _FromTimezone(Protocol):
+    def __init__(self, timezone: str) -> None: ...
+
+
+_T = TypeVar("_T", bound=_FromTimezone)
+
+_instances: dict[tuple[type, str], object] = {}
+
+
+def get(cls: type[_T], timezone: str) -> _T:
+    """Get the shared instance of a class for a timezone.
+
+    See Note [Shared instances].
+
+    Raises:
+        zoneinfo.ZoneInfoNotFoundError: The timezone does not exist.
+    """
+    key = (cls, timezone)
+    try:
+        instance = _instances[key]
+    except KeyError:
+        # `setdefault` is atomic, so every thread gets the same instance.
+        instance = _instances.setdefault(key, cls(timezone))
+    assert isinstance(instance, cls)
+    return instance
@@ -0,0 +1,98 @@
+import datetime
+import math
+import time
+import zoneinfo
+
+from . import _transitions
+
+# Note [Caching today's date]
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Getting today's date in a timezone means getting the current time and
+# converting it with `zoneinfo`, which is comparatively slow for something
+# that only changes once a day. A clock created with `cache_today=True`
+# keeps today's date, with the POSIX timestamps between which it is known to
+# be correct, and only works it out again when `time.time()` is outside them.
+#
+# The date is correct from the moment it was worked out until the earlier of
+# the next local midnight and the next change in the offset from UTC. Ending
+# at the next change in offset (usually a DST change) means the date never
+# has to be predicted across one: that would be wrong when a change moves the
+# local time back over midnight, for example. Starting at the moment it was
+# worked out, rather than at the start of the day, means a clock that is set
+# back (for example, by `time_machine`) is noticed too.
+#
+# `time_machine` patches `time.time()` as well as `datetime.now()`, so the
+# cache follows it. There is one cache per timezone, shared by every caching
+# clock for that timezone. The date and its bounds are replaced together as a
+# single tuple, so threads always see a consistent state without a lock; if
+# two threads work out the date at once, they both store the same thing.
+#
+# A `ClockPool` reads `time.time()` once and asks the cache for each of its
+# timezones for the date at that moment. It keeps the dates for all of them,
+# and only asks again once the earliest of their bounds has passed.
+
+
+class TodayCache:
+    """Today's date in a timezone, kept until it might change.
+
+    See Note [Caching today's date].
+    """
+
+    def __init__(self, tzinfo: zoneinfo.ZoneInfo) -> None:
+        self._tzinfo = tzinfo
+        self._state: tuple[float, float, datetime.date] | None = None
+
+    def today(self) -> datetime.date:
+        now = time.time()
+        state = self._state
+        if state is not None:
+            valid_from, valid_until, today = state
+            if valid_from <= now < valid_until:
+                return today
+        return self._refresh(now)[2]
+
+    def at(self, now: float) -> tuple[float, float, datetime.date]:
+        """Get the date at a POSIX timestamp.
+
+        Returns:
+            The POSIX timestamps from and until which the date is correct,
+            and the date.
+        """
+        state = self._state
+        if state is not None and state[0] <= now < state[1]:
+            return state
+        return self._refresh(now)
+
+    def _refresh(self, now: float) -> tuple[float, float, datetime.date]:
+        today = datetime.datetime.fromtimestamp(now, tz=self._tzinfo).date()
+        if today == datetime.date.max:
+            # there is no next midnight to stop at
+            return (now, now, today)
+
+        valid_from = now
+        valid_until = datetime.datetime.combine(
+            today + datetime.timedelta(days=1),
+            datetime.time(00, 00),
+            tzinfo=self._tzinfo,
+        ).timestamp()
+        table = _transitions.get_transition_table(self._tzinfo)
+        for transition, _, _ in table.between(
+            math.floor(valid_from) + 1, math.ceil(valid_until)
+        ):
+            valid_until = min(valid_until, transition)
+            break
+
+        self._state = (valid_from, valid_until, today)
+        return self._state
+
+
+_caches: dict[zoneinfo.ZoneInfo, TodayCache] = {}
+
+
+def get_today_cache(tzinfo: zoneinfo.ZoneInfo) -> TodayCache:
+    """Get the shared cache of today's date for a timezone."""
+    try:
+        return _caches[tzinfo]
+    except KeyError:
+        # `setdefault` is atomic, so every thread gets the same cache.
+        return _caches.setdefault(tzinfo, TodayCache(tzinfo))
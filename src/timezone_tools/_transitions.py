@@ -0,0 +1,579 @@
+import bisect
+import calendar
+import dataclasses
+import datetime
+import functools
+import importlib.resources
+import itertools
+import operator
+import os
+import re
+import struct
+import zoneinfo
+from collections.abc import Iterable, Iterator
+from typing import IO, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+# Note [Transition tables]
+# ~~~~~~~~~~~~~~~~~~~~~~~~
+# `zoneinfo` does not expose the moments when a timezone's offset from UTC
+# changes, so we read them from the same TZif file that `zoneinfo` loads. The
+# file lists transitions explicitly up to some year; after that, offsets
+# follow a recurring rule given as a POSIX TZ string (for example,
+# "CET-1CEST,M3.5.0,M10.5.0/3" for Europe/Paris). We expand that rule for each
+# year up to a fixed horizon and defer to `zoneinfo` for anything beyond it.
+#
+# Tables are built once per timezone and are immutable, so they can be shared
+# freely between threads.
+
+# All timestamps in this module are whole seconds since the Unix epoch, either
+# in UTC or in local ("wall-clock") time.
+
+_RULE_HORIZON = calendar.timegm((2100, 1, 1, 0, 0, 0))
+
+# Offsets from UTC are always strictly less than a day, so a local timestamp
+# more than a day before the horizon cannot be affected by a transition after
+# it.
+_DAY = 86400
+
+_NANOSECONDS_PER_SECOND = 1_000_000_000
+
+
+@dataclasses.dataclass(frozen=True)
+class TransitionTable:
+    """The transitions between offsets from UTC in a timezone.
+
+    See Note [Transition tables].
+    """
+
+    tzinfo: zoneinfo.ZoneInfo
+
+    # UTC timestamps of the transitions, in order.
+    times: tuple[int, ...]
+
+    # The offset from UTC (in seconds) before the first transition, followed by
+    # the offset after each transition. There is always one more offset than
+    # there are transitions.
+    offsets: tuple[int, ...]
+
+    # The table is complete for UTC timestamps before the horizon. If this is
+    # `None`, the table is complete for all time; otherwise, later transitions
+    # follow the rule.
+    horizon: int | None
+    rule: "_Rule | None"
+
+    def utcoffset(self, timestamp: int) -> int:
+        """Get the offset from UTC at a UTC timestamp."""
+        if self.horizon is not None and timestamp >= self.horizon:
+            return _seconds(
+                datetime.datetime.fromtimestamp(
+                    timestamp, self.tzinfo
+                ).utcoffset()
+            )
+
+        return self.offsets[bisect.bisect_right(self.times, timestamp)]
+
+    def between(self, start: int, end: int) -> Iterator[tuple[int, int, int]]:
+        """Generate the transitions from the start and before the end.
+
+        Yields:
+            The UTC timestamp of each transition, with the offsets before and
+            after it.
+        """
+        first = bisect.bisect_left(self.times, start)
+        last = bisect.bisect_left(self.times, end)
+        for index in range(first, last):
+            yield (
+                self.times[index],
+                self.offsets[index],
+                self.offsets[index + 1],
+            )
+
+        if self.horizon is None or self.rule is None or end <= self.horizon:
+            return
+
+        # Carry on following the rule past the horizon.
+        for time, before, after in _changes(
+            self.rule.transitions(_year(self.horizon) - 1, end),
+            self.offsets[-1],
+        ):
+            if time >= max(start, self.horizon):
+                yield time, before, after
+
+    def wall_between(self, start: int, end: int) -> Iterator[tuple[int, int]]:
+        """Generate the local timestamps when the offset from UTC changes.
+
+        Local times that are skipped or repeated are resolved as they would be
+        for a `datetime` with fold=0, so each change is at the later of the
+        local times before and after the transition.
+
+        Yields:
+            The local timestamp of each change from the start and before the
+            end, with the offset after it.
+        """
+        for time, before, after in self.between(start - _DAY, end + _DAY):
+            wall_time = time + max(before, after)
+            if start <= wall_time < end:
+                yield wall_time, after
+
+    # Arrays
+
+    @functools.cached_property
+    def _arrays(
+        self,
+    ) -> tuple[
+        "npt.NDArray[np.int64]",
+        "npt.NDArray[np.int64]",
+        "npt.NDArray[np.int64]",
+    ]:
+        import numpy as np
+
+        times = np.array(self.times, dtype=np.int64)
+        offsets = np.array(self.offsets, dtype=np.int64)
+        # The local timestamps of the transitions, for times with fold=0. These
+        # have the offset from before the transition in a gap or fold, so the
+        # transition happens at the later of the two local times.
+        wall_times = times + np.maximum(offsets[:-1], offsets[1:])
+        return times, offsets, wall_times
+
+    def utcoffsets(
+        self, timestamps: "npt.NDArray[np.int64]"
+    ) -> "npt.NDArray[np.int64]":
+        """Get the offsets from UTC at an array of UTC timestamps."""
+        import numpy as np
+
+        times, offsets, _ = self._arrays
+        result = offsets[np.searchsorted(times, timestamps, side="right")]
+        if self.horizon is not None:
+            beyond = timestamps >= self.horizon
+            if beyond.any():
+                result[beyond] = [
+                    self.utcoffset(int(timestamp))
+                    for timestamp in timestamps[beyond]
+                ]
+        return result
+
+    def wall_utcoffsets(
+        self, wall_timestamps: "npt.NDArray[np.int64]"
+    ) -> "npt.NDArray[np.int64]":
+        """Get the offsets from UTC at an array of local timestamps.
+
+        Local times that are skipped or repeated are resolved as they would be
+        for a `datetime` with fold=0.
+        """
+        import numpy as np
+
+        _, offsets, wall_times = self._arrays
+        result = offsets[
+            np.searchsorted(wall_times, wall_timestamps, side="right")
+        ]
+        if self.horizon is not None:
+            beyond = wall_timestamps >= self.horizon - _DAY
+            if beyond.any():
+                result[beyond] = [
+                    _seconds(
+                        (
+                            _EPOCH
+                            + datetime.timedelta(seconds=int(wall_timestamp))
+                        )
+                        .replace(tzinfo=self.tzinfo)
+                        .utcoffset()
+                    )
+                    for wall_timestamp in wall_timestamps[beyond]
+                ]
+        return result
+
+    def wall_changes(
+        self, end: int
+    ) -> tuple["npt.NDArray[np.int64]", "npt.NDArray[np.int64]"]:
+        """Get arrays of the local timestamps when the offset from UTC changes.
+
+        Local times that are skipped or repeated are resolved as they would be
+        for a `datetime` with fold=0, as in `wall_between`. The arrays cover
+        every change before the end (a UTC timestamp), and past the horizon
+        if the end is.
+
+        Returns:
+            The local timestamp of each change, and the offset after it.
+        """
+        import numpy as np
+
+        _, offsets, wall_times = self._arrays
+        if self.horizon is None or end <= self.horizon:
+            return wall_times, offsets[1:]
+
+        later = [
+            (time + max(before, after), after)
+            for time, before, after in self.between(self.horizon, end)
+        ]
+        return (
+            np.concatenate(
+                [wall_times, np.array([wall for wall, _ in later], np.int64)]
+            ),
+            np.concatenate(
+                [
+                    offsets[1:],
+                    np.array([offset for _, offset in later], np.int64),
+                ]
+            ),
+        )
+
+    def to_local(
+        self, nanoseconds: "npt.NDArray[np.int64]"
+    ) -> "npt.NDArray[np.int64]":
+        """Convert an array of UTC nanoseconds to local nanoseconds."""
+        offsets = self.utcoffsets(nanoseconds // _NANOSECONDS_PER_SECOND)
+        return nanoseconds + offsets * _NANOSECONDS_PER_SECOND
+
+    def to_utc(
+        self, nanoseconds: "npt.NDArray[np.int64]"
+    ) -> "npt.NDArray[np.int64]":
+        """Convert an array of local nanoseconds to UTC nanoseconds.
+
+        Local times that are skipped or repeated are resolved as they would be
+        for a `datetime` with fold=0.
+        """
+        offsets = self.wall_utcoffsets(nanoseconds // _NANOSECONDS_PER_SECOND)
+        return nanoseconds - offsets * _NANOSECONDS_PER_SECOND
+
+
+@dataclasses.dataclass(frozen=True)
+class Transition:
+    """A change in a timezone's offset from UTC."""
+
+    # The moment of the transition, in the timezone (after the change).
+    when: datetime.datetime
+
+    offset_before: datetime.timedelta
+    offset_after: datetime.timedelta
+
+
+@functools.cache
+def get_transition_table(tzinfo: zoneinfo.ZoneInfo) -> TransitionTable:
+    """Get the (shared) transition table for a timezone."""
+    # Converters always load their timezone by key.
+    assert tzinfo.key is not None
+
+    with _open_tzif(tzinfo.key) as fobj:
+        tzif = _read_tzif(fobj)
+
+    times = list(tzif.times)
+    offsets = [tzif.offset_before, *tzif.offsets]
+    horizon = None
+    if tzif.rule is not None:
+        first_year = _year(times[-1]) if times else 1970
+        for time, offset in tzif.rule.transitions(first_year, _RULE_HORIZON):
+            if not times or time >= times[-1]:
+                times.append(time)
+                offsets.append(offset)
+        horizon = _RULE_HORIZON
+    elif tzif.fixed_offset is not None and not times:
+        offsets = [tzif.fixed_offset]
+
+    useful_times: list[int] = []
+    useful_offsets = [offsets[0]]
+    for time, _, offset in _changes(
+        zip(times, offsets[1:], strict=True), offsets[0]
+    ):
+        useful_times.append(time)
+        useful_offsets.append(offset)
+
+    return TransitionTable(
+        tzinfo=tzinfo,
+        times=tuple(useful_times),
+        offsets=tuple(useful_offsets),
+        horizon=horizon,
+        rule=tzif.rule,
+    )
+
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def _seconds(delta: datetime.timedelta | None) -> int:
+    assert delta is not None
+    return delta.days * _DAY + delta.seconds
+
+
+def _changes(
+    transitions: Iterable[tuple[int, int]], offset: int
+) -> Iterator[tuple[int, int, int]]:
+    """Generate the transitions that change the offset from UTC.
+
+    The transitions are (UTC timestamp, offset after) pairs in order, from
+    the given offset. Some only change the name or DST status of the
+    timezone; those are not interesting here, so they are dropped. Of
+    simultaneous transitions, only the last counts.
+
+    Yields:
+        The UTC timestamp of each change, with the offsets before and after
+        it.
+    """
+    for time, group in itertools.groupby(
+        transitions, key=operator.itemgetter(0)
+    ):
+        *_, (_, after) = group
+        if after != offset:
+            yield time, offset, after
+            offset = after
+
+
+def _year(timestamp: int) -> int:
+    return (_EPOCH + datetime.timedelta(seconds=timestamp)).year
+
+
+def _timestamp(date: datetime.date) -> int:
+    """Get the timestamp of the start of a date (UTC or local)."""
+    return (date.toordinal() - _EPOCH.toordinal()) * _DAY
+
+
+# TZif files
+# ----------
+# See RFC 8536 for details of the file format.
+
+
+def _open_tzif(key: str) -> IO[bytes]:
+    # Find the file in the same way as `zoneinfo`: first search the TZPATH,
+    # then fall back to the `tzdata` package.
+    for search_path in zoneinfo.TZPATH:
+        filepath = os.path.join(search_path, key)
+        if os.path.isfile(filepath):
+            return open(filepath, "rb")
+
+    *package, resource = key.split("/")
+    return (
+        importlib.resources.files(".".join(["tzdata.zoneinfo", *package]))
+        .joinpath(resource)
+        .open("rb")
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class _TZif:
+    times: tuple[int, ...]
+    offsets: tuple[int, ...]
+    offset_before: int
+    rule: "_Rule | None"
+    fixed_offset: int | None
+
+
+_HEADER = struct.Struct(">4sc15x6l")
+
+
+def _read_header(fobj: IO[bytes]) -> tuple[int, tuple[int, ...]]:
+    magic, version, *counts = _HEADER.unpack(fobj.read(_HEADER.size))
+    if magic != b"TZif":
+        raise ValueError("invalid TZif file")
+    return (1 if version == b"\x00" else int(version)), tuple(counts)
+
+
+def _read_tzif(fobj: IO[bytes]) -> _TZif:
+    version, counts = _read_header(fobj)
+    time_size, time_format = 4, "l"
+    if version >= 2:
+        # Skip the version 1 data; the version 2+ data that follows it has
+        # 64-bit transition times.
+        isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = counts
+        fobj.seek(
+            timecnt * 5
+            + typecnt * 6
+            + charcnt
+            + leapcnt * 8
+            + isstdcnt
+            + isutcnt,
+            os.SEEK_CUR,
+        )
+        _, counts = _read_header(fobj)
+        time_size, time_format = 8, "q"
+    isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = counts
+
+    times = struct.unpack(
+        f">{timecnt}{time_format}", fobj.read(timecnt * time_size)
+    )
+    type_indexes = struct.unpack(f">{timecnt}B", fobj.read(timecnt))
+    types = [struct.unpack(">lbB", fobj.read(6)) for _ in range(typecnt)]
+
+    # Use the first standard-time type before the first transition, in the
+    # same way as `zoneinfo`.
+    offset_before = next(
+        (utcoff for utcoff, isdst, _ in types if not isdst), types[0][0]
+    )
+
+    rule = fixed_offset = None
+    if version >= 2:
+        fobj.seek(
+            charcnt + leapcnt * (time_size + 4) + isstdcnt + isutcnt,
+            os.SEEK_CUR,
+        )
+        footer = fobj.read().split(b"\n")[1].decode()
+        if footer:
+            rule, fixed_offset = _parse_tz_string(footer)
+    if rule is None and fixed_offset is None:
+        fixed_offset = types[type_indexes[-1]][0] if times else types[0][0]
+
+    return _TZif(
+        times=times,
+        offsets=tuple(types[index][0] for index in type_indexes),
+        offset_before=offset_before,
+        rule=rule,
+        fixed_offset=fixed_offset,
+    )
+
+
+# POSIX TZ strings
+# ----------------
+# These have the form `std offset [dst [offset] [,start[/time],end[/time]]]`.
+# See https://pubs.opengroup.org/onlinepubs/9799919799/basedefs/V1_chap08.html
+
+
+@dataclasses.dataclass(frozen=True)
+class _Rule:
+    std_offset: int
+    dst_offset: int
+    start: "_RuleDate"
+    end: "_RuleDate"
+
+    def transitions(
+        self, first_year: int, horizon: int
+    ) -> Iterator[tuple[int, int]]:
+        """Generate (UTC timestamp, offset after) pairs for each transition.
+
+        Each year starts with a "transition" to the offset at its start, which
+        is usually the offset already in use.
+        """
+        # `zoneinfo` applies each year's rule to the moments in that UTC year
+        # only, even if the rule starts or ends outside it (as the permanent
+        # DST rule `EST5EDT,0/0,J365/25` does), and we must agree with it.
+        # There are no datetimes after the last year, so no transitions.
+        for year in range(first_year, datetime.MAXYEAR + 1):
+            year_start = _timestamp(datetime.date(year, 1, 1))
+            year_end = _timestamp(datetime.date(year, 12, 31)) + _DAY
+            # The start is given in standard time; the end in daylight time.
+            start = self.start.timestamp(year) - self.std_offset
+            end = self.end.timestamp(year) - self.dst_offset
+            for time in sorted({year_start, start, end}):
+                if not year_start <= time < year_end:
+                    continue
+                if time >= horizon:
+                    return
+                if start < end:
+                    is_dst = start <= time < end
+                else:
+                    is_dst = not end <= time < start
+                yield time, self.dst_offset if is_dst else self.std_offset
+
+
+@dataclasses.dataclass(frozen=True)
+class _RuleDate:
+    # One of "J" (Julian day, ignoring leap days), "" (zero-based day of the
+    # year), or "M" (day of week in month).
+    kind: str
+    values: tuple[int, ...]
+    # Seconds after local midnight.
+    time: int
+
+    def timestamp(self, year: int) -> int:
+        """Get the local timestamp of this date and time in a year."""
+        if self.kind == "M":
+            month, week, weekday = self.values
+            first_weekday, days_in_month = calendar.monthrange(year, month)
+            # `calendar` counts from Monday=0; POSIX counts from Sunday=0.
+            day = (weekday - (first_weekday + 1)) % 7 + 1 + (week - 1) * 7
+            if day > days_in_month:
+                day -= 7
+            date = datetime.date(year, month, day)
+        else:
+            (day_of_year,) = self.values
+            # "J" days count from one, so J1 is January 1. The others should
+            # count from zero, but `zoneinfo` counts them from one too (so day
+            # 59 is February 28 in a common year), and we must agree with it.
+            day_of_year -= 1
+            if (
+                self.kind == "J"
+                and day_of_year >= 59
+                and calendar.isleap(year)
+            ):
+                day_of_year += 1
+            date = datetime.date(year, 1, 1) + datetime.timedelta(
+                days=day_of_year
+            )
+        return _timestamp(date) + self.time
+
+
+_TZ_STRING = re.compile(
+    r"""
+    (?P<std>[^<0-9:.+-]+|<[a-zA-Z0-9+-]+>)
+    (?P<stdoff>[+-]?\d{1,3}(?::\d{2}(?::\d{2})?)?)
+    (?:
+        (?P<dst>[^<0-9:.+-]+|<[a-zA-Z0-9+-]+>)
+        (?P<dstoff>[+-]?\d{1,3}(?::\d{2}(?::\d{2})?)?)?
+    )?
+    """,
+    re.ASCII | re.VERBOSE,
+)
+_RULE_DATE = re.compile(
+    r"(?:(?P<kind>M)(?P<month>\d{1,2})\.(?P<week>\d)\.(?P<weekday>\d)"
+    r"|(?P<julian>J?)(?P<day>\d{1,3}))"
+    r"(?:/(?P<time>[+-]?\d{1,3}(?::\d{2}(?::\d{2})?)?))?",
+    re.ASCII,
+)
+
+
+def _parse_tz_string(tz_string: str) -> tuple[_Rule | None, int | None]:
+    """Parse a TZ string into a rule, or a fixed offset if there is no DST."""
+    names_and_offsets, *rule_dates = tz_string.split(",")
+    match = _TZ_STRING.fullmatch(names_and_offsets)
+    if match is None or len(rule_dates) not in (0, 2):
+        raise ValueError(f"invalid TZ string: {tz_string!r}")
+
+    # POSIX offsets are positive to the west of Greenwich.
+    std_offset = -_parse_duration(match["stdoff"])
+    if match["dst"] is None:
+        return None, std_offset
+    if not rule_dates:
+        raise ValueError(f"TZ string has no DST rule: {tz_string!r}")
+
+    if match["dstoff"] is None:
+        dst_offset = std_offset + 3600
+    else:
+        dst_offset = -_parse_duration(match["dstoff"])
+
+    rule = _Rule(
+        std_offset=std_offset,
+        dst_offset=dst_offset,
+        start=_parse_rule_date(rule_dates[0]),
+        end=_parse_rule_date(rule_dates[1]),
+    )
+    return rule, None
+
+
+def _parse_rule_date(rule_date: str) -> _RuleDate:
+    match = _RULE_DATE.fullmatch(rule_date)
+    if match is None:
+        raise ValueError(f"invalid TZ string rule: {rule_date!r}")
+
+    time = (
+        2 * 3600 if match["time"] is None else _parse_duration(match["time"])
+    )
+    if match["kind"]:
+        values = (
+            int(match["month"]),
+            int(match["week"]),
+            int(match["weekday"]),
+        )
+        return _RuleDate(kind="M", values=values, time=time)
+    else:
+        return _RuleDate(
+            kind=match["julian"], values=(int(match["day"]),), time=time
+        )
+
+
+def _parse_duration(duration: str) -> int:
+    sign = -1 if duration.startswith("-") else 1
+    hours, minutes, seconds = (
+        [int(part) for part in duration.lstrip("+-").split(":")] + [0, 0]
+    )[:3]
+    return sign * (hours * 3600 + minutes * 60 + seconds)
@@ -0,0 +1,99 @@
+import collections
+import concurrent.futures
+import datetime
+import zoneinfo
+from collections.abc import Iterable, Sequence
+
+import pytest
+
+from timezone_tools import TimezoneConverter, group_by_local_date
+
+_ZONES = ("Europe/Paris", "America/Sao_Paulo", "Australia/Lord_Howe")
+
+
+def _records() -> list[tuple[str, datetime.datetime]]:
+    """Get moments every 47 minutes through a year, in several timezones."""
+    start = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    return [
+        (
+            _ZONES[index % len(_ZONES)],
+            start + datetime.timedelta(minutes=47 * index, microseconds=index),
+        )
+        for index in range(12_000)
+    ]
+
+
+def _expected(
+    records: list[tuple[str, datetime.datetime]],
+) -> dict[tuple[str, datetime.date], list[datetime.datetime]]:
+    groups = collections.defaultdict(list)
+    for zone, moment in records:
+        groups[zone, TimezoneConverter(zone).date(moment)].append(moment)
+    return groups
+
+
+def _merged(
+    results: Iterable[tuple[str, datetime.date, Sequence[object]]],
+) -> dict[tuple[str, datetime.date], list[object]]:
+    groups: dict[tuple[str, datetime.date], list[object]]
+    groups = collections.defaultdict(list)
+    for zone, date, moments in results:
+        groups[zone, date].extend(moments)
+    return groups
+
+
+def test_group_by_local_date() -> None:
+    records = _records()
+
+    results = group_by_local_date(records, chunk_size=1000)
+
+    assert _merged(results) == _expected(records)
+
+
+def test_group_by_local_date_process_pool() -> None:
+    records = _records()
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        results = list(group_by_local_date(records, executor))
+
+    assert _merged(results) == _expected(records)
+
+
+def test_group_by_local_date_nanoseconds() -> None:
+    records = _records()
+    epoch = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+    nanoseconds = [
+        (zone, (moment - epoch) // datetime.timedelta(microseconds=1) * 1000)
+        for zone, moment in records
+    ]
+
+    results = _merged(group_by_local_date(nanoseconds))
+
+    expected = _expected(records)
+    assert results.keys() == expected.keys()
+    assert all(
+        len(results[key]) == len(expected[key]) for key in expected.keys()
+    )
+
+
+def test_group_by_local_date_empty() -> None:
+    assert list(group_by_local_date([])) == []
+
+
+def test_group_by_local_date_requires_aware_datetimes() -> None:
+    with pytest.raises(TimezoneConverter.NaiveDatetime):
+        list(
+            group_by_local_date(
+                [("Europe/Paris", datetime.datetime(2024, 7, 9, 12))]
+            )
+        )
+
+
+def test_group_by_local_date_unknown_timezone() -> None:
+    with pytest.raises(zoneinfo.ZoneInfoNotFoundError):
+        list(group_by_local_date([("Europe/Nowhere", 0)]))
+
+
+def test_group_by_local_date_invalid_chunk_size() -> None:
+    with pytest.raises(ValueError):
+        list(group_by_local_date([("Europe/Paris", 0)], chunk_size=0))
@@ -1,11 +1,13 @@
 import dataclasses
 import datetime
+import pickle
 import zoneinfo
 
+import numpy as np
 import pytest
 import time_machine
 
-from timezone_tools import Clock
+from timezone_tools import Clock, ClockPool, TimezoneConverter
 
 # See Note [Use Europe/Paris for tests]
 
@@ -17,6 +19,26 @@ def test_timezone_cannot_be_changed() -> None:
         clock.tzinfo = zoneinfo.ZoneInfo("Europe/London")  # type: ignore[misc]
 
 
+def test_for_zone() -> None:
+    clock = Clock.for_zone("Europe/Paris")
+
+    assert Clock.for_zone("Europe/Paris") is clock
+    assert clock == Clock("Europe/Paris")
+    assert hash(clock) == hash(Clock("Europe/Paris"))
+    assert Clock.for_zone("Europe/London") != clock
+
+
+def test_for_zone_unknown_timezone() -> None:
+    with pytest.raises(zoneinfo.ZoneInfoNotFoundError):
+        Clock.for_zone("Europe/Nowhere")
+
+
+def test_pickle() -> None:
+    clock = Clock("Europe/Paris")
+
+    assert pickle.loads(pickle.dumps(clock)) == clock
+
+
 def test_now() -> None:
     clock = Clock("Europe/Paris")
 
@@ -265,3 +287,292 @@ def test_is_in_the_future(
         tick=False,
     ):
         assert clock.is_in_the_future(when) is is_in_the_future
+
+
+def test_is_in_the_past_many() -> None:
+    clock = Clock("Europe/Paris")
+    paris = zoneinfo.ZoneInfo("Europe/Paris")
+    candidates = (
+        datetime.datetime(2024, 7, 9, 13, 59, tzinfo=paris),
+        datetime.datetime(2024, 7, 9, 14, 00, tzinfo=paris),
+        datetime.datetime(2024, 7, 9, 14, 1, tzinfo=paris),
+        datetime.date(2024, 7, 8),
+        datetime.date(2024, 7, 9),
+        datetime.date(2024, 7, 10),
+    )
+
+    with time_machine.travel(
+        datetime.datetime(2024, 7, 9, 12, 00, tzinfo=zoneinfo.ZoneInfo("UTC")),
+        tick=False,
+    ):
+        assert clock.is_in_the_past_many(candidates) == (
+            True,
+            False,
+            False,
+            True,
+            False,
+            False,
+        )
+        assert clock.is_in_the_future_many(candidates) == (
+            False,
+            False,
+            True,
+            False,
+            False,
+            True,
+        )
+        assert clock.is_in_the_past_many(()) == ()
+
+
+def test_is_in_the_past_many_arrays() -> None:
+    clock = Clock("Europe/Paris")
+    moments = np.array(
+        [
+            "2024-07-09T11:59:59.999999999",
+            "2024-07-09T12:00",
+            "2024-07-09T12:00:00.000000001",
+            "NaT",
+        ],
+        dtype="datetime64[ns]",
+    )
+    dates = np.array(
+        ["2024-07-08", "2024-07-09", "2024-07-10", "NaT"],
+        dtype="datetime64[D]",
+    )
+
+    with time_machine.travel(
+        datetime.datetime(2024, 7, 9, 12, 00, tzinfo=zoneinfo.ZoneInfo("UTC")),
+        tick=False,
+    ):
+        assert clock.is_in_the_past_many(moments).tolist() == [
+            True,
+            False,
+            False,
+            False,
+        ]
+        assert clock.is_in_the_future_many(moments).tolist() == [
+            False,
+            False,
+            True,
+            False,
+        ]
+        assert clock.is_in_the_past_many(
+            moments.view(np.int64)[:3]
+        ).tolist() == [True, False, False]
+        assert clock.is_in_the_past_many(dates).tolist() == [
+            True,
+            False,
+            False,
+            False,
+        ]
+        assert clock.is_in_the_future_many(dates).tolist() == [
+            False,
+            False,
+            True,
+            False,
+        ]
+        assert clock.snapshot().is_in_the_past_many(dates).tolist() == [
+            True,
+            False,
+            False,
+            False,
+        ]
+
+
+def test_is_in_the_past_many_invalid_array() -> None:
+    with pytest.raises(TypeError):
+        Clock("Europe/Paris").is_in_the_past_many(np.array([1.5]))
+
+
+def test_cached_today() -> None:
+    clock = Clock("Europe/Paris", cache_today=True)
+
+    with time_machine.travel(  # assumes UTC
+        datetime.datetime(2024, 7, 9, 21, 59, 59), tick=False
+    ) as traveller:
+        assert clock.today() == datetime.date(2024, 7, 9)
+        assert clock.tomorrow() == datetime.date(2024, 7, 10)
+
+        # local midnight
+        traveller.shift(datetime.timedelta(seconds=1))
+        assert clock.today() == datetime.date(2024, 7, 10)
+        assert clock.yesterday() == datetime.date(2024, 7, 9)
+
+        # back in time
+        traveller.move_to(datetime.datetime(2024, 7, 9, 12))
+        assert clock.today() == datetime.date(2024, 7, 9)
+
+
+def test_cached_today_on_the_last_day() -> None:
+    clock = Clock("Europe/Paris", cache_today=True)
+
+    # There is no midnight after this day for the cache to stop at.
+    with time_machine.travel(  # assumes UTC
+        datetime.datetime(9999, 12, 31, 10), tick=False
+    ) as traveller:
+        assert clock.today() == datetime.date.max
+
+        traveller.shift(datetime.timedelta(hours=1))
+        assert clock.today() == datetime.date.max
+
+
+@pytest.mark.parametrize(
+    "timezone",
+    (
+        "Europe/Paris",
+        # changes between midnight and 1am
+        "America/Havana",
+        # changed from midnight to 11pm on the day before
+        "America/Sao_Paulo",
+    ),
+)
+def test_cached_today_across_dst_changes(timezone: str) -> None:
+    clock = Clock(timezone)
+    caching_clock = Clock(timezone, cache_today=True)
+    converter = TimezoneConverter(timezone)
+    transitions = converter.transitions_between(
+        converter.datetime(2018, 1, 1), converter.datetime(2020, 1, 1)
+    )
+
+    for transition in transitions:
+        start = transition.when - datetime.timedelta(hours=3)
+        with time_machine.travel(start, tick=False) as traveller:
+            for _ in range(6 * 12):
+                assert caching_clock.today() == clock.today()
+                traveller.shift(datetime.timedelta(minutes=5))
+
+
+def test_cached_today_is_opt_in() -> None:
+    clock = Clock("Europe/Paris", cache_today=True)
+
+    assert not Clock("Europe/Paris").cache_today
+    assert not Clock.for_zone("Europe/Paris").cache_today
+    assert clock.cache_today
+    assert clock != Clock("Europe/Paris")
+    assert pickle.loads(pickle.dumps(clock)) == clock
+
+
+def test_snapshot() -> None:
+    clock = Clock("Europe/Paris")
+
+    with time_machine.travel(  # assumes UTC
+        datetime.datetime(2024, 7, 31, 21, 59, 59), tick=False
+    ) as traveller:
+        snapshot = clock.snapshot()
+
+        # after local midnight
+        traveller.shift(datetime.timedelta(seconds=1))
+
+        assert snapshot.now() == datetime.datetime(
+            2024, 7, 31, 23, 59, 59, tzinfo=zoneinfo.ZoneInfo("Europe/Paris")
+        )
+        assert snapshot.today() == datetime.date(2024, 7, 31)
+        assert snapshot.yesterday() == datetime.date(2024, 7, 30)
+        assert snapshot.tomorrow() == datetime.date(2024, 8, 1)
+        assert snapshot.days_in_the_past(3) == datetime.date(2024, 7, 28)
+        assert snapshot.days_in_the_future(3) == datetime.date(2024, 8, 3)
+        assert snapshot.months_in_the_past(3) == datetime.date(2024, 4, 30)
+        assert snapshot.months_in_the_future(4) == datetime.date(2024, 11, 30)
+        assert snapshot.is_in_the_past(datetime.date(2024, 7, 30))
+        assert not snapshot.is_in_the_past(clock.now())
+        assert snapshot.is_in_the_future(datetime.date(2024, 8, 1))
+        assert snapshot.is_in_the_future(clock.now())
+
+
+def test_snapshot_months_are_kept() -> None:
+    snapshot = Clock("Europe/Paris").snapshot()
+
+    assert snapshot.months_in_the_future(3) is snapshot.months_in_the_future(3)
+    assert snapshot.months_in_the_past(3) is snapshot.months_in_the_past(3)
+
+
+def test_clock_pool() -> None:
+    pool = ClockPool(("Europe/Paris", "Asia/Kolkata", "Pacific/Kiritimati"))
+
+    with time_machine.travel(  # assumes UTC
+        datetime.datetime(2024, 7, 9, 21, 59, 59), tick=False
+    ) as traveller:
+        assert pool.now() == {
+            "Europe/Paris": datetime.datetime(
+                2024,
+                7,
+                9,
+                23,
+                59,
+                59,
+                tzinfo=zoneinfo.ZoneInfo("Europe/Paris"),
+            ),
+            "Asia/Kolkata": datetime.datetime(
+                2024,
+                7,
+                10,
+                3,
+                29,
+                59,
+                tzinfo=zoneinfo.ZoneInfo("Asia/Kolkata"),
+            ),
+            "Pacific/Kiritimati": datetime.datetime(
+                2024,
+                7,
+                10,
+                11,
+                59,
+                59,
+                tzinfo=zoneinfo.ZoneInfo("Pacific/Kiritimati"),
+            ),
+        }
+        assert pool.today() == {
+            "Europe/Paris": datetime.date(2024, 7, 9),
+            "Asia/Kolkata": datetime.date(2024, 7, 10),
+            "Pacific/Kiritimati": datetime.date(2024, 7, 10),
+        }
+
+        # local midnight in Paris
+        traveller.shift(datetime.timedelta(seconds=1))
+
+        assert pool.today() == {
+            "Europe/Paris": datetime.date(2024, 7, 10),
+            "Asia/Kolkata": datetime.date(2024, 7, 10),
+            "Pacific/Kiritimati": datetime.date(2024, 7, 10),
+        }
+
+        # backwards
+        traveller.shift(-datetime.timedelta(days=1))
+
+        assert pool.today() == {
+            "Europe/Paris": datetime.date(2024, 7, 9),
+            "Asia/Kolkata": datetime.date(2024, 7, 9),
+            "Pacific/Kiritimati": datetime.date(2024, 7, 9),
+        }
+
+
+def test_clock_pool_across_dst_changes() -> None:
+    timezones = ("Europe/Paris", "America/Havana", "America/Sao_Paulo")
+    pool = ClockPool(timezones)
+    clocks = [Clock(timezone) for timezone in timezones]
+    converter = TimezoneConverter("America/Havana")
+    transitions = converter.transitions_between(
+        converter.datetime(2018, 1, 1), converter.datetime(2020, 1, 1)
+    )
+
+    for transition in transitions:
+        start = transition.when - datetime.timedelta(hours=26)
+        with time_machine.travel(start, tick=False) as traveller:
+            for _ in range(52 * 4):
+                assert pool.today() == {
+                    clock.tzinfo.key: clock.today() for clock in clocks
+                }
+                traveller.shift(datetime.timedelta(minutes=15))
+
+
+def test_clock_pool_timezones() -> None:
+    pool = ClockPool(["Europe/Paris", "Asia/Kolkata", "Europe/Paris"])
+
+    assert pool.timezones == ("Europe/Paris", "Asia/Kolkata")
+    assert repr(pool) == "ClockPool(('Europe/Paris', 'Asia/Kolkata'))"
+    assert ClockPool(()).today() == {}
+
+
+def test_clock_pool_unknown_timezone() -> None:
+    with pytest.raises(zoneinfo.ZoneInfoNotFoundError):
+        ClockPool(("Europe/Paris", "Europe/Nowhere"))
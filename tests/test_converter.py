@@ -1,10 +1,16 @@
+import concurrent.futures
 import dataclasses
 import datetime
+import pickle
 import zoneinfo
+from collections.abc import Iterator
 from typing import Literal
 
+import numpy as np
+import numpy.typing as npt
 import pytest
 
+import timezone_tools
 from timezone_tools import TimezoneConverter
 
 # Note [Use Europe/Paris for tests]
@@ -22,6 +28,26 @@ def test_timezone_cannot_be_changed() -> None:
         paris_time.tzinfo = zoneinfo.ZoneInfo("Europe/London")  # type: ignore[misc]
 
 
+def test_for_zone() -> None:
+    paris_time = TimezoneConverter.for_zone("Europe/Paris")
+
+    assert TimezoneConverter.for_zone("Europe/Paris") is paris_time
+    assert paris_time == TimezoneConverter("Europe/Paris")
+    assert hash(paris_time) == hash(TimezoneConverter("Europe/Paris"))
+    assert TimezoneConverter.for_zone("Europe/London") != paris_time
+
+
+def test_for_zone_unknown_timezone() -> None:
+    with pytest.raises(zoneinfo.ZoneInfoNotFoundError):
+        TimezoneConverter.for_zone("Europe/Nowhere")
+
+
+def test_pickle() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+
+    assert pickle.loads(pickle.dumps(paris_time)) == paris_time
+
+
 def test_datetime() -> None:
     paris_time = TimezoneConverter("Europe/Paris")
 
@@ -145,7 +171,185 @@ def test_date_requires_aware_datetime() -> None:
         paris_time.date(naive_datetime)
 
 
+def _moments_around(day: datetime.date) -> list[datetime.datetime]:
+    # every 7 minutes (in UTC), from the evening before to the morning after
+    return [
+        datetime.datetime.combine(day, datetime.time(), datetime.timezone.utc)
+        + datetime.timedelta(minutes=minutes)
+        for minutes in range(-6 * 60, 30 * 60, 7)
+    ]
+
+
+def _as_array(
+    moments: list[datetime.datetime],
+) -> npt.NDArray[np.datetime64]:
+    return np.array(
+        [
+            moment.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+            for moment in moments
+        ],
+        dtype="datetime64[ns]",
+    )
+
+
+_dst_days = pytest.mark.parametrize(
+    "day",
+    (
+        pytest.param(datetime.date(2024, 3, 31), id="clocks go forward"),
+        pytest.param(datetime.date(2024, 7, 9), id="summer"),
+        pytest.param(datetime.date(2024, 10, 27), id="clocks go back"),
+    ),
+)
+
+
+@_dst_days
+def test_localize_many(day: datetime.date) -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+    moments = _moments_around(day)
+
+    localized = paris_time.localize_many(_as_array(moments))
+
+    expected = np.array(
+        [
+            paris_time.localize(moment).replace(tzinfo=None)
+            for moment in moments
+        ],
+        dtype="datetime64[ns]",
+    )
+    assert localized.tolist() == expected.tolist()
+
+
+def test_localize_many_nanoseconds() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+    # 2024-07-09 12:45 in UTC
+    moment = 1_720_529_100 * 1_000_000_000
+
+    assert paris_time.localize_many(np.array([moment])).tolist() == [
+        moment + 2 * 60 * 60 * 1_000_000_000
+    ]
+
+
+def test_localize_many_not_a_time() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+    moments = np.array(["2024-07-09T12:45", "NaT"], dtype="datetime64[m]")
+
+    localized = paris_time.localize_many(moments)
+
+    assert localized[0] == np.datetime64("2024-07-09T14:45")
+    assert np.isnat(localized[1])
+
+
+def test_localize_many_requires_moments() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+
+    with pytest.raises(TypeError):
+        paris_time.localize_many(np.array([1.5]))
+
+
+@_dst_days
+def test_date_many(day: datetime.date) -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+    moments = _moments_around(day)
+
+    dates = paris_time.date_many(_as_array(moments))
+
+    assert dates.tolist() == [paris_time.date(moment) for moment in moments]
+
+
+def test_date_many_not_a_time() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+    moments = np.array(["2024-07-09T22:45", "NaT"], dtype="datetime64[m]")
+
+    dates = paris_time.date_many(moments)
+
+    assert dates[0] == np.datetime64("2024-07-10")
+    assert np.isnat(dates[1])
+
+
+def test_transitions_between() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+
+    assert paris_time.transitions_between(
+        paris_time.datetime(2024, 1, 1), paris_time.datetime(2025, 1, 1)
+    ) == (
+        timezone_tools.Transition(
+            when=paris_time.datetime(2024, 3, 31, 3, 00),
+            offset_before=datetime.timedelta(hours=1),
+            offset_after=datetime.timedelta(hours=2),
+        ),
+        timezone_tools.Transition(
+            when=paris_time.datetime(2024, 10, 27, 2, 00, fold=1),
+            offset_before=datetime.timedelta(hours=2),
+            offset_after=datetime.timedelta(hours=1),
+        ),
+    )
+
+
+def test_transitions_between_includes_start_and_excludes_end() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+    # the moments the clocks change in 2024
+    spring = datetime.datetime(2024, 3, 31, 1, tzinfo=datetime.timezone.utc)
+    autumn = datetime.datetime(2024, 10, 27, 1, tzinfo=datetime.timezone.utc)
+
+    transitions = paris_time.transitions_between(spring, autumn)
+
+    assert [transition.when for transition in transitions] == [spring]
+
+
+def test_transitions_between_none() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+
+    assert (
+        paris_time.transitions_between(
+            paris_time.datetime(2024, 4, 1), paris_time.datetime(2024, 10, 1)
+        )
+        == ()
+    )
+
+
+@pytest.mark.parametrize(
+    "timezone",
+    ("Europe/Paris", "America/Sao_Paulo", "Australia/Lord_Howe", "Asia/Tokyo"),
+)
+@pytest.mark.parametrize("year", (1950, 2024, 2150))
+def test_transitions_between_match_offsets(timezone: str, year: int) -> None:
+    converter = TimezoneConverter(timezone)
+
+    transitions = converter.transitions_between(
+        converter.datetime(year, 1, 1), converter.datetime(year + 1, 1, 1)
+    )
+
+    for transition in transitions:
+        before = transition.when - datetime.timedelta(seconds=1)
+        assert converter.localize(before).utcoffset() == (
+            transition.offset_before
+        )
+        assert transition.when.utcoffset() == transition.offset_after
+
+
+def test_transitions_between_requires_aware_datetimes() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+    naive_datetime = datetime.datetime(2024, 7, 9, 12, 45, 0, tzinfo=None)
+
+    with pytest.raises(paris_time.NaiveDatetime):
+        paris_time.transitions_between(
+            naive_datetime, paris_time.datetime(2025, 1, 1)
+        )
+
+
+def test_transitions_between_invalid_range() -> None:
+    """Check that the period must start before it ends."""
+    paris_time = TimezoneConverter("Europe/Paris")
+
+    with pytest.raises(ValueError):
+        paris_time.transitions_between(
+            paris_time.datetime(2025, 1, 1), paris_time.datetime(2024, 1, 1)
+        )
+
+
+_one_minute = datetime.timedelta(minutes=1)
 _half_hour = datetime.timedelta(minutes=30)
+_one_hour = datetime.timedelta(hours=1)
 _two_hours = datetime.timedelta(hours=2)
 _day = datetime.timedelta(days=1)
 
@@ -301,6 +505,178 @@ def test_quantize(
     )
 
 
+@pytest.mark.parametrize(
+    "initial_datetime, resolution, rounding, expected_result",
+    (
+        pytest.param(
+            datetime.datetime(
+                2024, 3, 31, 3, 15, tzinfo=zoneinfo.ZoneInfo("Europe/Paris")
+            ),
+            _half_hour,
+            TimezoneConverter.ROUND_DOWN,
+            datetime.datetime(
+                2024, 3, 31, 3, 00, tzinfo=zoneinfo.ZoneInfo("Europe/Paris")
+            ),
+            id="after clocks go forward, round down",
+        ),
+        pytest.param(
+            datetime.datetime(
+                2024, 3, 31, 3, 15, tzinfo=zoneinfo.ZoneInfo("Europe/Paris")
+            ),
+            _half_hour,
+            TimezoneConverter.ROUND_UP,
+            datetime.datetime(
+                2024, 3, 31, 3, 30, tzinfo=zoneinfo.ZoneInfo("Europe/Paris")
+            ),
+            id="after clocks go forward, round up",
+        ),
+        pytest.param(
+            # 3:10am in Paris, after the clocks have gone back
+            datetime.datetime(
+                2024, 10, 27, 2, 10, tzinfo=datetime.timezone.utc
+            ),
+            _one_hour,
+            TimezoneConverter.ROUND_DOWN,
+            datetime.datetime(
+                2024, 10, 27, 3, 00, tzinfo=zoneinfo.ZoneInfo("Europe/Paris")
+            ),
+            id="after clocks go back, round down",
+        ),
+        pytest.param(
+            # 3:10am in Paris, after the clocks have gone back
+            datetime.datetime(
+                2024, 10, 27, 2, 10, tzinfo=datetime.timezone.utc
+            ),
+            _one_hour,
+            TimezoneConverter.ROUND_UP,
+            datetime.datetime(
+                2024, 10, 27, 4, 00, tzinfo=zoneinfo.ZoneInfo("Europe/Paris")
+            ),
+            id="after clocks go back, round up",
+        ),
+        pytest.param(
+            datetime.datetime(
+                2024, 7, 9, 23, 59, tzinfo=zoneinfo.ZoneInfo("Europe/Paris")
+            ),
+            _one_minute,
+            TimezoneConverter.ROUND_DOWN,
+            datetime.datetime(
+                2024, 7, 9, 23, 58, tzinfo=zoneinfo.ZoneInfo("Europe/Paris")
+            ),
+            id="end of day, round down 1 minute",
+        ),
+        pytest.param(
+            datetime.datetime(
+                2024, 7, 9, 23, 59, tzinfo=zoneinfo.ZoneInfo("Europe/Paris")
+            ),
+            _one_minute,
+            TimezoneConverter.ROUND_UP,
+            datetime.datetime(
+                2024, 7, 9, 23, 59, tzinfo=zoneinfo.ZoneInfo("Europe/Paris")
+            ),
+            id="end of day, round up 1 minute",
+        ),
+    ),
+)
+def test_quantize_across_day(
+    initial_datetime: datetime.datetime,
+    resolution: datetime.timedelta,
+    rounding: Literal["ROUND_UP", "ROUND_DOWN"],
+    expected_result: datetime.datetime,
+) -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+
+    assert (
+        paris_time.quantize(initial_datetime, resolution, rounding)
+        == expected_result
+    )
+
+
+def _quantize_by_stepping(
+    converter: TimezoneConverter,
+    moment: datetime.datetime,
+    resolution: datetime.timedelta,
+    rounding: Literal["ROUND_UP", "ROUND_DOWN"],
+) -> datetime.datetime:
+    # try each step from midnight in turn
+    candidate = converter.midnight(moment)
+    while True:
+        candidate += resolution
+        if not candidate < moment:
+            break
+    if rounding == converter.ROUND_DOWN:
+        return candidate - resolution
+    return candidate
+
+
+@pytest.mark.parametrize(
+    "resolution",
+    (
+        # These don't divide the change in offset.
+        datetime.timedelta(minutes=45),
+        datetime.timedelta(minutes=7),
+        _one_hour,
+    ),
+)
+@pytest.mark.parametrize(
+    "rounding", (TimezoneConverter.ROUND_DOWN, TimezoneConverter.ROUND_UP)
+)
+@pytest.mark.parametrize(
+    "timezone",
+    ("UTC", "America/New_York", "Europe/Paris"),
+)
+@_dst_days
+def test_quantize_matches_stepping(
+    resolution: datetime.timedelta,
+    rounding: Literal["ROUND_UP", "ROUND_DOWN"],
+    timezone: str,
+    day: datetime.date,
+) -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+    tzinfo = zoneinfo.ZoneInfo(timezone)
+    moments = [moment.astimezone(tzinfo) for moment in _moments_around(day)]
+    # the second of each repeated time, when the clocks go back
+    moments += [moment.replace(fold=1) for moment in moments]
+
+    for moment in moments:
+        assert paris_time.quantize(
+            moment, resolution, rounding
+        ) == _quantize_by_stepping(paris_time, moment, resolution, rounding)
+
+
+@pytest.mark.parametrize(
+    "rounding", (TimezoneConverter.ROUND_DOWN, TimezoneConverter.ROUND_UP)
+)
+@pytest.mark.parametrize(
+    "moment",
+    (
+        # a second either side of each change in Paris
+        datetime.datetime(
+            2024, 3, 31, 0, 59, 59, tzinfo=datetime.timezone.utc
+        ),
+        datetime.datetime(2024, 3, 31, 1, 0, 1, tzinfo=datetime.timezone.utc),
+        datetime.datetime(
+            2024, 10, 27, 0, 59, 59, tzinfo=datetime.timezone.utc
+        ),
+        datetime.datetime(2024, 10, 27, 1, 0, 1, tzinfo=datetime.timezone.utc),
+    ),
+)
+def test_quantize_matches_stepping_by_seconds(
+    moment: datetime.datetime,
+    rounding: Literal["ROUND_UP", "ROUND_DOWN"],
+) -> None:
+    # Stepping by seconds is slow, so this only tries a few moments.
+    paris_time = TimezoneConverter("Europe/Paris")
+    resolution = datetime.timedelta(seconds=13)
+
+    for moment_in_zone in (moment, paris_time.localize(moment)):
+        assert paris_time.quantize(
+            moment_in_zone, resolution, rounding
+        ) == _quantize_by_stepping(
+            paris_time, moment_in_zone, resolution, rounding
+        )
+
+
 def test_quantize_requires_resolution_less_than_a_day() -> None:
     paris_time = TimezoneConverter("Europe/Paris")
     some_datetime = datetime.datetime(
@@ -327,6 +703,118 @@ def test_quantize_requires_aware_datetime() -> None:
         )
 
 
+@pytest.mark.parametrize(
+    "resolution",
+    (
+        datetime.timedelta(seconds=1),
+        _one_minute,
+        datetime.timedelta(minutes=45),
+        _half_hour,
+        _one_hour,
+        _two_hours,
+        _day,
+    ),
+)
+@pytest.mark.parametrize(
+    "rounding", (TimezoneConverter.ROUND_DOWN, TimezoneConverter.ROUND_UP)
+)
+@_dst_days
+def test_quantize_many(
+    resolution: datetime.timedelta,
+    rounding: Literal["ROUND_UP", "ROUND_DOWN"],
+    day: datetime.date,
+) -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+    moments = _moments_around(day)
+
+    quantized = paris_time.quantize_many(
+        _as_array(moments), resolution, rounding
+    )
+
+    assert (
+        quantized.tolist()
+        == _as_array(
+            [
+                paris_time.quantize(moment, resolution, rounding)
+                for moment in moments
+            ]
+        ).tolist()
+    )
+
+
+def test_quantize_many_after_rule_horizon() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+    # DST changes long after the last one listed in the TZif file
+    transitions = paris_time.transitions_between(
+        paris_time.datetime(2150, 1, 1), paris_time.datetime(2151, 1, 1)
+    )
+    moments = [
+        moment
+        for transition in transitions
+        for moment in _moments_around(transition.when.date())
+    ]
+
+    for rounding in (paris_time.ROUND_DOWN, paris_time.ROUND_UP):
+        quantized = paris_time.quantize_many(
+            _as_array(moments), _one_minute, rounding
+        )
+
+        assert (
+            quantized.tolist()
+            == _as_array(
+                [
+                    paris_time.quantize(moment, _one_minute, rounding)
+                    for moment in moments
+                ]
+            ).tolist()
+        )
+
+
+def test_quantize_many_nanoseconds() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+    # 2024-07-09 12:45 in Paris
+    moment = 1_720_521_900 * 1_000_000_000
+
+    assert paris_time.quantize_many(
+        np.array([moment]), _half_hour, paris_time.ROUND_DOWN
+    ).tolist() == [moment - 15 * 60 * 1_000_000_000]
+
+
+def test_quantize_many_not_a_time() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+    moments = np.array(["2024-07-09T12:45", "NaT"], dtype="datetime64[m]")
+
+    quantized = paris_time.quantize_many(
+        moments, _half_hour, paris_time.ROUND_DOWN
+    )
+
+    assert quantized[0] == np.datetime64("2024-07-09T12:30")
+    assert np.isnat(quantized[1])
+
+
+def test_quantize_many_requires_resolution_less_than_a_day() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+    moments = np.array(["2024-07-09T12:45"], dtype="datetime64[ns]")
+
+    with pytest.raises(paris_time.ResolutionTooLarge):
+        paris_time.quantize_many(
+            moments,
+            datetime.timedelta(hours=25),
+            rounding=paris_time.ROUND_DOWN,
+        )
+
+
+def test_quantize_many_requires_moments() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+
+    with pytest.raises(TypeError):
+        paris_time.quantize_many(
+            np.array([1.5]),
+            _half_hour,
+            rounding=paris_time.ROUND_DOWN,
+        )
+
+
 @pytest.mark.parametrize(
     "when",
     (
@@ -518,6 +1006,142 @@ def test_next_midnight_requires_aware_datetime() -> None:
         paris_time.next_midnight(naive_datetime)
 
 
+def test_iter_local_days() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+
+    days = paris_time.iter_local_days(
+        datetime.date(2024, 3, 30), datetime.date(2024, 4, 1)
+    )
+
+    assert list(days) == [
+        (
+            datetime.date(2024, 3, 30),
+            paris_time.datetime(2024, 3, 30),
+            paris_time.datetime(2024, 3, 31),
+        ),
+        (
+            datetime.date(2024, 3, 31),
+            paris_time.datetime(2024, 3, 31),
+            paris_time.datetime(2024, 4, 1),
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    "date, hours",
+    (
+        pytest.param(datetime.date(2024, 3, 31), 23, id="start of DST"),
+        pytest.param(datetime.date(2024, 7, 9), 24, id="summer"),
+        pytest.param(datetime.date(2024, 10, 27), 25, id="end of DST"),
+    ),
+)
+def test_iter_local_days_length(date: datetime.date, hours: int) -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+
+    ((_, start, end),) = paris_time.iter_local_days(
+        date, date + datetime.timedelta(days=1)
+    )
+
+    assert end.timestamp() - start.timestamp() == hours * 3600
+
+
+def test_iter_local_days_matches_midnight() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+
+    days = paris_time.iter_local_days(
+        datetime.date(2024, 1, 1), datetime.date(2025, 1, 1)
+    )
+
+    for date, start, end in days:
+        assert start == paris_time.midnight(date)
+        assert end == paris_time.next_midnight(date)
+
+
+def test_iter_local_days_is_lazy() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+
+    days = paris_time.iter_local_days(
+        datetime.date(2024, 1, 1), datetime.date(9999, 1, 1)
+    )
+
+    assert next(days)[0] == datetime.date(2024, 1, 1)
+
+
+def test_iter_local_days_invalid_range() -> None:
+    """Check that the period must start before it stops."""
+    paris_time = TimezoneConverter("Europe/Paris")
+
+    with pytest.raises(ValueError):
+        list(
+            paris_time.iter_local_days(
+                datetime.date(2024, 1, 2), datetime.date(2024, 1, 1)
+            )
+        )
+
+
+def test_day_boundaries() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+
+    starts, lengths = paris_time.day_boundaries(
+        datetime.date(2024, 3, 30), datetime.date(2024, 4, 1)
+    )
+
+    assert starts.tolist() == [
+        paris_time.datetime(2024, 3, 30).timestamp(),
+        paris_time.datetime(2024, 3, 31).timestamp(),
+    ]
+    assert lengths.tolist() == [24 * 3600, 23 * 3600]
+
+
+@pytest.mark.parametrize(
+    "start",
+    (
+        pytest.param(datetime.date(2024, 1, 1), id="table"),
+        pytest.param(datetime.date(2099, 6, 1), id="beyond table"),
+    ),
+)
+def test_day_boundaries_match_iter_local_days(start: datetime.date) -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+    stop = start + datetime.timedelta(days=366)
+
+    starts, lengths = paris_time.day_boundaries(start, stop)
+
+    assert list(zip(starts.tolist(), lengths.tolist(), strict=True)) == [
+        (day_start.timestamp(), day_end.timestamp() - day_start.timestamp())
+        for _, day_start, day_end in paris_time.iter_local_days(start, stop)
+    ]
+
+
+def test_day_boundaries_invalid_range() -> None:
+    """Check that the period must start before it stops."""
+    paris_time = TimezoneConverter("Europe/Paris")
+
+    with pytest.raises(ValueError):
+        paris_time.day_boundaries(
+            datetime.date(2024, 1, 2), datetime.date(2024, 1, 1)
+        )
+
+
+def test_day_boundaries_requires_dates() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+
+    with pytest.raises(TypeError):
+        paris_time.day_boundaries(
+            paris_time.datetime(2024, 1, 1), datetime.date(2024, 1, 2)
+        )
+
+
+def test_iter_local_days_requires_dates() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+
+    with pytest.raises(TypeError):
+        list(
+            paris_time.iter_local_days(
+                paris_time.datetime(2024, 1, 1), datetime.date(2024, 1, 2)
+            )
+        )
+
+
 @pytest.mark.parametrize(
     "when",
     (
@@ -703,3 +1327,237 @@ def test_is_midnight_requires_aware_datetime() -> None:
 
     with pytest.raises(paris_time.NaiveDatetime):
         paris_time.is_midnight(naive_datetime)
+
+
+def test_split_intervals_at_days() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+    utc = datetime.timezone.utc
+
+    split = paris_time.split_intervals(
+        (
+            # overlapping intervals are merged first
+            (
+                datetime.datetime(2024, 3, 29, 12, tzinfo=utc),
+                datetime.datetime(2024, 3, 30, 12, tzinfo=utc),
+            ),
+            (
+                datetime.datetime(2024, 3, 30, 0, tzinfo=utc),
+                datetime.datetime(2024, 4, 1, 12, tzinfo=utc),
+            ),
+        ),
+        paris_time.DAYS,
+    )
+
+    assert split == (
+        (
+            paris_time.datetime(2024, 3, 29, 13),
+            paris_time.datetime(2024, 3, 30),
+        ),
+        (paris_time.datetime(2024, 3, 30), paris_time.datetime(2024, 3, 31)),
+        # 23 hours long, because of the change to summer time
+        (paris_time.datetime(2024, 3, 31), paris_time.datetime(2024, 4, 1)),
+        (
+            paris_time.datetime(2024, 4, 1),
+            paris_time.datetime(2024, 4, 1, 14),
+        ),
+    )
+    assert all(start.tzinfo is paris_time.tzinfo for start, _ in split)
+
+
+def test_split_intervals_at_months() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+
+    split = paris_time.split_intervals(
+        (
+            (
+                paris_time.datetime(2024, 1, 15),
+                paris_time.datetime(2024, 3, 15),
+            ),
+            (
+                paris_time.datetime(2024, 5, 1),
+                paris_time.datetime(2024, 5, 2),
+            ),
+        ),
+        paris_time.MONTHS,
+    )
+
+    assert split == (
+        (paris_time.datetime(2024, 1, 15), paris_time.datetime(2024, 2, 1)),
+        (paris_time.datetime(2024, 2, 1), paris_time.datetime(2024, 3, 1)),
+        (paris_time.datetime(2024, 3, 1), paris_time.datetime(2024, 3, 15)),
+        (paris_time.datetime(2024, 5, 1), paris_time.datetime(2024, 5, 2)),
+    )
+
+
+def test_split_intervals_backward_dst_change() -> None:
+    """Check that intervals are compared by moment, not by wall time.
+
+    In Paris, 02:00 to 03:00 happens twice on 27th October 2024.
+    """
+    paris_time = TimezoneConverter("Europe/Paris")
+    utc = datetime.timezone.utc
+    first_half_past_two = paris_time.datetime(2024, 10, 27, 2, 30)
+    second_ten_past_two = paris_time.datetime(2024, 10, 27, 2, 10).replace(
+        fold=1
+    )
+
+    split = paris_time.split_intervals(
+        (
+            (paris_time.datetime(2024, 10, 26, 23), first_half_past_two),
+            (first_half_past_two, second_ten_past_two),
+        ),
+        paris_time.DAYS,
+    )
+
+    assert [
+        (start.astimezone(utc), end.astimezone(utc)) for start, end in split
+    ] == [
+        (
+            datetime.datetime(2024, 10, 26, 21, tzinfo=utc),
+            datetime.datetime(2024, 10, 26, 22, tzinfo=utc),
+        ),
+        (
+            datetime.datetime(2024, 10, 26, 22, tzinfo=utc),
+            datetime.datetime(2024, 10, 27, 1, 10, tzinfo=utc),
+        ),
+    ]
+
+
+def test_split_intervals_backward_dst_change_at_midnight() -> None:
+    """Check that a midnight before the start of an interval is skipped.
+
+    In St. John's, the clocks went back from 00:01 to 23:01 on 25th October
+    1987, so 23:01 to 00:01 happened twice, and the second 23:30 was after
+    midnight.
+    """
+    st_johns_time = TimezoneConverter("America/St_Johns")
+    second_half_past_eleven = st_johns_time.datetime(
+        1987, 10, 24, 23, 30
+    ).replace(fold=1)
+    interval = (
+        second_half_past_eleven,
+        st_johns_time.datetime(1987, 10, 25, 12),
+    )
+
+    assert st_johns_time.split_intervals((interval,), st_johns_time.DAYS) == (
+        interval,
+    )
+
+
+def test_split_intervals_within_one_day() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+    interval = (
+        paris_time.datetime(2024, 7, 9, 1),
+        paris_time.datetime(2024, 7, 10),
+    )
+
+    assert paris_time.split_intervals((interval,), paris_time.DAYS) == (
+        interval,
+    )
+
+
+@pytest.fixture
+def paris_day_cache() -> Iterator[None]:
+    """Start with an empty day boundary cache, and restore it afterwards."""
+    paris_time = TimezoneConverter("Europe/Paris")
+    maxsize = paris_time.day_cache_info().maxsize
+    paris_time.clear_day_cache()
+    yield
+    paris_time.set_day_cache_size(maxsize)
+    paris_time.clear_day_cache()
+
+
+@pytest.mark.usefixtures("paris_day_cache")
+def test_day_cache_info() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+
+    paris_time.midnight(datetime.date(2024, 7, 9))
+    paris_time.midnight(datetime.date(2024, 7, 9))
+    paris_time.midday(datetime.date(2024, 7, 9))
+    paris_time.next_midnight(datetime.date(2024, 7, 9))
+
+    info = paris_time.day_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 3, 3)
+
+
+@pytest.mark.usefixtures("paris_day_cache")
+def test_day_cache_is_shared() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+    other_paris_time = TimezoneConverter("Europe/Paris")
+
+    midnight = paris_time.midnight(datetime.date(2024, 7, 9))
+
+    assert other_paris_time.midnight(datetime.date(2024, 7, 9)) is midnight
+    assert other_paris_time.day_cache_info().hits == 1
+
+
+@pytest.mark.usefixtures("paris_day_cache")
+def test_day_cache_size() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+    paris_time.set_day_cache_size(2)
+
+    for day in (1, 2, 3, 1):
+        paris_time.midnight(datetime.date(2024, 7, day))
+
+    info = paris_time.day_cache_info()
+    # the 1st was the least recently used when the 3rd was added
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (
+        0,
+        4,
+        2,
+        2,
+    )
+
+
+@pytest.mark.usefixtures("paris_day_cache")
+def test_day_cache_resize_clears_it() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+    paris_time.midnight(datetime.date(2024, 7, 9))
+
+    paris_time.set_day_cache_size(10)
+
+    info = paris_time.day_cache_info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (
+        0,
+        0,
+        10,
+        0,
+    )
+
+
+@pytest.mark.usefixtures("paris_day_cache")
+def test_day_cache_disabled() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+    paris_time.set_day_cache_size(0)
+
+    paris_time.midnight(datetime.date(2024, 7, 9))
+
+    assert paris_time.midnight(
+        datetime.date(2024, 7, 9)
+    ) == paris_time.datetime(2024, 7, 9)
+    assert paris_time.day_cache_info().currsize == 0
+
+
+def test_day_cache_size_cannot_be_negative() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+
+    with pytest.raises(ValueError):
+        paris_time.set_day_cache_size(-1)
+
+
+@pytest.mark.usefixtures("paris_day_cache")
+def test_day_cache_threads() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+    paris_time.set_day_cache_size(10)
+    dates = [
+        datetime.date(2024, 1, 1) + datetime.timedelta(days=day)
+        for day in range(50)
+    ] * 20
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        midnights = list(executor.map(paris_time.midnight, dates))
+
+    assert midnights == [
+        paris_time.datetime(date.year, date.month, date.day) for date in dates
+    ]
+    assert paris_time.day_cache_info().currsize == 10
@@ -0,0 +1,127 @@
+import datetime
+
+import pytest
+
+from timezone_tools import DateSet, get_contiguous_periods
+
+
+def _dates(*days: int) -> set[datetime.date]:
+    """Get some dates in January 2024."""
+    return {datetime.date(2024, 1, day) for day in days}
+
+
+def test_periods() -> None:
+    date_set = DateSet(
+        (
+            # overlapping and adjacent periods are merged
+            (datetime.date(2024, 1, 3), datetime.date(2024, 1, 5)),
+            (datetime.date(2024, 1, 1), datetime.date(2024, 1, 3)),
+            (datetime.date(2024, 1, 6), datetime.date(2024, 1, 6)),
+            (datetime.date(2024, 1, 10), datetime.date(2024, 1, 12)),
+        )
+    )
+
+    assert date_set.periods == (
+        (datetime.date(2024, 1, 1), datetime.date(2024, 1, 6)),
+        (datetime.date(2024, 1, 10), datetime.date(2024, 1, 12)),
+    )
+
+
+def test_periods_round_trip() -> None:
+    dates = _dates(1, 2, 3, 5, 8, 9, 31)
+    periods = get_contiguous_periods(dates)
+
+    assert DateSet(periods).periods == periods
+    assert DateSet.from_dates(dates).periods == periods
+
+
+def test_empty() -> None:
+    date_set = DateSet()
+
+    assert not date_set
+    assert len(date_set) == 0
+    assert date_set.periods == ()
+
+
+def test_len() -> None:
+    date_set = DateSet(
+        (
+            (datetime.date(2024, 1, 1), datetime.date(2024, 12, 31)),
+            (datetime.date(2026, 1, 1), datetime.date(2026, 1, 1)),
+        )
+    )
+
+    assert len(date_set) == 367
+
+
+def test_contains() -> None:
+    date_set = DateSet.from_dates(_dates(2, 3, 4, 8))
+
+    assert [
+        day for day in range(1, 11) if datetime.date(2024, 1, day) in date_set
+    ] == [2, 3, 4, 8]
+    assert "2024-01-02" not in date_set
+
+
+def test_iter() -> None:
+    dates = _dates(2, 3, 4, 8)
+
+    assert list(DateSet.from_dates(dates)) == sorted(dates)
+
+
+def test_equality() -> None:
+    date_set = DateSet.from_dates(_dates(1, 2, 3))
+    same_date_set = DateSet(
+        ((datetime.date(2024, 1, 1), datetime.date(2024, 1, 3)),)
+    )
+
+    assert date_set == same_date_set
+    assert hash(date_set) == hash(same_date_set)
+    assert date_set != DateSet.from_dates(_dates(1, 2))
+
+
+_FIRST = _dates(1, 2, 3, 4, 10, 11, 20, 25, 26, 27)
+_SECOND = _dates(3, 4, 5, 6, 11, 12, 13, 21, 24, 25)
+
+
+def test_union() -> None:
+    union = DateSet.from_dates(_FIRST) | DateSet.from_dates(_SECOND)
+
+    assert set(union) == _FIRST | _SECOND
+
+
+def test_intersection() -> None:
+    intersection = DateSet.from_dates(_FIRST) & DateSet.from_dates(_SECOND)
+
+    assert set(intersection) == _FIRST & _SECOND
+
+
+def test_difference() -> None:
+    difference = DateSet.from_dates(_FIRST) - DateSet.from_dates(_SECOND)
+
+    assert set(difference) == _FIRST - _SECOND
+
+
+def test_complement() -> None:
+    complement = DateSet.from_dates(_FIRST).complement(
+        (datetime.date(2024, 1, 2), datetime.date(2024, 1, 22))
+    )
+
+    assert set(complement) == set(_dates(*range(2, 23))) - _FIRST
+
+
+def test_invalid_period() -> None:
+    """Check that each period must not end before it starts."""
+    with pytest.raises(ValueError):
+        DateSet(((datetime.date(2024, 1, 2), datetime.date(2024, 1, 1)),))
+
+
+def test_requires_dates() -> None:
+    # See Note [datetimes are dates]
+    with pytest.raises(TypeError):
+        DateSet(
+            ((datetime.datetime(2024, 1, 1), datetime.datetime(2024, 1, 2)),)
+        )
+
+    with pytest.raises(TypeError):
+        datetime.datetime(2024, 1, 1) in DateSet()  # noqa: B015
@@ -1,5 +1,7 @@
 import datetime
+import itertools
 
+import numpy as np
 import pytest
 
 import timezone_tools
@@ -29,6 +31,36 @@ def test_is_last_day_of_month_requires_date() -> None:
         timezone_tools.is_last_day_of_month(datetime.datetime(2024, 1, 1))
 
 
+def test_is_last_day_of_month_latest_date() -> None:
+    assert timezone_tools.is_last_day_of_month(datetime.date.max)
+
+
+def test_is_last_day_of_month_many() -> None:
+    dates = list(
+        timezone_tools.iter_dates(
+            datetime.date(2023, 12, 1), datetime.date(2025, 1, 1)
+        )
+    )
+    expected = [timezone_tools.is_last_day_of_month(date) for date in dates]
+
+    ordinals = np.array([date.toordinal() for date in dates])
+    assert timezone_tools.is_last_day_of_month_many(ordinals).tolist() == (
+        expected
+    )
+
+    days = np.array(dates, dtype="datetime64[D]")
+    assert timezone_tools.is_last_day_of_month_many(days).tolist() == expected
+
+
+def test_is_last_day_of_month_many_not_a_date() -> None:
+    days = np.array(["2024-01-31", "NaT"], dtype="datetime64[D]")
+
+    assert timezone_tools.is_last_day_of_month_many(days).tolist() == [
+        True,
+        False,
+    ]
+
+
 @pytest.mark.parametrize(
     "period, day_of_month, latest_date",
     (
@@ -106,6 +138,80 @@ def test_latest_date_for_day_requires_dates() -> None:
         )
 
 
+def test_latest_date_for_day_at_start_of_calendar() -> None:
+    with pytest.raises(timezone_tools.DateNotFound):
+        timezone_tools.latest_date_for_day(
+            (datetime.date.min, datetime.date(1, 1, 5)), 10
+        )
+
+
+@pytest.mark.parametrize("day_of_month", range(1, 32))
+def test_latest_date_for_day_matches_every_period_end(
+    day_of_month: int,
+) -> None:
+    """Check every period end over two years against a running answer."""
+    period_start = datetime.date(2023, 1, 1)
+    latest_date = None
+    for period_end in timezone_tools.iter_dates(
+        period_start, datetime.date(2025, 1, 1)
+    ):
+        if period_end.day == day_of_month:
+            latest_date = period_end
+
+        if latest_date:
+            assert (
+                timezone_tools.latest_date_for_day(
+                    (period_start, period_end), day_of_month
+                )
+                == latest_date
+            )
+        else:
+            with pytest.raises(timezone_tools.DateNotFound):
+                timezone_tools.latest_date_for_day(
+                    (period_start, period_end), day_of_month
+                )
+
+
+def test_latest_dates_for_days() -> None:
+    assert timezone_tools.latest_dates_for_days(
+        (
+            ((datetime.date(2024, 1, 1), datetime.date(2024, 12, 31)), 9),
+            ((datetime.date(2024, 1, 1), datetime.date(2024, 5, 1)), 31),
+            ((datetime.date(2024, 1, 1), datetime.date(2024, 1, 30)), 31),
+            ((datetime.date(2024, 1, 1), datetime.date(2024, 1, 31)), 32),
+        )
+    ) == (
+        datetime.date(2024, 12, 9),
+        datetime.date(2024, 3, 31),
+        None,
+        None,
+    )
+
+
+def test_latest_dates_for_days_invalid_range() -> None:
+    """Check that each period must start before it ends."""
+    with pytest.raises(ValueError):
+        timezone_tools.latest_dates_for_days(
+            (((datetime.date(2024, 1, 2), datetime.date(2024, 1, 1)), 1),)
+        )
+
+
+def test_latest_dates_for_days_requires_dates() -> None:
+    # See Note [datetimes are dates]
+    with pytest.raises(TypeError):
+        timezone_tools.latest_dates_for_days(
+            (
+                (
+                    (
+                        datetime.datetime(2024, 1, 1),
+                        datetime.datetime(2024, 1, 2),
+                    ),
+                    1,
+                ),
+            )
+        )
+
+
 @pytest.mark.parametrize(
     "after_date, preferred_day_of_month, closest_match",
     (
@@ -139,6 +245,24 @@ def test_latest_date_for_day_requires_dates() -> None:
             datetime.date(2024, 2, 29),
             id="end of next month (leap year)",
         ),
+        pytest.param(
+            datetime.date(2024, 4, 30),
+            31,
+            datetime.date(2024, 5, 31),
+            id="after end of short month",
+        ),
+        pytest.param(
+            datetime.date(2023, 2, 28),
+            29,
+            datetime.date(2023, 3, 29),
+            id="after end of February",
+        ),
+        pytest.param(
+            datetime.date(2024, 12, 15),
+            10,
+            datetime.date(2025, 1, 10),
+            id="next year",
+        ),
     ),
 )
 def test_closest_upcoming_match(
@@ -216,6 +340,213 @@ def test_iter_dates_requires_dates() -> None:
         next(iterator)
 
 
+def test_date_range() -> None:
+    dates = timezone_tools.DateRange(
+        datetime.date(2024, 1, 1), datetime.date(2024, 1, 4)
+    )
+
+    assert list(dates) == [
+        datetime.date(2024, 1, 1),
+        datetime.date(2024, 1, 2),
+        datetime.date(2024, 1, 3),
+    ]
+    assert len(dates) == 3
+    assert list(reversed(dates)) == list(dates)[::-1]
+
+
+def test_date_range_step() -> None:
+    dates = timezone_tools.DateRange(
+        datetime.date(2024, 1, 1), datetime.date(2024, 3, 1), step=14
+    )
+
+    assert list(dates) == [
+        datetime.date(2024, 1, 1),
+        datetime.date(2024, 1, 15),
+        datetime.date(2024, 1, 29),
+        datetime.date(2024, 2, 12),
+        datetime.date(2024, 2, 26),
+    ]
+    assert dates.step == 14
+
+
+def test_date_range_negative_step() -> None:
+    dates = timezone_tools.DateRange(
+        datetime.date(2024, 1, 4), datetime.date(2024, 1, 1), step=-1
+    )
+
+    assert list(dates) == [
+        datetime.date(2024, 1, 4),
+        datetime.date(2024, 1, 3),
+        datetime.date(2024, 1, 2),
+    ]
+
+
+def test_date_range_contains() -> None:
+    dates = timezone_tools.DateRange(
+        datetime.date(2024, 1, 1), datetime.date(2024, 3, 1), step=7
+    )
+
+    assert datetime.date(2024, 1, 8) in dates
+    assert datetime.date(2024, 1, 9) not in dates
+    assert datetime.date(2024, 3, 4) not in dates
+    assert "2024-01-08" not in dates
+
+
+def test_date_range_indexing() -> None:
+    dates = timezone_tools.DateRange(
+        datetime.date(2024, 1, 1), datetime.date(2024, 3, 1), step=7
+    )
+
+    assert dates[1] == datetime.date(2024, 1, 8)
+    assert dates[-1] == datetime.date(2024, 2, 26)
+    assert dates.index(datetime.date(2024, 1, 15)) == 2
+    assert dates.count(datetime.date(2024, 1, 15)) == 1
+    with pytest.raises(IndexError):
+        dates[9]
+    with pytest.raises(ValueError):
+        dates.index(datetime.date(2024, 1, 16))
+    with pytest.raises(ValueError):
+        dates.index(datetime.date(2024, 1, 15), 3)
+
+
+def test_date_range_slicing() -> None:
+    dates = timezone_tools.DateRange(
+        datetime.date(2024, 1, 1), datetime.date(2024, 1, 11)
+    )
+
+    assert dates[2:5] == timezone_tools.DateRange(
+        datetime.date(2024, 1, 3), datetime.date(2024, 1, 6)
+    )
+    assert list(dates[::-3]) == [
+        datetime.date(2024, 1, 10),
+        datetime.date(2024, 1, 7),
+        datetime.date(2024, 1, 4),
+        datetime.date(2024, 1, 1),
+    ]
+    assert len(dates[5:2]) == 0
+
+
+def test_date_range_attributes() -> None:
+    dates = timezone_tools.DateRange(
+        datetime.date(2024, 1, 1), datetime.date(2024, 1, 11), 3
+    )
+
+    assert dates.start == datetime.date(2024, 1, 1)
+    assert dates.stop == datetime.date(2024, 1, 11)
+    assert dates.step == 3
+    assert repr(dates) == (
+        "DateRange(datetime.date(2024, 1, 1), datetime.date(2024, 1, 11), "
+        "step=3)"
+    )
+
+
+def test_date_range_equality() -> None:
+    dates = timezone_tools.DateRange(
+        datetime.date(2024, 1, 1), datetime.date(2024, 1, 11), 3
+    )
+    # the same dates
+    same_dates = timezone_tools.DateRange(
+        datetime.date(2024, 1, 1), datetime.date(2024, 1, 12), 3
+    )
+
+    assert dates == same_dates
+    assert hash(dates) == hash(same_dates)
+    assert dates != timezone_tools.DateRange(
+        datetime.date(2024, 1, 1), datetime.date(2024, 1, 11)
+    )
+    assert dates != list(dates)
+
+
+def test_date_range_slices_to_the_first_and_last_dates() -> None:
+    first_dates = timezone_tools.DateRange(
+        datetime.date.min, datetime.date(1, 1, 5)
+    )
+    last_dates = timezone_tools.DateRange(
+        datetime.date.max, datetime.date(9999, 12, 25), -2
+    )
+
+    # The dates after these ranges don't exist.
+    reversed_dates = first_dates[::-1]
+    assert reversed_dates.stop is None
+    assert len(reversed_dates) == 4
+    assert list(reversed_dates) == list(reversed(first_dates))
+    assert reversed_dates[-1] == datetime.date.min
+    assert repr(reversed_dates) == (
+        "DateRange(datetime.date(1, 1, 4), None, step=-1)"
+    )
+    assert last_dates[::-1].stop is None
+    assert len(last_dates[::-1]) == 3
+    assert list(last_dates[::-1]) == list(reversed(last_dates))
+    assert last_dates[::-1][-1] == datetime.date.max
+
+    # Empty slices start inside them.
+    for empty_dates in (first_dates[::-1][10:], last_dates[::-1][10:]):
+        assert len(empty_dates) == 0
+        assert list(empty_dates) == []
+        with pytest.raises(IndexError):
+            empty_dates[0]
+    assert first_dates[::-1][10:].start == datetime.date.min
+    assert last_dates[::-1][10:].start == datetime.date.max
+    assert first_dates[::-1][10:] == first_dates[10:]
+
+
+def test_date_range_is_lazy() -> None:
+    dates = timezone_tools.DateRange(datetime.date.min, datetime.date.max)
+
+    assert len(dates) == datetime.date.max.toordinal() - 1
+    assert dates[-1] == datetime.date.max - datetime.timedelta(days=1)
+
+
+@pytest.mark.parametrize(
+    "start, stop, step",
+    (
+        pytest.param(
+            datetime.date(2024, 1, 2),
+            datetime.date(2024, 1, 1),
+            1,
+            id="stop before start",
+        ),
+        pytest.param(
+            datetime.date(2024, 1, 1),
+            datetime.date(2024, 1, 1),
+            1,
+            id="stop at start",
+        ),
+        pytest.param(
+            datetime.date(2024, 1, 1),
+            datetime.date(2024, 1, 2),
+            -1,
+            id="stop after start with negative step",
+        ),
+        pytest.param(
+            datetime.date(2024, 1, 1),
+            datetime.date(2024, 1, 2),
+            0,
+            id="zero step",
+        ),
+    ),
+)
+def test_date_range_invalid_range(
+    start: datetime.date, stop: datetime.date, step: int
+) -> None:
+    with pytest.raises(ValueError):
+        timezone_tools.DateRange(start, stop, step)
+
+
+def test_date_range_requires_dates() -> None:
+    # See Note [datetimes are dates]
+    with pytest.raises(TypeError):
+        timezone_tools.DateRange(
+            datetime.datetime(2024, 1, 1), datetime.datetime(2024, 1, 4)
+        )
+
+    dates = timezone_tools.DateRange(
+        datetime.date(2024, 1, 1), datetime.date(2024, 1, 4)
+    )
+    with pytest.raises(TypeError):
+        datetime.datetime(2024, 1, 1) in dates  # noqa: B015
+
+
 def test_get_contiguous_periods() -> None:
     assert timezone_tools.get_contiguous_periods(
         (
@@ -256,3 +587,352 @@ def test_get_contiguous_periods_requires_dates() -> None:
     # See Note [datetimes are dates]
     with pytest.raises(TypeError):
         timezone_tools.get_contiguous_periods((datetime.datetime(2024, 1, 1),))
+
+
+def test_closest_upcoming_matches() -> None:
+    assert timezone_tools.closest_upcoming_matches(
+        [1, 31, 30],
+        [
+            datetime.date(2024, 1, 1),
+            datetime.date(2024, 4, 5),
+            datetime.date(2024, 1, 30),
+        ],
+    ) == (
+        datetime.date(2024, 2, 1),
+        datetime.date(2024, 4, 30),
+        datetime.date(2024, 2, 29),
+    )
+
+
+def test_closest_upcoming_matches_array() -> None:
+    after_dates = [
+        datetime.date(2023, 1, 1) + datetime.timedelta(days=day)
+        for day in range(800)
+    ]
+    preferred_days = [day % 31 + 1 for day in range(800)]
+
+    matches = timezone_tools.closest_upcoming_matches(
+        np.array(preferred_days),
+        np.array(after_dates, dtype="datetime64[D]"),
+    )
+
+    assert matches.tolist() == [
+        timezone_tools.closest_upcoming_match(preferred_day, after_date)
+        for preferred_day, after_date in zip(
+            preferred_days, after_dates, strict=True
+        )
+    ]
+
+
+def test_closest_upcoming_matches_array_not_a_time() -> None:
+    matches = timezone_tools.closest_upcoming_matches(
+        31, np.array(["2024-04-30", "NaT"], dtype="datetime64[D]")
+    )
+
+    assert matches.tolist() == [datetime.date(2024, 5, 31), None]
+
+
+@pytest.mark.parametrize("preferred_day_of_month", (-1, 0, 32))
+def test_closest_upcoming_matches_invalid_day(
+    preferred_day_of_month: int,
+) -> None:
+    with pytest.raises(ValueError):
+        timezone_tools.closest_upcoming_matches(
+            [1, preferred_day_of_month],
+            [datetime.date(2024, 1, 1), datetime.date(2024, 1, 1)],
+        )
+    with pytest.raises(ValueError):
+        timezone_tools.closest_upcoming_matches(
+            np.array([1, preferred_day_of_month]),
+            np.array(["2024-01-01", "2024-01-01"], dtype="datetime64[D]"),
+        )
+
+
+def test_closest_upcoming_matches_different_lengths() -> None:
+    with pytest.raises(ValueError):
+        timezone_tools.closest_upcoming_matches(
+            [1, 2], [datetime.date(2024, 1, 1)]
+        )
+
+
+def test_closest_upcoming_matches_requires_dates() -> None:
+    # See Note [datetimes are dates]
+    with pytest.raises(TypeError):
+        timezone_tools.closest_upcoming_matches(
+            [1], [datetime.datetime(2024, 1, 1)]
+        )
+    with pytest.raises(TypeError):
+        timezone_tools.closest_upcoming_matches(
+            np.array([1]), np.array([20240101])
+        )
+
+
+def test_closest_upcoming_matches_requires_days() -> None:
+    with pytest.raises(TypeError):
+        timezone_tools.closest_upcoming_matches(
+            1,  # type: ignore[call-overload]
+            [datetime.date(2024, 1, 1)],
+        )
+    with pytest.raises(TypeError):
+        timezone_tools.closest_upcoming_matches(
+            np.array([1.0]),
+            np.array(["2024-01-01"], dtype="datetime64[D]"),
+        )
+
+
+@pytest.mark.parametrize("preferred_day_of_month", (1, 15, 29, 30, 31))
+def test_iter_payment_schedule(preferred_day_of_month: int) -> None:
+    for after_date in (
+        datetime.date(2023, 12, 31),
+        datetime.date(2024, 1, 30),
+        datetime.date(2024, 2, 29),
+        datetime.date(2024, 4, 30),
+    ):
+        schedule = timezone_tools.iter_payment_schedule(
+            preferred_day_of_month, after_date
+        )
+
+        # This is the same as chaining calls to `closest_upcoming_match`.
+        match = after_date
+        for date in itertools.islice(schedule, 60):
+            match = timezone_tools.closest_upcoming_match(
+                preferred_day_of_month, match
+            )
+            assert date == match
+
+
+def test_iter_payment_schedule_end() -> None:
+    schedule = timezone_tools.iter_payment_schedule(
+        31, datetime.date(9999, 10, 15)
+    )
+
+    assert list(schedule) == [
+        datetime.date(9999, 10, 31),
+        datetime.date(9999, 11, 30),
+        datetime.date(9999, 12, 31),
+    ]
+
+
+def test_get_payment_schedule() -> None:
+    assert timezone_tools.get_payment_schedule(
+        31, datetime.date(2024, 1, 31), datetime.date(2024, 5, 31)
+    ) == (
+        datetime.date(2024, 2, 29),
+        datetime.date(2024, 3, 31),
+        datetime.date(2024, 4, 30),
+        datetime.date(2024, 5, 31),
+    )
+    assert (
+        timezone_tools.get_payment_schedule(
+            15, datetime.date(2024, 1, 15), datetime.date(2024, 2, 14)
+        )
+        == ()
+    )
+
+
+@pytest.mark.parametrize("preferred_day_of_month", (-1, 0, 32))
+def test_payment_schedule_invalid_day(preferred_day_of_month: int) -> None:
+    with pytest.raises(ValueError):
+        next(
+            timezone_tools.iter_payment_schedule(
+                preferred_day_of_month, datetime.date(2024, 1, 1)
+            )
+        )
+    with pytest.raises(ValueError):
+        timezone_tools.get_payment_schedule(
+            preferred_day_of_month,
+            datetime.date(2024, 1, 1),
+            datetime.date(2025, 1, 1),
+        )
+
+
+def test_get_payment_schedule_invalid_period() -> None:
+    with pytest.raises(ValueError):
+        timezone_tools.get_payment_schedule(
+            1, datetime.date(2024, 1, 2), datetime.date(2024, 1, 1)
+        )
+
+
+def test_payment_schedule_requires_dates() -> None:
+    # See Note [datetimes are dates]
+    with pytest.raises(TypeError):
+        next(
+            timezone_tools.iter_payment_schedule(
+                1, datetime.datetime(2024, 1, 1)
+            )
+        )
+    with pytest.raises(TypeError):
+        timezone_tools.get_payment_schedule(
+            1, datetime.date(2024, 1, 1), datetime.datetime(2024, 2, 1)
+        )
+
+
+def test_iter_contiguous_periods() -> None:
+    periods = timezone_tools.iter_contiguous_periods(
+        iter(
+            (
+                # Jan 1 - Jan 3, with Jan 2 repeated
+                datetime.date(2024, 1, 1),
+                datetime.date(2024, 1, 2),
+                datetime.date(2024, 1, 2),
+                datetime.date(2024, 1, 3),
+                # Jan 5 on its own
+                datetime.date(2024, 1, 5),
+                # Jan 7 - Jan 8
+                datetime.date(2024, 1, 7),
+                datetime.date(2024, 1, 8),
+            )
+        )
+    )
+
+    assert list(periods) == [
+        (datetime.date(2024, 1, 1), datetime.date(2024, 1, 3)),
+        (datetime.date(2024, 1, 5), datetime.date(2024, 1, 5)),
+        (datetime.date(2024, 1, 7), datetime.date(2024, 1, 8)),
+    ]
+
+
+def test_iter_contiguous_periods_is_lazy() -> None:
+    dates = timezone_tools.DateRange(datetime.date.min, datetime.date.max, 2)
+
+    periods = timezone_tools.iter_contiguous_periods(dates)
+
+    assert next(periods) == (datetime.date.min, datetime.date.min)
+
+
+def test_iter_contiguous_periods_empty() -> None:
+    assert list(timezone_tools.iter_contiguous_periods(())) == []
+
+
+def test_iter_contiguous_periods_not_sorted() -> None:
+    dates = (datetime.date(2024, 1, 2), datetime.date(2024, 1, 1))
+
+    with pytest.raises(ValueError):
+        list(timezone_tools.iter_contiguous_periods(dates))
+
+    # This is wrong, but we were told not to check.
+    assert list(
+        timezone_tools.iter_contiguous_periods(dates, check_sorted=False)
+    ) == [(datetime.date(2024, 1, 2), datetime.date(2024, 1, 1))]
+
+
+def test_iter_contiguous_periods_requires_dates() -> None:
+    # See Note [datetimes are dates]
+    with pytest.raises(TypeError):
+        list(
+            timezone_tools.iter_contiguous_periods(
+                (datetime.date(2024, 1, 1), datetime.datetime(2024, 1, 2))
+            )
+        )
+    with pytest.raises(TypeError):
+        list(
+            timezone_tools.iter_contiguous_periods(
+                (datetime.datetime(2024, 1, 1), datetime.date(2024, 1, 2))
+            )
+        )
+
+
+_UNSORTED_DATES = (
+    # Jan 1 - Jan 3, with Jan 2 repeated
+    datetime.date(2024, 1, 2),
+    datetime.date(2024, 1, 1),
+    datetime.date(2024, 1, 3),
+    datetime.date(2024, 1, 2),
+    # Jan 10 on its own
+    datetime.date(2024, 1, 10),
+    # Jan 7 - Jan 8
+    datetime.date(2024, 1, 8),
+    datetime.date(2024, 1, 7),
+)
+_UNSORTED_DATES_PERIODS = (
+    (datetime.date(2024, 1, 1), datetime.date(2024, 1, 3)),
+    (datetime.date(2024, 1, 7), datetime.date(2024, 1, 8)),
+    (datetime.date(2024, 1, 10), datetime.date(2024, 1, 10)),
+)
+
+
+def test_get_contiguous_periods_many() -> None:
+    dates = np.array(_UNSORTED_DATES, dtype="datetime64[D]")
+
+    starts, ends = timezone_tools.get_contiguous_periods_many(dates)
+
+    assert starts.dtype == np.dtype("datetime64[D]")
+    assert starts.tolist() == [start for start, _ in _UNSORTED_DATES_PERIODS]
+    assert ends.tolist() == [end for _, end in _UNSORTED_DATES_PERIODS]
+    assert (
+        timezone_tools.periods_from_arrays(starts, ends)
+        == _UNSORTED_DATES_PERIODS
+    )
+
+
+def test_get_contiguous_periods_many_ordinals() -> None:
+    dates = np.array([date.toordinal() for date in _UNSORTED_DATES])
+
+    starts, ends = timezone_tools.get_contiguous_periods_many(dates)
+
+    assert starts.tolist() == [
+        start.toordinal() for start, _ in _UNSORTED_DATES_PERIODS
+    ]
+    assert (
+        timezone_tools.periods_from_arrays(starts, ends)
+        == _UNSORTED_DATES_PERIODS
+    )
+
+
+def test_get_contiguous_periods_many_matches_get_contiguous_periods() -> None:
+    start = datetime.date(2023, 12, 1)
+    dates = [
+        date
+        for day, date in enumerate(
+            timezone_tools.DateRange(start, datetime.date(2025, 1, 1))
+        )
+        if day % 5 and day % 7
+    ]
+
+    periods = timezone_tools.periods_from_arrays(
+        *timezone_tools.get_contiguous_periods_many(
+            np.array(dates, dtype="datetime64[D]")
+        )
+    )
+
+    assert periods == timezone_tools.get_contiguous_periods(dates)
+
+
+def test_get_contiguous_periods_many_empty() -> None:
+    starts, ends = timezone_tools.get_contiguous_periods_many(
+        np.array([], dtype="datetime64[D]")
+    )
+
+    assert timezone_tools.periods_from_arrays(starts, ends) == ()
+
+
+def test_get_contiguous_periods_many_not_a_time() -> None:
+    with pytest.raises(ValueError):
+        timezone_tools.get_contiguous_periods_many(
+            np.array(["2024-01-01", "NaT"], dtype="datetime64[D]")
+        )
+
+
+def test_get_contiguous_periods_many_requires_dates() -> None:
+    with pytest.raises(TypeError):
+        timezone_tools.get_contiguous_periods_many(np.array([1.5, 2.5]))
+
+
+def test_periods_from_arrays_different_lengths() -> None:
+    with pytest.raises(ValueError):
+        timezone_tools.periods_from_arrays(
+            np.array([738886, 738890]), np.array([738887])
+        )
+
+
+def test_periods_from_arrays_not_a_time() -> None:
+    with pytest.raises(ValueError):
+        timezone_tools.periods_from_arrays(
+            np.array(["2024-01-01", "NaT"], dtype="datetime64[D]"),
+            np.array(["2024-01-02", "2024-01-05"], dtype="datetime64[D]"),
+        )
+    with pytest.raises(ValueError):
+        timezone_tools.periods_from_arrays(
+            np.array(["2024-01-01"], dtype="datetime64[D]"),
+            np.array(["NaT"], dtype="datetime64[D]"),
+        )
@@ -0,0 +1,125 @@
+import datetime
+import zoneinfo
+
+import pytest
+
+from timezone_tools import find_gaps, merge_intervals
+
+_PARIS = zoneinfo.ZoneInfo("Europe/Paris")
+
+
+def _hours(
+    start: int, end: int
+) -> tuple[datetime.datetime, datetime.datetime]:
+    """Get an interval between two hours on the same day, in Paris."""
+    return (
+        datetime.datetime(2024, 7, 9, start, tzinfo=_PARIS),
+        datetime.datetime(2024, 7, 9, end, tzinfo=_PARIS),
+    )
+
+
+def test_merge_intervals() -> None:
+    assert merge_intervals(
+        (
+            _hours(10, 12),
+            _hours(1, 3),
+            _hours(2, 4),  # overlaps
+            _hours(4, 5),  # touches
+            _hours(11, 11),  # empty
+            _hours(6, 9),
+            _hours(7, 8),  # contained
+        )
+    ) == (_hours(1, 5), _hours(6, 9), _hours(10, 12))
+
+
+def test_merge_intervals_different_timezones() -> None:
+    utc = datetime.timezone.utc
+
+    assert merge_intervals(
+        (
+            _hours(10, 12),
+            # 12:00 to 14:00 in Paris (UTC+2)
+            (
+                datetime.datetime(2024, 7, 9, 10, tzinfo=utc),
+                datetime.datetime(2024, 7, 9, 12, tzinfo=utc),
+            ),
+        )
+    ) == (
+        (
+            datetime.datetime(2024, 7, 9, 10, tzinfo=_PARIS),
+            datetime.datetime(2024, 7, 9, 12, tzinfo=utc),
+        ),
+    )
+
+
+def test_merge_intervals_empty() -> None:
+    assert merge_intervals(()) == ()
+    assert merge_intervals((_hours(1, 1),)) == ()
+
+
+def test_find_gaps() -> None:
+    assert find_gaps(
+        (_hours(10, 12), _hours(1, 3), _hours(2, 4), _hours(4, 5))
+    ) == (_hours(5, 10),)
+    assert find_gaps((_hours(1, 3),)) == ()
+
+
+def test_merge_intervals_invalid_interval() -> None:
+    """Check that each interval must not end before it starts."""
+    with pytest.raises(ValueError):
+        merge_intervals((_hours(3, 1),))
+    with pytest.raises(ValueError):
+        find_gaps((_hours(1, 3), _hours(3, 1)))
+
+
+def test_merge_intervals_requires_aware_datetimes() -> None:
+    with pytest.raises(ValueError):
+        merge_intervals(
+            (
+                (
+                    datetime.datetime(2024, 7, 9, 1),
+                    datetime.datetime(2024, 7, 9, 2),
+                ),
+            )
+        )
+
+
+def _utc(
+    intervals: tuple[tuple[datetime.datetime, datetime.datetime], ...],
+) -> list[tuple[datetime.datetime, datetime.datetime]]:
+    """Get intervals in UTC, so they compare by moment, not wall time."""
+    utc = datetime.timezone.utc
+    return [
+        (start.astimezone(utc), end.astimezone(utc))
+        for start, end in intervals
+    ]
+
+
+def test_merge_intervals_backward_dst_change() -> None:
+    """Check that intervals are compared by moment, not by wall time.
+
+    In Paris, 02:00 to 03:00 happens twice on 27th October 2024.
+    """
+    before = datetime.datetime(2024, 10, 27, 1, 30, tzinfo=_PARIS)
+    first_half_past_two = datetime.datetime(2024, 10, 27, 2, 30, tzinfo=_PARIS)
+    second_two = datetime.datetime(2024, 10, 27, 2, 00, fold=1, tzinfo=_PARIS)
+    second_half_past_two = datetime.datetime(
+        2024, 10, 27, 2, 30, fold=1, tzinfo=_PARIS
+    )
+    intervals = (
+        (before, first_half_past_two),
+        (second_two, second_half_past_two),
+    )
+
+    merged = merge_intervals(intervals)
+    assert _utc(merged) == _utc(intervals)
+    assert merged[1][0] is second_two
+    gaps = find_gaps(intervals)
+    assert _utc(gaps) == _utc(((first_half_past_two, second_two),))
+
+    # 40 minutes long, though the end is earlier on the wall clock
+    interval = (
+        first_half_past_two,
+        datetime.datetime(2024, 10, 27, 2, 10, fold=1, tzinfo=_PARIS),
+    )
+    assert merge_intervals((interval,)) == (interval,)
@@ -0,0 +1,193 @@
+import asyncio
+import datetime
+import zoneinfo
+
+import pytest
+import time_machine
+
+from timezone_tools import Clock, MidnightNotifier, TimezoneConverter
+
+_UTC = zoneinfo.ZoneInfo("UTC")
+
+
+def test_run_pending() -> None:
+    notifier = MidnightNotifier()
+    calls: list[tuple[str, datetime.date]] = []
+
+    with time_machine.travel(
+        datetime.datetime(2024, 7, 9, 12, tzinfo=_UTC), tick=False
+    ) as traveller:
+        for timezone in ("Europe/Paris", "Asia/Kolkata", "America/New_York"):
+            notifier.subscribe(timezone, lambda *args: calls.append(args))
+
+        assert notifier.next_midnight() == datetime.datetime(
+            2024, 7, 10, tzinfo=zoneinfo.ZoneInfo("Asia/Kolkata")
+        )
+        # 18:30 UTC
+        assert notifier.run_pending() == 6.5 * 60 * 60
+        assert calls == []
+
+        traveller.move_to(datetime.datetime(2024, 7, 9, 22, tzinfo=_UTC))
+        assert notifier.run_pending() == 6 * 60 * 60
+        assert calls == [
+            ("Asia/Kolkata", datetime.date(2024, 7, 10)),
+            ("Europe/Paris", datetime.date(2024, 7, 10)),
+        ]
+
+        traveller.move_to(datetime.datetime(2024, 7, 10, 4, tzinfo=_UTC))
+        assert notifier.run_pending() == 14.5 * 60 * 60
+        assert calls[2:] == [("America/New_York", datetime.date(2024, 7, 10))]
+
+
+@pytest.mark.parametrize(
+    "timezone",
+    (
+        "Europe/Paris",
+        # DST changes at midnight
+        "America/Havana",
+        "America/Sao_Paulo",
+    ),
+)
+def test_run_pending_across_dst_changes(timezone: str) -> None:
+    notifier = MidnightNotifier()
+    clock = Clock(timezone)
+    converter = TimezoneConverter(timezone)
+    transitions = converter.transitions_between(
+        converter.datetime(2018, 1, 1), converter.datetime(2020, 1, 1)
+    )
+
+    calls: list[datetime.date] = []
+    for transition in transitions:
+        start = transition.when - datetime.timedelta(days=2)
+        with time_machine.travel(start, tick=False) as traveller:
+            calls.clear()
+            start_date = clock.today()
+            subscription = notifier.subscribe(
+                timezone, lambda _, date: calls.append(date)
+            )
+            for _ in range(4 * 24 * 4):
+                traveller.shift(datetime.timedelta(minutes=15))
+                notifier.run_pending()
+                # each day is notified as soon as it starts
+                assert calls[-1:] in ([], [clock.today()])
+            assert calls == [
+                start_date + datetime.timedelta(days=days)
+                for days in range(1, len(calls) + 1)
+            ]
+            assert calls[-1] == clock.today()
+            notifier.unsubscribe(subscription)
+
+
+def test_run_pending_missed_midnights() -> None:
+    notifier = MidnightNotifier()
+    calls: list[datetime.date] = []
+
+    with time_machine.travel(
+        datetime.datetime(2024, 7, 9, 12, tzinfo=_UTC), tick=False
+    ) as traveller:
+        notifier.subscribe("Europe/Paris", lambda _, date: calls.append(date))
+
+        traveller.shift(datetime.timedelta(days=3))
+        notifier.run_pending()
+
+    assert calls == [
+        datetime.date(2024, 7, 10),
+        datetime.date(2024, 7, 11),
+        datetime.date(2024, 7, 12),
+    ]
+
+
+def test_unsubscribe() -> None:
+    notifier = MidnightNotifier()
+    calls: list[str] = []
+
+    def unsubscribe_others(timezone: str, date: datetime.date) -> None:
+        notifier.unsubscribe(second)
+        notifier.unsubscribe(third)
+
+    with time_machine.travel(
+        datetime.datetime(2024, 7, 9, 12, tzinfo=_UTC), tick=False
+    ) as traveller:
+        first = notifier.subscribe(
+            "Europe/Paris", lambda *_: calls.append("1")
+        )
+        second = notifier.subscribe("Europe/Paris", unsubscribe_others)
+        third = notifier.subscribe(
+            "Europe/Paris", lambda *_: calls.append("3")
+        )
+
+        traveller.shift(datetime.timedelta(days=1))
+        notifier.run_pending()
+        traveller.shift(datetime.timedelta(days=1))
+        notifier.run_pending()
+
+        assert calls == ["1", "1"]
+        with pytest.raises(ValueError):
+            notifier.unsubscribe(third)
+
+        # subscribing again after every subscription was removed
+        notifier.unsubscribe(first)
+        assert notifier.run_pending() is None
+        assert notifier.next_midnight() is None
+        notifier.subscribe("Europe/Paris", lambda *_: calls.append("4"))
+
+        traveller.shift(datetime.timedelta(days=1))
+        notifier.run_pending()
+
+    assert calls == ["1", "1", "4"]
+
+
+def test_subscribe_unknown_timezone() -> None:
+    with pytest.raises(zoneinfo.ZoneInfoNotFoundError):
+        MidnightNotifier().subscribe("Europe/Nowhere", print)
+
+
+def test_run() -> None:
+    notifier = MidnightNotifier()
+    calls: list[datetime.date] = []
+
+    def callback(timezone: str, date: datetime.date) -> None:
+        calls.append(date)
+        notifier.unsubscribe(subscription)
+
+    # shortly before midnight in Paris
+    with time_machine.travel(
+        datetime.datetime(2024, 7, 9, 21, 59, 59, 950_000, tzinfo=_UTC)
+    ):
+        subscription = notifier.subscribe("Europe/Paris", callback)
+        notifier.run()
+
+    assert calls == [datetime.date(2024, 7, 10)]
+
+
+def test_run_async() -> None:
+    notifier = MidnightNotifier()
+    calls: list[tuple[str, datetime.date]] = []
+
+    def callback(timezone: str, date: datetime.date) -> None:
+        calls.append((timezone, date))
+
+    async def async_callback(timezone: str, date: datetime.date) -> None:
+        await asyncio.sleep(0)
+        calls.append((timezone, date))
+        for subscription in subscriptions:
+            notifier.unsubscribe(subscription)
+
+    async def main() -> None:
+        task = asyncio.create_task(notifier.run_async())
+        await asyncio.sleep(0.01)
+        # This must wake the notifier, which is waiting for Paris.
+        subscriptions.append(notifier.subscribe("Asia/Kolkata", callback))
+        subscriptions.append(
+            notifier.subscribe("Asia/Kolkata", async_callback)
+        )
+        await asyncio.wait_for(task, timeout=1)
+
+    # shortly before midnight in Kolkata, and 3.5 hours before Paris
+    with time_machine.travel(
+        datetime.datetime(2024, 7, 9, 18, 29, 59, 950_000, tzinfo=_UTC)
+    ):
+        subscriptions = [notifier.subscribe("Europe/Paris", print)]
+        asyncio.run(main())
+
+    assert calls == [("Asia/Kolkata", datetime.date(2024, 7, 10))] * 2
@@ -0,0 +1,402 @@
+import datetime
+import io
+import pathlib
+import struct
+import sys
+import zoneinfo
+from collections.abc import Callable, Iterator
+
+import numpy as np
+import pytest
+
+from timezone_tools import TimezoneConverter, _transitions
+
+# Note [Synthetic timezones]
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Real timezones don't use every part of the TZif format, so some of these
+# tests write their own TZif files where `zoneinfo` will find them: in a
+# temporary TZPATH, or in a `tzdata` package. `zoneinfo` caches timezones by
+# key, so each test uses its own keys, and they are removed from the cache
+# afterwards.
+
+_UTC = datetime.timezone.utc
+
+
+def _tzif(
+    types: tuple[tuple[int, bool], ...],
+    transitions: tuple[tuple[datetime.datetime, int], ...] = (),
+    footer: str | None = None,
+) -> bytes:
+    """Make a TZif file: version 1 if there is no footer, otherwise 2.
+
+    The types are each an offset from UTC (in seconds) and whether it is DST;
+    the transitions are each a moment and the index of the type after it.
+    """
+
+    def data(version: bytes, time_format: str) -> bytes:
+        header = struct.pack(
+            ">4sc15x6l",
+            b"TZif",
+            version,
+            0,
+            0,
+            0,
+            len(transitions),
+            len(types),
+            4,
+        )
+        return b"".join(
+            [
+                header,
+                *(
+                    struct.pack(time_format, int(when.timestamp()))
+                    for when, _ in transitions
+                ),
+                bytes(index for _, index in transitions),
+                *(
+                    struct.pack(">lbB", offset, is_dst, 0)
+                    for offset, is_dst in types
+                ),
+                b"TST\x00",
+            ]
+        )
+
+    if footer is None:
+        return data(b"\x00", ">l")
+    return data(b"2", ">l") + data(b"2", ">q") + f"\n{footer}\n".encode()
+
+
+AddZone = Callable[[str, bytes], None]
+
+
+@pytest.fixture
+def add_zone(tmp_path: pathlib.Path) -> Iterator[AddZone]:
+    """Add timezones to a temporary TZPATH.
+
+    See Note [Synthetic timezones].
+    """
+    keys: list[str] = []
+
+    def add(key: str, tzif: bytes) -> None:
+        path = tmp_path / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(tzif)
+        keys.append(key)
+
+    original = zoneinfo.TZPATH
+    zoneinfo.reset_tzpath([str(tmp_path)])
+    yield add
+    zoneinfo.reset_tzpath(original)
+    zoneinfo.ZoneInfo.clear_cache(only_keys=keys)
+
+
+@pytest.fixture
+def add_tzdata_zone(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[AddZone]:
+    """Add timezones to a `tzdata` package, but not the TZPATH.
+
+    See Note [Synthetic timezones].
+    """
+    keys: list[str] = []
+
+    def add(key: str, tzif: bytes) -> None:
+        *packages, resource = key.split("/")
+        path = tmp_path / "tzdata" / "zoneinfo"
+        for package in packages:
+            path /= package
+            path.mkdir(parents=True, exist_ok=True)
+            (path / "__init__.py").touch()
+        (path / resource).write_bytes(tzif)
+        keys.append(key)
+
+    for package in ("tzdata", "tzdata/zoneinfo"):
+        (tmp_path / package).mkdir()
+        (tmp_path / package / "__init__.py").touch()
+
+    def is_tzdata(name: str) -> bool:
+        return name == "tzdata" or name.startswith("tzdata.")
+
+    # Hide any real `tzdata` package while this one is in use.
+    for name in list(sys.modules):
+        if is_tzdata(name):
+            monkeypatch.delitem(sys.modules, name)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    original = zoneinfo.TZPATH
+    zoneinfo.reset_tzpath([str(tmp_path)])
+    yield add
+    zoneinfo.reset_tzpath(original)
+    zoneinfo.ZoneInfo.clear_cache(only_keys=keys)
+    for name in list(sys.modules):
+        if is_tzdata(name):
+            del sys.modules[name]
+
+
+def _utc_transitions(
+    converter: TimezoneConverter, year: int
+) -> list[tuple[datetime.datetime, datetime.timedelta]]:
+    transitions = converter.transitions_between(
+        datetime.datetime(year, 1, 1, tzinfo=_UTC),
+        datetime.datetime(year + 1, 1, 1, tzinfo=_UTC),
+    )
+    for transition in transitions:
+        # `zoneinfo` agrees
+        before = transition.when.astimezone(_UTC) - datetime.timedelta(
+            seconds=1
+        )
+        assert converter.localize(before).utcoffset() == (
+            transition.offset_before
+        )
+        assert transition.when.utcoffset() == transition.offset_after
+    return [
+        (transition.when.astimezone(_UTC), transition.offset_after)
+        for transition in transitions
+    ]
+
+
+def _hours(hours: int) -> datetime.timedelta:
+    return datetime.timedelta(hours=hours)
+
+
+def test_fixed_offset() -> None:
+    converter = TimezoneConverter("Etc/GMT-14")
+
+    assert _utc_transitions(converter, 2024) == []
+    assert converter.quantize(
+        datetime.datetime(2024, 7, 9, 12, 10, tzinfo=_UTC),
+        _hours(1),
+        converter.ROUND_DOWN,
+    ) == converter.datetime(2024, 7, 10, 2)
+    assert (
+        converter.quantize_many(
+            np.array(["2024-07-09T12:10"], dtype="datetime64[ns]"),
+            _hours(1),
+            converter.ROUND_DOWN,
+        ).tolist()
+        == np.array(["2024-07-09T12:00"], dtype="datetime64[ns]").tolist()
+    )
+
+
+def test_no_rule(add_zone: AddZone) -> None:
+    # The last offset carries on forever.
+    add_zone(
+        "Test/NoRule",
+        _tzif(
+            types=((0, False), (3600, False)),
+            transitions=((datetime.datetime(2024, 3, 1, tzinfo=_UTC), 1),),
+            footer="",
+        ),
+    )
+    converter = TimezoneConverter("Test/NoRule")
+
+    assert _utc_transitions(converter, 2024) == [
+        (datetime.datetime(2024, 3, 1, tzinfo=_UTC), _hours(1)),
+    ]
+    assert _utc_transitions(converter, 2150) == []
+
+
+def test_simultaneous_transitions(add_zone: AddZone) -> None:
+    add_zone(
+        "Test/Simultaneous",
+        _tzif(
+            types=((0, False), (3600, True), (7200, False)),
+            transitions=(
+                (datetime.datetime(2024, 3, 1, tzinfo=_UTC), 1),
+                # Only the last of these counts.
+                (datetime.datetime(2024, 3, 1, tzinfo=_UTC), 2),
+                (datetime.datetime(2024, 6, 1, tzinfo=_UTC), 0),
+            ),
+        ),
+    )
+    converter = TimezoneConverter("Test/Simultaneous")
+
+    assert _utc_transitions(converter, 2024) == [
+        (datetime.datetime(2024, 3, 1, tzinfo=_UTC), _hours(2)),
+        (datetime.datetime(2024, 6, 1, tzinfo=_UTC), _hours(0)),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("tz_string", "year", "expected_changes"),
+    (
+        pytest.param(
+            # ignoring February 29, at 02:00 by default
+            "XST-1XDT,J60,J300/3",
+            2023,
+            (
+                datetime.datetime(2023, 3, 1, 1),
+                datetime.datetime(2023, 10, 27, 1),
+            ),
+            id="Julian day",
+        ),
+        pytest.param(
+            "XST-1XDT,J60,J300/3",
+            2024,
+            (
+                datetime.datetime(2024, 3, 1, 1),
+                datetime.datetime(2024, 10, 27, 1),
+            ),
+            id="Julian day in leap year",
+        ),
+        pytest.param(
+            # counted from one, as `zoneinfo` does
+            "XST-1XDT,59,299/3",
+            2023,
+            (
+                datetime.datetime(2023, 2, 28, 1),
+                datetime.datetime(2023, 10, 26, 1),
+            ),
+            id="day of year",
+        ),
+        pytest.param(
+            "XST-1XDT,59,299/3",
+            2024,
+            (
+                datetime.datetime(2024, 2, 28, 1),
+                datetime.datetime(2024, 10, 25, 1),
+            ),
+            id="day of leap year",
+        ),
+    ),
+)
+def test_rule_days_of_year(
+    add_zone: AddZone,
+    tz_string: str,
+    year: int,
+    expected_changes: tuple[datetime.datetime, datetime.datetime],
+) -> None:
+    add_zone(
+        "Test/DaysOfYear", _tzif(types=((3600, False),), footer=tz_string)
+    )
+    converter = TimezoneConverter("Test/DaysOfYear")
+    start, end = expected_changes
+
+    assert _utc_transitions(converter, year) == [
+        (start.replace(tzinfo=_UTC), _hours(2)),
+        (end.replace(tzinfo=_UTC), _hours(1)),
+    ]
+
+
+# This is how `zic` writes a rule for DST all year. By `zoneinfo`'s count of
+# days, each year's DST starts before the previous year's ends.
+_PERMANENT_DST = _tzif(
+    types=((-18000, False), (-14400, True)),
+    transitions=((datetime.datetime(2000, 4, 2, 7, tzinfo=_UTC), 1),),
+    footer="EST5EDT,0/0,J365/25",
+)
+
+
+def test_permanent_dst(add_zone: AddZone) -> None:
+    add_zone("Test/PermanentDST", _PERMANENT_DST)
+    converter = TimezoneConverter("Test/PermanentDST")
+    table = _transitions.get_transition_table(converter.tzinfo)
+    timestamps = np.arange(
+        int(datetime.datetime(2001, 1, 1, tzinfo=_UTC).timestamp()),
+        int(datetime.datetime(2100, 1, 1, tzinfo=_UTC).timestamp()),
+        # a prime number of seconds, to sample every time of day
+        1_600_033,
+    )
+
+    assert table.utcoffsets(timestamps).tolist() == [
+        _transitions._seconds(
+            datetime.datetime.fromtimestamp(
+                timestamp, converter.tzinfo
+            ).utcoffset()
+        )
+        for timestamp in timestamps.tolist()
+    ]
+    assert _utc_transitions(converter, 2050) == []
+    moment = datetime.datetime(2050, 6, 1, 12, 30, tzinfo=_UTC)
+    assert converter.quantize(
+        moment, datetime.timedelta(days=1), converter.ROUND_DOWN
+    ) == datetime.datetime(2050, 6, 1, 4, tzinfo=_UTC)
+    assert (
+        converter.quantize_many(
+            np.array(["2050-06-01T12:30"], dtype="datetime64[ns]"),
+            datetime.timedelta(days=1),
+            converter.ROUND_DOWN,
+        ).tolist()
+        == np.array(["2050-06-01T04:00"], dtype="datetime64[ns]").tolist()
+    )
+
+
+def test_permanent_dst_after_rule_horizon(add_zone: AddZone) -> None:
+    add_zone("Test/PermanentDST", _PERMANENT_DST)
+    converter = TimezoneConverter("Test/PermanentDST")
+    table = _transitions.get_transition_table(converter.tzinfo)
+
+    assert (
+        list(
+            table.between(
+                int(datetime.datetime(2090, 1, 1, tzinfo=_UTC).timestamp()),
+                int(datetime.datetime(2200, 1, 1, tzinfo=_UTC).timestamp()),
+            )
+        )
+        == []
+    )
+    assert _utc_transitions(converter, 2150) == []
+    _, offsets = table.wall_changes(
+        int(datetime.datetime(2200, 1, 1, tzinfo=_UTC).timestamp())
+    )
+    assert offsets.tolist() == [-14400]
+    assert (
+        converter.quantize_many(
+            np.array(["2150-06-01T12:30"], dtype="datetime64[ns]"),
+            datetime.timedelta(days=1),
+            converter.ROUND_DOWN,
+        ).tolist()
+        == np.array(["2150-06-01T04:00"], dtype="datetime64[ns]").tolist()
+    )
+
+
+def test_tzdata_package(add_tzdata_zone: AddZone) -> None:
+    add_tzdata_zone(
+        "Test/Packaged",
+        _tzif(types=((3600, False),), footer="XST-1XDT,M3.5.0,M10.5.0/3"),
+    )
+    converter = TimezoneConverter("Test/Packaged")
+
+    assert _utc_transitions(converter, 2024) == [
+        (datetime.datetime(2024, 3, 31, 1, tzinfo=_UTC), _hours(2)),
+        (datetime.datetime(2024, 10, 27, 1, tzinfo=_UTC), _hours(1)),
+    ]
+
+
+def test_rule_until_the_last_year() -> None:
+    paris_time = TimezoneConverter("Europe/Paris")
+
+    transitions = paris_time.transitions_between(
+        datetime.datetime(datetime.MAXYEAR, 1, 1, tzinfo=_UTC),
+        datetime.datetime.max.replace(tzinfo=_UTC),
+    )
+
+    assert [transition.when for transition in transitions] == [
+        paris_time.datetime(9999, 3, 28, 3),
+        paris_time.datetime(9999, 10, 31, 2, fold=1),
+    ]
+
+
+# These are rejected by `zoneinfo` before we see them, so they are tested
+# directly.
+
+
+def test_invalid_tzif_file() -> None:
+    tzif = b"TZxx" + _tzif(types=((0, False),))[4:]
+
+    with pytest.raises(ValueError, match="invalid TZif file"):
+        _transitions._read_tzif(io.BytesIO(tzif))
+
+
+@pytest.mark.parametrize(
+    ("tz_string", "message"),
+    (
+        ("1XST", "invalid TZ string"),
+        ("XST-1XDT,M3.5.0", "invalid TZ string"),
+        ("XST-1XDT", "TZ string has no DST rule"),
+        ("XST-1XDT,M3.5.0,Q10", "invalid TZ string rule"),
+    ),
+)
+def test_invalid_tz_string(tz_string: str, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        _transitions._parse_tz_string(tz_string)